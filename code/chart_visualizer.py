@@ -1,19 +1,69 @@
 import matplotlib.pyplot as plt
-import matplotlib.animation as animation
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.widgets import Cursor
+from matplotlib.patches import PathPatch
+from matplotlib.path import Path
+from matplotlib.backend_bases import TimerBase
 from matplotlib.dates import DateFormatter, HourLocator
+import matplotlib.dates as mdates
+import matplotlib.colors as mcolors
 import tkinter as tk
 from tkinter import ttk
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, time as dt_time
 import threading
-import queue
+import time
+import re
+import functools
 import logging
 from collections import deque
 from trade_models import PositionType, OptionType
 
+# Column layout of the per-instrument candle arrays (matplotlib date, OHLCV)
+OHLC_DTYPE = np.dtype([('ts_mpl', 'f8'), ('o', 'f8'), ('h', 'f8'), ('l', 'f8'), ('c', 'f8'), ('v', 'f8')])
+
+# Candle body colors as RGBA rows indexed by "bullish" (0 = down, 1 = up)
+_BODY_FACE_RGBA = mcolors.to_rgba_array(['red', 'green'])
+_BODY_EDGE_RGBA = mcolors.to_rgba_array(['darkred', 'darkgreen'])
+
+# Path codes of one wick segment and one (closed) body rectangle within a compound candle path
+_WICK_CODES = np.array([Path.MOVETO, Path.LINETO], dtype=Path.code_type)
+_BODY_CODES = np.array([Path.MOVETO, Path.LINETO, Path.LINETO, Path.LINETO, Path.CLOSEPOLY], dtype=Path.code_type)
+
+# Datawarehouse fetches stop for the day from this time
+_MARKET_CLOSE_TIME = dt_time(15, 45)  # 3:45 PM
+
+# Keys that mark an Upstox dict tick as a complete OHLC candle
+_OHLC_KEYS = frozenset(('open', 'high', 'low', 'close'))
+
+# Fallback patterns for reading price / volume out of a Protobuf message's text form,
+# compiled once and tried in priority order
+_UPSTOX_PRICE_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'ltp[:\s=]*(\d+\.?\d*)',
+    r'last_price[:\s=]*(\d+\.?\d*)',
+    r'price[:\s=]*(\d+\.?\d*)',
+    r'close[:\s=]*(\d+\.?\d*)',
+    r'open[:\s=]*(\d+\.?\d*)',
+    r'high[:\s=]*(\d+\.?\d*)',
+    r'low[:\s=]*(\d+\.?\d*)',
+    r'"last_price":\s*(\d+\.?\d*)',
+    r'last_price:\s*(\d+\.?\d*)',
+    r'ltp:\s*(\d+\.?\d*)',
+    r'(\d{4,6}\.?\d*)'
+))
+_UPSTOX_VOLUME_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'volume[:\s=]*(\d+)',
+    r'vol[:\s=]*(\d+)',
+    r'"volume":\s*(\d+)'
+))
+
+@functools.lru_cache(maxsize=1024)
+def _format_candle_time(timestamp):
+    """Tooltip time text of a candle - the same few hundred candles are hovered over and over"""
+    return timestamp.strftime("%Y-%m-%d %H:%M:%S")
+
+
 class LiveChartVisualizer:
     def __init__(self, title="Live Market Data", max_candles=100, candle_interval_minutes=5, main_app=None):
         self.title = title
@@ -23,19 +73,25 @@ class LiveChartVisualizer:
         self._main_app = main_app
         
         # Data storage
-        self.data_queue = queue.Queue()
+        # Queued ticks are (instrument, timestamp, price, volume) tuples; single consumer
+        # (_animate), append/popleft are atomic
+        self.data_queue = deque()
         self.candle_data = {}  # {instrument: deque of OHLCV data}
+        self.ohlc_arr = {}  # {instrument: preallocated OHLC_DTYPE buffer mirroring candle_data}
+        self._ohlc_start = {}  # {instrument: first live row in ohlc_arr}
+        self._ohlc_len = {}  # {instrument: number of live rows in ohlc_arr}
+        self._ohlc_dropped = {}  # {instrument: oldest candles evicted since the last draw}
+        self._ohlc_dirty_from = {}  # {instrument: first row changed since the last draw, None if drawn}
         self.current_prices = {}  # {instrument: current price}
         self.last_update_time = None  # Track last data update time
         self.historical_data = {}  # Store full historical data for scrolling
         self.current_view_start = 0  # Start index for current view
         self.view_size = 75  # Number of candles to display (one trading day)
-        self.has_stored_data = {}  # Track if we have stored intraday data for each instrument
+        self._frozen_instruments = set()  # Instruments showing stored intraday data - live ticks are ignored
         
         # Tooltip functionality
         self.tooltip = None
         self.tooltip_annotation = None
-        self.candlestick_patches = {}  # Store candlestick patches for hover detection
         
         # Crosshair functionality
         self.crosshair_vline = None  # Vertical crosshair line
@@ -44,6 +100,41 @@ class LiveChartVisualizer:
         # Hover labels functionality
         self.hover_labels = {}  # Store hover labels for OHLC data
         self.time_label = None  # Time label at bottom
+        self._tooltip_cache = (None, None)  # (candle key, (time text, diff, diff symbol)) last rendered
+        
+        # Motion event coalescing
+        self.hover_interval_ms = 33
+        self._hover_timer = None
+        self._hover_pending = False
+        self._hover_event = None  # Latest motion event not processed yet
+        self._hover_state = None  # ((axes, xdata, ydata), hover generation) of the last processed event
+        self._last_hit = None  # (hover lookup, row, result) of the last candle the cursor was inside
+        
+        # Persistent chart artists - updated in place and blitted each frame
+        self._wick_patch = None  # One compound path with all wick segments
+        self._body_patches = None  # (down, up) compound paths with the candle bodies of each color
+        self._price_line = None  # Latest price horizontal line
+        self._price_text = None  # Latest price label on the right edge
+        self._no_data_text = None  # "Waiting for market data" message
+        self._candle_geometry = {}  # {instrument: per-candle geometry arrays, see _candle_geometry_rows}
+        self._hover_index = {}  # {instrument: (sorted candle x, candle dicts, OHLC rows)} of the drawn candles
+        self._hover_lookup = None  # All instruments merged into one x-sorted table, see _build_hover_lookup
+        self._hover_generation = 0  # Bumped whenever the hover candles change
+        self._background = None  # Static figure pixels captured on the last full draw
+        self._background_bounds = None  # Figure size (pixels) the background was captured at
+        self._layout_state = None  # (xlim, ylim, title) of the last full draw
+        self._x_axis_range = None  # (first, last) candle time the x-axis was last laid out for
+        self._minute_locator = mdates.MinuteLocator(interval=15)
+        self._hour_locator = mdates.HourLocator(interval=1)
+        # Times are displayed as stored (data is already in local time, mpl dates carry no offset)
+        self._time_formatter = mdates.DateFormatter('%H:%M')
+        self._needs_full_draw = True
+        self._pending_redraw = False  # New data not drawn yet (e.g. window minimized)
+        
+        # Full-canvas redraw coalescing - callers set _dirty, one draw_idle per interval
+        self.redraw_interval_ms = 33
+        self._redraw_timer = None
+        self._dirty = False
         
         # Chart setup - Single chart for price only
         try:
@@ -59,9 +150,15 @@ class LiveChartVisualizer:
             self.price_ax.set_xlabel("")  # Empty xlabel
             self.price_ax.grid(True, alpha=0.3)
             
+            # Fixed margins leave room for the rotated time labels and the combined title - set
+            # once here (and on resize) rather than solved per redraw
+            self.fig.subplots_adjust(bottom=0.15, left=0.1, right=0.95, top=0.88)
+            
             # No volume chart needed
             self.volume_ax = None
             
+            self._init_chart_artists()
+            
             # Tooltips will be setup after chart is ready
             
         except Exception as e:
@@ -70,6 +167,8 @@ class LiveChartVisualizer:
             self.fig = None
             self.price_ax = None
             self.volume_ax = None
+            # Nothing to draw on - bind a no-op once instead of checking the axes on every update
+            self._draw_charts = lambda: None
         
         # Chart elements
         self.candle_lines = {}
@@ -77,7 +176,8 @@ class LiveChartVisualizer:
         self.price_lines = {}
         
         # Animation
-        self.ani = None
+        self.frame_timer = None  # Canvas timer driving _animate
+        self.frame_interval_ms = 500
         self.is_running = False
         
         # Threading
@@ -86,25 +186,52 @@ class LiveChartVisualizer:
         
         # Live data callback for payoff chart updates
         self.live_data_callback = None
+        self._last_price_line_value = None  # Last price drawn by _update_live_price_line_only
+        
+        # Scroll logging - key repeats are logged at most once per interval
+        self.scroll_log_interval_s = 0.1
+        self._last_scroll_log = float('-inf')
         
         # Grid 2 update timer for live data
-        self.last_grid2_update = 0  # Timestamp of last Grid 2 update
+        self.last_grid2_update = float('-inf')  # time.monotonic() of last Grid 2 update
         self.grid2_update_interval = 5.0  # Update Grid 2 every 5 seconds
-        self.pending_live_data = {}  # Store pending live data updates
+        # Pending live data updates - one scalar dict per field, so storing a tick allocates nothing
+        self.pending_price = {}  # {instrument: latest price}
+        self.pending_volume = {}  # {instrument: latest volume}
+        self.pending_timestamp = {}  # {instrument: time.monotonic() of the latest update}
         
         # Datawarehouse timer for fetching live data
-        self.datawarehouse_timer = None  # Timer for fetching data from datawarehouse
+        self.datawarehouse_thread = None  # Long-lived thread fetching data from datawarehouse
+        self._datawarehouse_stop = None  # Event that ends the current datawarehouse thread
         self.datawarehouse_update_interval = 5.0  # Fetch from datawarehouse every 5 seconds
         self.datawarehouse = None  # Reference to datawarehouse instance
         
-    def add_instrument(self, instrument_key, instrument_name=None):
-        """Add a new instrument to track"""
+        # Tick dispatch - handler resolved once per instrument instead of per tick
+        self._tick_handlers = {
+            'kite': self._process_kite_list,
+            'upstox_ohlc': self._add_complete_candle,
+            'upstox_tick': self._process_upstox_live_tick,
+        }
+        self._handler = {}  # {instrument: bound tick handler}
+        self._message_fields = {}  # {message class: (price attribute or None, volume attribute or None)}
+        
+    def add_instrument(self, instrument_key, instrument_name=None, tick_format=None):
+        """Add a new instrument to track
+        
+        tick_format: 'kite', 'upstox_ohlc' or 'upstox_tick'. When omitted the
+        handler is resolved from the first tick received.
+        """
         if instrument_name is None:
             instrument_name = instrument_key
             
-        self.candle_data[instrument_key] = deque(maxlen=self.max_candles)
+        self._init_candle_store(instrument_key)
         self.current_prices[instrument_key] = 0.0
         
+        if tick_format is not None:
+            if tick_format not in self._tick_handlers:
+                raise ValueError(f"Unknown tick format '{tick_format}' for {instrument_key}")
+            self._handler[instrument_key] = self._tick_handlers[tick_format]
+        
         # Don't initialize with empty data - let the first tick create the first candle
         
         self.logger.info(f"Added instrument: {instrument_name} ({instrument_key})")
@@ -120,28 +247,36 @@ class LiveChartVisualizer:
         self.logger.info("Datawarehouse reference set for chart visualizer")
     
     def start_datawarehouse_timer(self):
-        """Start timer to fetch data from datawarehouse every 5 seconds"""
+        """Start the thread that fetches data from datawarehouse every 5 seconds"""
         try:
-            if self.datawarehouse_timer:
-                self.datawarehouse_timer.cancel()
+            if self.datawarehouse_thread and self.datawarehouse_thread.is_alive():
+                return
             
-            self.datawarehouse_timer = threading.Timer(self.datawarehouse_update_interval, self._fetch_from_datawarehouse)
-            self.datawarehouse_timer.daemon = True
-            self.datawarehouse_timer.start()
+            # Each thread gets its own event, so a stopped thread can never be revived by a restart
+            self._datawarehouse_stop = threading.Event()
+            self.datawarehouse_thread = threading.Thread(target=self._datawarehouse_loop,
+                                                         args=(self._datawarehouse_stop,),
+                                                         name="DatawarehouseFetch", daemon=True)
+            self.datawarehouse_thread.start()
             
         except Exception as e:
             self.logger.error(f"Error starting datawarehouse timer: {e}")
     
     def stop_datawarehouse_timer(self):
-        """Stop the datawarehouse timer"""
+        """Stop the datawarehouse thread (it exits at its next wake-up, without a join)"""
         try:
-            if self.datawarehouse_timer:
-                self.datawarehouse_timer.cancel()
-                self.datawarehouse_timer = None
+            if self.datawarehouse_thread:
+                self._datawarehouse_stop.set()
+                self.datawarehouse_thread = None
                 self.logger.info("Stopped datawarehouse timer")
         except Exception as e:
             self.logger.error(f"Error stopping datawarehouse timer: {e}")
     
+    def _datawarehouse_loop(self, stop):
+        """Fetch from datawarehouse every datawarehouse_update_interval until stop is set"""
+        while not stop.wait(self.datawarehouse_update_interval):
+            self._fetch_from_datawarehouse()
+    
     def stop_all_timers(self):
         """Stop all timers in the chart visualizer"""
         try:
@@ -165,17 +300,15 @@ class LiveChartVisualizer:
         """Fetch latest data from datawarehouse and update only chart 2 (payoff chart)"""
         try:
             # Check if it's after market close (3:45 PM)
-            from datetime import datetime, time as dt_time
             current_time = datetime.now().time()
-            market_close_time = dt_time(15, 45)  # 3:45 PM
-            
-            if current_time >= market_close_time:
+            if current_time >= _MARKET_CLOSE_TIME:
                 self.logger.info(f"Market close detected at {current_time.strftime('%H:%M:%S')} - stopping datawarehouse timer")
                 self.stop_datawarehouse_timer()
                 return
             
             if not self.datawarehouse:
                 self.logger.warning("No datawarehouse reference available")
+                self.stop_datawarehouse_timer()
                 return
             
             # Get all instruments we're tracking
@@ -192,42 +325,38 @@ class LiveChartVisualizer:
                         if self.live_data_callback:
                             self._call_live_data_callback_with_interval(instrument_key, latest_price, 0)
                         
-                        self.logger.debug(f"Fetched from datawarehouse for chart 2: {instrument_key} = {latest_price}")
+                        self.logger.debug("Fetched from datawarehouse for chart 2: %s = %s", instrument_key, latest_price)
                     
                 except Exception as e:
                     self.logger.error(f"Error fetching data for {instrument_key} from datawarehouse: {e}")
             
-            # Schedule next fetch
-            self.start_datawarehouse_timer()
-            
         except Exception as e:
             self.logger.error(f"Error fetching from datawarehouse: {e}")
-            # Still schedule next fetch even if this one failed
-            self.start_datawarehouse_timer()
     
     def _call_live_data_callback_with_interval(self, instrument_key, price, volume):
         """Call live data callback with 5-second interval control"""
         try:
-            import time
-            current_time = time.time()
+            # Monotonic clock - wall-clock (NTP) jumps must not stall or burst the interval
+            current_time = time.monotonic()
             
             # Store the latest live data
-            self.pending_live_data[instrument_key] = {
-                'price': price,
-                'volume': volume,
-                'timestamp': current_time
-            }
+            self.pending_price[instrument_key] = price
+            self.pending_volume[instrument_key] = volume
+            self.pending_timestamp[instrument_key] = current_time
             
             # Check if it's time to call the callback (every 5 seconds)
             if current_time - self.last_grid2_update >= self.grid2_update_interval:
-                # Call the callback with the latest data
+                # Flush every instrument that ticked since the last update, not just the one
+                # that crossed the interval (the others would otherwise wait for their own tick)
                 if self.live_data_callback:
-                    self.live_data_callback(instrument_key, price, volume)
+                    ticked = [key for key, ts in self.pending_timestamp.items() if ts > self.last_grid2_update]
+                    for key in ticked:
+                        self.live_data_callback(key, self.pending_price[key], self.pending_volume[key])
                 self.last_grid2_update = current_time
             else:
                 # Log that we're storing data for later update
                 remaining_time = self.grid2_update_interval - (current_time - self.last_grid2_update)
-                self.logger.debug(f"Storing live data for {instrument_key}: {price} (Grid 2 update in {remaining_time:.1f}s)")
+                self.logger.debug("Storing live data for %s: %s (Grid 2 update in %.1fs)", instrument_key, price, remaining_time)
                 
         except Exception as e:
             self.logger.error(f"Error calling live data callback with interval: {e}")
@@ -235,47 +364,49 @@ class LiveChartVisualizer:
     def update_data(self, instrument_key, tick_data):
         """Update data for a specific instrument"""
         try:
-            # Skip live data processing if we have stored intraday data
-            if self.has_stored_data.get(instrument_key, False):
-                self.logger.debug(f"Skipping live data update for {instrument_key} - using stored intraday data")
+            # Skip live data processing if we have stored intraday data (the only check on the
+            # tick path - the handlers below are only reached from here)
+            if instrument_key in self._frozen_instruments:
+                self.logger.debug("Skipping live data update for %s - using stored intraday data", instrument_key)
                 return
             
-            # Parse tick data based on broker type
-            if isinstance(tick_data, list):
-                # Kite format
-                for tick in tick_data:
-                    if tick['instrument_token'] == instrument_key:
-                        self._process_kite_tick(instrument_key, tick)
-            elif isinstance(tick_data, dict):
-                # Upstox format or other
-                self._process_upstox_tick(instrument_key, tick_data)
+            handler = self._handler.get(instrument_key)
+            if handler is None:
+                handler = self._resolve_handler(instrument_key, tick_data)
+            handler(instrument_key, tick_data)
                 
         except Exception as e:
             self.logger.error(f"Error updating data for {instrument_key}: {e}")
     
-    def _process_kite_tick(self, instrument_key, tick):
-        """Process Kite tick data"""
-        # Skip live data processing if we have stored intraday data
-        if self.has_stored_data.get(instrument_key, False):
-            self.logger.debug(f"Skipping Kite tick processing for {instrument_key} - using stored intraday data")
-            return
-            
-        current_price = tick.get('last_price', 0)
-        volume = tick.get('volume', 0)
+    def _resolve_handler(self, instrument_key, tick_data):
+        """Pick and cache the tick handler for an instrument from its first tick"""
+        if isinstance(tick_data, list):
+            handler = self._process_kite_list
+        else:
+            # Unspecified Upstox feeds can mix OHLC and price ticks, so keep the per-tick check
+            handler = self._process_upstox_tick
+        self._handler[instrument_key] = handler
+        return handler
+    
+    def _process_kite_list(self, instrument_key, ticks):
+        """Process a Kite tick batch, keeping only ticks for this instrument
+        
+        The batch is filtered and queued in one pass; only its last tick sets the
+        current price and goes to the live data callback (which keeps the latest anyway).
+        """
         timestamp = datetime.now()
+        queued = [(instrument_key, timestamp, tick.get('last_price', 0), tick.get('volume', 0))
+                  for tick in ticks if tick['instrument_token'] == instrument_key]
+        if not queued:
+            return
+        
+        # Add to queue for processing
+        self.data_queue.extend(queued)
         
         # Update current price
+        _, _, current_price, volume = queued[-1]
         self.current_prices[instrument_key] = current_price
         
-        # Add to queue for processing
-        self.data_queue.put({
-            'instrument': instrument_key,
-            'timestamp': timestamp,
-            'price': current_price,
-            'volume': volume,
-            'tick': tick
-        })
-        
         # Call live data callback for payoff chart updates (with 5-second interval)
         if self.live_data_callback:
             self._call_live_data_callback_with_interval(instrument_key, current_price, volume)
@@ -283,80 +414,87 @@ class LiveChartVisualizer:
     def _process_upstox_tick(self, instrument_key, tick_data):
         """Process Upstox tick data"""
         try:
-            # Skip live data processing if we have stored intraday data
-            if self.has_stored_data.get(instrument_key, False):
-                self.logger.debug(f"Skipping Upstox tick processing for {instrument_key} - using stored intraday data")
-                return
-            
-            # Check if this is complete OHLC data (from data warehouse)
-            if isinstance(tick_data, dict) and all(key in tick_data for key in ['open', 'high', 'low', 'close']):
+            # Check if this is complete OHLC data (from data warehouse) - one set comparison
+            # on the key view instead of four membership tests
+            if isinstance(tick_data, dict) and tick_data.keys() >= _OHLC_KEYS:
                 # This is complete OHLC data - add it directly as a candle
                 self._add_complete_candle(instrument_key, tick_data)
                 return
             
             # Otherwise, process as individual tick data
-            current_price = 0.0
-            volume = 0
-            
-            # Check if tick_data already has extracted price information
-            if isinstance(tick_data, dict) and 'price' in tick_data:
-                current_price = tick_data.get('price', 0.0)
-                volume = tick_data.get('volume', 0)
-                self.logger.debug(f"Using pre-extracted price: {current_price}")
+            self._process_upstox_live_tick(instrument_key, tick_data)
+            
+        except Exception as e:
+            self.logger.error(f"Error processing Upstox tick: {e}")
+    
+    def _parse_upstox_dict(self, tick_data):
+        """Extract (price, volume) from an Upstox tick dict"""
+        # Check if tick_data already has extracted price information
+        if 'price' in tick_data:
+            current_price = tick_data.get('price', 0.0)
+            self.logger.debug("Using pre-extracted price: %s", current_price)
+        elif 'close' in tick_data:
+            # For OHLC data, use close price as current price
+            current_price = tick_data.get('close', 0.0)
+            self.logger.debug("Using close price from OHLC data: %s", current_price)
+        else:
+            current_price = tick_data.get('ltp', tick_data.get('last_price', 0))
+        return current_price, tick_data.get('volume', 0)
+    
+    def _parse_upstox_message(self, tick_data):
+        """Extract (price, volume) from a Protobuf feed message"""
+        # Messages with top-level price / volume fields are read directly; which fields
+        # a class has is looked up once per class
+        cls = type(tick_data)
+        fields = self._message_fields.get(cls)
+        if fields is None:
+            price_attr = next((name for name in ('ltp', 'last_price') if hasattr(tick_data, name)), None)
+            volume_attr = 'volume' if hasattr(tick_data, 'volume') else None
+            fields = self._message_fields[cls] = (price_attr, volume_attr)
+        
+        price_attr, volume_attr = fields
+        if price_attr is not None:
+            current_price = getattr(tick_data, price_attr)
+            if current_price:
+                volume = getattr(tick_data, volume_attr) if volume_attr else 0
+                return float(current_price), int(volume or 0)
+        
+        return self._parse_upstox_text(str(tick_data))
+    
+    @staticmethod
+    def _parse_upstox_text(data_str):
+        """Extract (price, volume) from the string form of a feed message"""
+        current_price = 0.0
+        volume = 0
+        
+        # Try to find price patterns in the string representation
+        for pattern in _UPSTOX_PRICE_PATTERNS:
+            price_match = pattern.search(data_str)
+            if price_match:
+                try:
+                    current_price = float(price_match.group(1))
+                    break
+                except ValueError:
+                    continue
+        
+        for pattern in _UPSTOX_VOLUME_PATTERNS:
+            volume_match = pattern.search(data_str)
+            if volume_match:
+                try:
+                    volume = int(volume_match.group(1))
+                    break
+                except ValueError:
+                    continue
+        
+        return current_price, volume
+    
+    def _process_upstox_live_tick(self, instrument_key, tick_data):
+        """Process an Upstox price tick (no OHLC check)"""
+        try:
+            if isinstance(tick_data, dict):
+                current_price, volume = self._parse_upstox_dict(tick_data)
             else:
-                # Try to extract price from different possible fields
-                if isinstance(tick_data, dict):
-                    # If it's a dictionary, try common price fields
-                    # For OHLC data, use close price as current price
-                    if 'close' in tick_data:
-                        current_price = tick_data.get('close', 0.0)
-                        self.logger.debug(f"Using close price from OHLC data: {current_price}")
-                    else:
-                        current_price = tick_data.get('ltp', tick_data.get('last_price', tick_data.get('price', 0)))
-                    volume = tick_data.get('volume', 0)
-                else:
-                    # If it's a Protobuf message, try to extract price information
-                    data_str = str(tick_data)
-                    
-                    # Try to find price patterns in the string representation
-                    import re
-                    price_patterns = [
-                        r'ltp[:\s=]*(\d+\.?\d*)',
-                        r'last_price[:\s=]*(\d+\.?\d*)',
-                        r'price[:\s=]*(\d+\.?\d*)',
-                        r'close[:\s=]*(\d+\.?\d*)',
-                        r'open[:\s=]*(\d+\.?\d*)',
-                        r'high[:\s=]*(\d+\.?\d*)',
-                        r'low[:\s=]*(\d+\.?\d*)',
-                        r'"last_price":\s*(\d+\.?\d*)',
-                        r'last_price:\s*(\d+\.?\d*)',
-                        r'ltp:\s*(\d+\.?\d*)',
-                        r'(\d{4,6}\.?\d*)'
-                    ]
-                    
-                    for pattern in price_patterns:
-                        price_match = re.search(pattern, data_str, re.IGNORECASE)
-                        if price_match:
-                            try:
-                                current_price = float(price_match.group(1))
-                                break
-                            except ValueError:
-                                continue
-                    
-                    volume_patterns = [
-                        r'volume[:\s=]*(\d+)',
-                        r'vol[:\s=]*(\d+)',
-                        r'"volume":\s*(\d+)'
-                    ]
-                    
-                    for pattern in volume_patterns:
-                        volume_match = re.search(pattern, data_str, re.IGNORECASE)
-                        if volume_match:
-                            try:
-                                volume = int(volume_match.group(1))
-                                break
-                            except ValueError:
-                                continue
+                current_price, volume = self._parse_upstox_message(tick_data)
             
             timestamp = datetime.now()
             
@@ -364,19 +502,12 @@ class LiveChartVisualizer:
             self.current_prices[instrument_key] = current_price
             
             # Add to queue for processing
-            self.data_queue.put({
-                'instrument': instrument_key,
-                'timestamp': timestamp,
-                'price': current_price,
-                'volume': volume,
-                'tick': tick_data
-            })
+            self.data_queue.append((instrument_key, timestamp, current_price, volume))
             
-            self.logger.debug(f"Processed Upstox tick for {instrument_key}: price={current_price}, volume={volume}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"Processed Upstox tick for {instrument_key}: price={current_price}, volume={volume}")
             
-            # Immediately update the chart if it's running
-            if self.is_running:
-                self._draw_charts()
+            # The animation loop drains the queue and redraws once per frame
             
             # Call live data callback for payoff chart updates (with 5-second interval)
             if self.live_data_callback:
@@ -385,30 +516,115 @@ class LiveChartVisualizer:
         except Exception as e:
             self.logger.error(f"Error processing Upstox tick: {e}")
             # Still add a basic entry to keep the chart alive
-            self.data_queue.put({
-                'instrument': instrument_key,
-                'timestamp': datetime.now(),
-                'price': 0.0,
-                'volume': 0,
-                'tick': tick_data
-            })
+            self.data_queue.append((instrument_key, datetime.now(), 0.0, 0))
+    
+    def _init_candle_store(self, instrument_key):
+        """Create empty candle storage (deque of dicts plus the OHLC array) for an instrument
+        
+        The array holds twice max_candles rows: the live window slides forward as candles
+        are evicted and is only copied back to the front when it reaches the end.
+        """
+        self.candle_data[instrument_key] = deque(maxlen=self.max_candles)
+        self.ohlc_arr[instrument_key] = np.zeros(2 * self.max_candles, dtype=OHLC_DTYPE)
+        self._ohlc_start[instrument_key] = 0
+        self._ohlc_len[instrument_key] = 0
+        self._ohlc_dropped[instrument_key] = 0
+        self._ohlc_dirty_from[instrument_key] = 0
+    
+    @staticmethod
+    def _candle_row(candle):
+        """OHLC_DTYPE row for a candle dict"""
+        return (candle['ts_mpl'], candle['open'], candle['high'], candle['low'], candle['close'], candle['volume'])
+    
+    def _ohlc_append(self, instrument_key, candle):
+        """Mirror a candle appended to candle_data into the OHLC array"""
+        arr = self.ohlc_arr[instrument_key]
+        start = self._ohlc_start[instrument_key]
+        count = self._ohlc_len[instrument_key]
+        if count == self.max_candles:
+            # Full - evict the oldest row like the deque does; drawn rows shift down by one
+            start += 1
+            count -= 1
+            self._ohlc_dropped[instrument_key] += 1
+            dirty_from = self._ohlc_dirty_from.get(instrument_key)
+            if dirty_from is not None:
+                self._ohlc_dirty_from[instrument_key] = max(dirty_from - 1, 0)
+        if start + count == len(arr):
+            # Window reached the end of the buffer - one copy per max_candles appends
+            arr[:count] = arr[start:start + count]
+            start = 0
+        arr[start + count] = self._candle_row(candle)
+        self._ohlc_start[instrument_key] = start
+        self._ohlc_len[instrument_key] = count + 1
+        self._mark_ohlc_dirty(instrument_key, count)
+    
+    def _ohlc_update_last(self, instrument_key, candle):
+        """Mirror an in-place update of the forming candle into the OHLC array"""
+        last = self._ohlc_len[instrument_key] - 1
+        self.ohlc_arr[instrument_key][self._ohlc_start[instrument_key] + last] = self._candle_row(candle)
+        self._mark_ohlc_dirty(instrument_key, last)
+    
+    def _ohlc_rebuild(self, instrument_key):
+        """Refill the OHLC array from candle_data after a bulk load"""
+        candles = self.candle_data[instrument_key]
+        arr = self.ohlc_arr[instrument_key]
+        arr[:len(candles)] = [self._candle_row(candle) for candle in candles]
+        self._ohlc_start[instrument_key] = 0
+        self._ohlc_len[instrument_key] = len(candles)
+        self._mark_ohlc_dirty(instrument_key, 0)
+    
+    def _mark_ohlc_dirty(self, instrument_key, row):
+        """Record that OHLC rows from row onwards have to be redrawn"""
+        dirty_from = self._ohlc_dirty_from.get(instrument_key)
+        self._ohlc_dirty_from[instrument_key] = row if dirty_from is None else min(dirty_from, row)
+    
+    def get_candle_arrays(self, instrument_key):
+        """Stored candles as an OHLC_DTYPE array view (time order), or None
+        
+        Zero-copy: the view reflects later updates of the forming candle, so copy it
+        if a snapshot is needed. Prefer this over get_candle_data in hot paths.
+        """
+        if instrument_key not in self.ohlc_arr:
+            return None
+        start = self._ohlc_start[instrument_key]
+        return self.ohlc_arr[instrument_key][start:start + self._ohlc_len[instrument_key]]
+    
+    @staticmethod
+    def _normalize_timestamp(ts):
+        """Timezone-naive datetime for an incoming timestamp
+        
+        Accepts datetime (naive or aware), ISO string, epoch seconds or None (now).
+        Called where candles and ticks enter the chart, so stored candles always
+        carry naive datetimes and nothing downstream has to check.
+        """
+        if isinstance(ts, datetime):
+            return ts.replace(tzinfo=None) if ts.tzinfo is not None else ts
+        if isinstance(ts, str):
+            return datetime.fromisoformat(ts.replace('Z', '+00:00')).replace(tzinfo=None)
+        if ts is None:
+            return datetime.now()
+        return datetime.fromtimestamp(ts)
+    
+    @classmethod
+    def _normalize_timestamps(cls, timestamps):
+        """_normalize_timestamp for a whole column, as one datetime64 array
+        
+        fromisoformat is faster per string than pandas' offset parsing, so only the
+        conversion to datetime64 is batched.
+        """
+        return pd.DatetimeIndex([cls._normalize_timestamp(ts) for ts in timestamps]).values
     
     def _add_complete_candle(self, instrument_key, ohlc_data):
         """Add a complete OHLC candle directly to the chart"""
         try:
             if instrument_key not in self.candle_data:
-                self.candle_data[instrument_key] = deque(maxlen=self.max_candles)
-            
-            # Convert timestamp to datetime if it's a string
-            timestamp = ohlc_data.get('timestamp')
-            if isinstance(timestamp, str):
-                timestamp = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-            elif timestamp is None:
-                timestamp = datetime.now()
+                self._init_candle_store(instrument_key)
             
             # Create complete candle data
+            timestamp = self._normalize_timestamp(ohlc_data.get('timestamp'))
             candle = {
                 'timestamp': timestamp,
+                'ts_mpl': mdates.date2num(timestamp),
                 'open': float(ohlc_data.get('open', 0)),
                 'high': float(ohlc_data.get('high', 0)),
                 'low': float(ohlc_data.get('low', 0)),
@@ -418,21 +634,15 @@ class LiveChartVisualizer:
             
             # Add to candle data (deque will automatically limit size)
             self.candle_data[instrument_key].append(candle)
+            self._ohlc_append(instrument_key, candle)
             
             # Update current price to close price
             self.current_prices[instrument_key] = candle['close']
             
             # Update last update time
-            candle_time = candle['timestamp']
-            if isinstance(candle_time, datetime):
-                # Ensure timestamp is timezone-naive
-                if candle_time.tzinfo is not None:
-                    candle_time = candle_time.replace(tzinfo=None)
-                self.last_update_time = candle_time
-            else:
-                self.last_update_time = datetime.fromtimestamp(candle_time)
+            self.last_update_time = candle['timestamp']
             
-            self.logger.debug(f"Added complete OHLC candle for {instrument_key}: O={candle['open']}, H={candle['high']}, L={candle['low']}, C={candle['close']}, V={candle['volume']}")
+            self.logger.debug("Added complete OHLC candle for %s: O=%s, H=%s, L=%s, C=%s, V=%s", instrument_key, candle['open'], candle['high'], candle['low'], candle['close'], candle['volume'])
             
             # Chart will be updated by animation loop, no need for immediate redraw
                 
@@ -446,60 +656,48 @@ class LiveChartVisualizer:
             if not candles_data:
                 return []
             
-            # Group candles by 5-minute intervals
-            consolidated = {}
-            
-            for candle in candles_data:
-                # Convert timestamp to datetime if needed
-                timestamp = candle.get('timestamp')
-                if isinstance(timestamp, str):
-                    timestamp = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-                elif timestamp is None:
-                    timestamp = datetime.now()
-                
-                # Round to 5-minute boundary
-                minute = timestamp.minute
-                rounded_minute = (minute // 5) * 5
-                bucket_time = timestamp.replace(minute=rounded_minute, second=0, microsecond=0)
-                
-                if bucket_time not in consolidated:
-                    consolidated[bucket_time] = []
-                
-                consolidated[bucket_time].append(candle)
-            
-            # Create consolidated candles
-            result = []
-            for bucket_time, candles in sorted(consolidated.items()):
-                if not candles:
-                    continue
-                
-                # Sort candles within the bucket by timestamp
-                candles.sort(key=lambda x: x.get('timestamp', datetime.now()))
-                
-                # Extract OHLCV values
-                opens = [float(c.get('open', 0)) for c in candles if c.get('open') is not None]
-                highs = [float(c.get('high', 0)) for c in candles if c.get('high') is not None]
-                lows = [float(c.get('low', 0)) for c in candles if c.get('low') is not None]
-                closes = [float(c.get('close', 0)) for c in candles if c.get('close') is not None]
-                volumes = [float(c.get('volume', 0)) for c in candles if c.get('volume') is not None]
-                
-                if not opens or not highs or not lows or not closes:
-                    continue
-                
-                # Create consolidated candle
-                consolidated_candle = {
-                    'timestamp': bucket_time,
-                    'open': opens[0],  # First open in the bucket
-                    'high': max(highs),  # Highest high in the bucket
-                    'low': min(lows),    # Lowest low in the bucket
-                    'close': closes[-1], # Last close in the bucket
-                    'volume': sum(volumes) if volumes else 0  # Sum of volumes
-                }
-                
-                result.append(consolidated_candle)
-            
-            # Sort by timestamp
-            result.sort(key=lambda x: x['timestamp'])
+            # One pass over the dicts, then columns as arrays (missing values become NaN), in time order
+            rows = [(c.get('timestamp'), c.get('open'), c.get('high'), c.get('low'), c.get('close'), c.get('volume'))
+                    for c in candles_data]
+            timestamps = self._normalize_timestamps([row[0] for row in rows])
+            order = np.argsort(timestamps, kind='stable')
+            timestamps = timestamps[order]
+            values = np.array([row[1:] for row in rows], dtype=float)[order]
+            
+            # Round to 5-minute boundary and split the sorted rows into buckets
+            buckets = timestamps.astype('datetime64[m]').astype(np.int64) // 5
+            is_start = np.r_[True, buckets[1:] != buckets[:-1]]
+            starts = np.flatnonzero(is_start)
+            group_ids = np.cumsum(is_start) - 1
+            
+            def first_valid(column, reverse=False):
+                # First (or last) non-missing value per bucket, NaN when the bucket has none
+                valid = ~np.isnan(column)
+                ids, picked = group_ids[valid], column[valid]
+                if reverse:
+                    ids, picked = ids[::-1], picked[::-1]
+                result = np.full(len(starts), np.nan)
+                unique_ids, first_index = np.unique(ids, return_index=True)
+                result[unique_ids] = picked[first_index]
+                return result
+            
+            opens = first_valid(values[:, 0])
+            highs = np.fmax.reduceat(values[:, 1], starts)  # fmax/fmin skip NaN
+            lows = np.fmin.reduceat(values[:, 2], starts)
+            closes = first_valid(values[:, 3], reverse=True)
+            volumes = np.add.reduceat(np.nan_to_num(values[:, 4]), starts)
+            
+            # Buckets missing any of O/H/L/C are dropped
+            keep = ~np.isnan(np.column_stack((opens, highs, lows, closes))).any(axis=1)
+            bucket_times = (buckets[starts] * 5).astype('datetime64[m]').astype('datetime64[us]').tolist()
+            
+            result = [
+                {'timestamp': bucket_time, 'open': o, 'high': h, 'low': l, 'close': c, 'volume': v}
+                for bucket_time, o, h, l, c, v, k in zip(
+                    bucket_times, opens.tolist(), highs.tolist(), lows.tolist(), closes.tolist(),
+                    volumes.tolist(), keep.tolist())
+                if k
+            ]
             
             self.logger.debug(f"Consolidated {len(candles_data)} 1-min candles into {len(result)} 5-min candles")
             
@@ -523,17 +721,35 @@ class LiveChartVisualizer:
             
             # Initialize intraday data storage if not exists
             if instrument_key not in self.candle_data:
-                self.candle_data[instrument_key] = deque(maxlen=self.max_candles)
+                self._init_candle_store(instrument_key)
+            
+            # Normalize timestamps once on the way in (copies - the caller's candles are shared
+            # with the datawarehouse). Brokers return intraday candles newest-first; keep storage
+            # in time order so the draw path never has to sort
+            timestamps = self._normalize_timestamps([candle.get('timestamp') for candle in intraday_data])
+            # Only the newest max_candles fit in the deque - skip per-candle work for the rest
+            order = np.argsort(timestamps, kind='stable')[-self.max_candles:]
+            timestamps = timestamps[order]
+            
+            # Matplotlib x positions computed in a single batch. Records keep only the candle
+            # fields (same layout as _add_complete_candle) - broker extras are not carried along
+            intraday_data = [
+                {'timestamp': timestamp, 'ts_mpl': ts_mpl, 'open': candle.get('open'), 'high': candle.get('high'),
+                 'low': candle.get('low'), 'close': candle.get('close'), 'volume': candle.get('volume', 0)}
+                for candle, timestamp, ts_mpl in zip([intraday_data[i] for i in order.tolist()],
+                                                     timestamps.astype('datetime64[us]').tolist(),
+                                                     mdates.date2num(timestamps).tolist())
+            ]
             
             # Clear existing data before storing new data to prevent duplicates
             self.candle_data[instrument_key].clear()
             
             # Store intraday data
-            for candle in intraday_data:
-                self.candle_data[instrument_key].append(candle)
+            self.candle_data[instrument_key].extend(intraday_data)
+            self._ohlc_rebuild(instrument_key)
             
             # Mark that we have stored data for this instrument
-            self.has_stored_data[instrument_key] = True
+            self._frozen_instruments.add(instrument_key)
             
             # Update current price to the latest close price
             if intraday_data:
@@ -541,59 +757,39 @@ class LiveChartVisualizer:
                 self.current_prices[instrument_key] = latest_candle.get('close', 0)
                 
                 # Update last update time
-                latest_timestamp = latest_candle.get('timestamp')
-                if isinstance(latest_timestamp, datetime):
-                    # Ensure timestamp is timezone-naive
-                    if latest_timestamp.tzinfo is not None:
-                        latest_timestamp = latest_timestamp.replace(tzinfo=None)
-                    self.last_update_time = latest_timestamp
-                else:
-                    self.last_update_time = datetime.fromtimestamp(latest_timestamp)
+                self.last_update_time = latest_candle['timestamp']
             
             self.logger.info(f"Stored {len(intraday_data)} intraday candles for {instrument_key}")
             
-            # Force chart update to display the data
+            # Display the data with the next frame
             if self.is_running:
-                self.force_chart_update()
+                self.request_chart_update()
             
         except Exception as e:
             self.logger.error(f"Error storing intraday data for {instrument_key}: {e}")
     
     def _update_candle_data(self, instrument_key, price, volume, timestamp):
-        """Update candle data with new tick"""
+        """Update candle data with new tick (the animation loop redraws)"""
         if instrument_key not in self.candle_data:
             return
         
-        # Skip live data processing if we have stored intraday data
-        if self.has_stored_data.get(instrument_key, False):
-            self.logger.debug(f"Skipping live data processing for {instrument_key} - using stored intraday data")
-            return
-            
+        # Frozen instruments (stored intraday data) are filtered once per batch by _apply_tick_batch
+        # Queued ticks are stamped with naive datetime.now() by their producers
         candle_data = self.candle_data[instrument_key]
         
-        # Convert timestamp to datetime if it's a float
-        if isinstance(timestamp, (int, float)):
-            timestamp = datetime.fromtimestamp(timestamp)
-        
-        # Ensure timestamp is timezone-naive to avoid timezone issues
-        if timestamp.tzinfo is not None:
-            timestamp = timestamp.replace(tzinfo=None)
-        
         if not candle_data:
             # First data point
             candle_data.append({
                 'timestamp': timestamp,
+                'ts_mpl': mdates.date2num(timestamp),
                 'open': price,
                 'high': price,
                 'low': price,
                 'close': price,
                 'volume': volume
             })
-            self.logger.debug(f"Created first candle for {instrument_key}: O={price}, H={price}, L={price}, C={price}, V={volume}")
-            
-            # Immediately update the chart if it's running
-            if self.is_running:
-                self._draw_charts()
+            self._ohlc_append(instrument_key, candle_data[-1])
+            self.logger.debug("Created first candle for %s: O=%s, H=%s, L=%s, C=%s, V=%s", instrument_key, price, price, price, price, volume)
         else:
             # Update last candle or create new one
             last_candle = candle_data[-1]
@@ -605,138 +801,307 @@ class LiveChartVisualizer:
                 self.logger.warning("Last candle has no timestamp, creating new candle")
                 time_diff = float('inf')  # Force new candle creation
             else:
-                # Ensure both timestamps are timezone-naive for comparison
-                if last_timestamp.tzinfo is not None:
-                    last_timestamp = last_timestamp.replace(tzinfo=None)
                 time_diff = (current_time - last_timestamp).total_seconds()
             
             if time_diff >= (self.candle_interval_minutes * 60):
                 # Create new candle
                 candle_data.append({
                     'timestamp': current_time,
+                    'ts_mpl': mdates.date2num(current_time),
                     'open': price,
                     'high': price,
                     'low': price,
                     'close': price,
                     'volume': volume
                 })
-                self.logger.debug(f"Created new candle for {instrument_key}: O={price}, H={price}, L={price}, C={price}, V={volume}")
-                
-                # Immediately update the chart if it's running
-                if self.is_running:
-                    self._draw_charts()
+                self._ohlc_append(instrument_key, candle_data[-1])
+                self.logger.debug("Created new candle for %s: O=%s, H=%s, L=%s, C=%s, V=%s", instrument_key, price, price, price, price, volume)
             else:
                 # Update current candle
                 last_candle['high'] = max(last_candle['high'], price)
                 last_candle['low'] = min(last_candle['low'], price)
                 last_candle['close'] = price
                 last_candle['volume'] += volume
-                self.logger.debug(f"Updated candle for {instrument_key}: O={last_candle['open']}, H={last_candle['high']}, L={last_candle['low']}, C={last_candle['close']}, V={last_candle['volume']}")
-                
-                # Immediately update the chart if it's running
-                if self.is_running:
-                    self._draw_charts()
+                self._ohlc_update_last(instrument_key, last_candle)
+                self.logger.debug("Updated candle for %s: O=%s, H=%s, L=%s, C=%s, V=%s", instrument_key, last_candle['open'], last_candle['high'], last_candle['low'], last_candle['close'], last_candle['volume'])
     
-    def _animate(self, frame):
-        """Animation function to update charts"""
+    def _init_chart_artists(self):
+        """Create the persistent candle and price-line artists that each frame updates in place"""
+        # Animated artists are skipped by full canvas draws and painted by _draw_animated_artists
+        # Every wick, and every body of one color, is a single compound path - one draw call
+        # each, and updating them is one array reshape instead of a Path object per candle
+        self._wick_patch = PathPatch(self._compound_path([], _WICK_CODES), facecolor='none', edgecolor='black',
+                                     linewidth=1.5, alpha=0.8, animated=True)
+        self._body_patches = tuple(
+            PathPatch(self._compound_path([], _BODY_CODES), facecolor=face, edgecolor=edge,
+                      linewidth=1.5, alpha=0.8, animated=True)
+            for face, edge in zip(_BODY_FACE_RGBA, _BODY_EDGE_RGBA))
+        for patch in (self._wick_patch, *self._body_patches):
+            self.price_ax.add_patch(patch)
+        
+        self._price_line = self.price_ax.axhline(y=0, color='red', linestyle='--', linewidth=2, alpha=0.8,
+                                                 label='Latest Price', visible=False, animated=True)
+        # x in axes coordinates (2% from right edge), y in price coordinates
+        self._price_text = self.price_ax.text(0.98, 0, '', transform=self.price_ax.get_yaxis_transform(),
+                                              ha='right', va='center', fontsize=10, fontweight='bold',
+                                              bbox=dict(boxstyle='round,pad=0.3', facecolor='red', alpha=0.8, edgecolor='darkred'),
+                                              color='white', visible=False, animated=True)
+        
+        self._no_data_text = self.price_ax.text(0.5, 0.5, 'No data available\nWaiting for market data...',
+                                                transform=self.price_ax.transAxes, ha='center', va='center',
+                                                fontsize=14, color='gray', alpha=0.7, visible=False)
+        
+        # Recapture the background whenever the canvas does a full draw (resize, layout change, hover)
+        self.fig.canvas.mpl_connect('draw_event', self._on_draw)
+        # Paths only hold the candles in view, so re-cull when the view moves (new data, pan, zoom)
+        self.price_ax.callbacks.connect('xlim_changed', self._on_xlim_changed)
+    
+    def _on_xlim_changed(self, ax):
+        """Reload the candle paths for the new visible time range"""
         try:
-            # Process queued data
-            has_new_data = False
-            while not self.data_queue.empty():
-                try:
-                    data = self.data_queue.get_nowait()
-                    self._update_candle_data(
-                        data['instrument'],
-                        data['price'],
-                        data['volume'],
-                        data['timestamp']
-                    )
-                    has_new_data = True
-                except queue.Empty:
-                    break
+            self._update_candle_paths()
+        except Exception as e:
+            self.logger.error(f"Error updating visible candles: {e}")
+    
+    def _animated_artists(self):
+        """Artists repainted on every frame, in drawing order"""
+        artists = (self._wick_patch, *self._body_patches, self._price_line, self._price_text)
+        # Hover overlays are animated too, so mouse moves only blit
+        overlays = self._visible_overlays()
+        return artists + tuple(overlays) if overlays else artists
+    
+    def _visible_overlays(self):
+        """Hover overlays (crosshair, labels, tooltip) currently shown"""
+        return [artist for artist in (self.crosshair_vline, self.crosshair_hline, *self.hover_labels.values(),
+                                      self.time_label, self.tooltip_annotation)
+                if artist is not None and artist.get_visible()]
+    
+    def _on_draw(self, event):
+        """Capture the static background after a full draw and paint the animated artists on top"""
+        try:
+            canvas = self.fig.canvas
+            if not getattr(canvas, 'supports_blit', False):
+                return
+            # savefig renders at its own size, so only keep backgrounds from screen draws
+            if not canvas.is_saving():
+                self._background = canvas.copy_from_bbox(self.fig.bbox)
+                self._background_bounds = self.fig.bbox.bounds
+            self._draw_animated_artists()
+        except Exception as e:
+            self.logger.error(f"Error capturing chart background: {e}")
+    
+    def _draw_animated_artists(self):
+        """Render the animated artists into the canvas buffer"""
+        for artist in self._animated_artists():
+            self.price_ax.draw_artist(artist)
+    
+    def _render_frame(self):
+        """Push the current chart state to the screen
+        
+        A full draw is only done when limits, ticks or title changed; otherwise the
+        cached background is restored and only the animated artists are blitted.
+        """
+        try:
+            if not self.fig or not self.price_ax:
+                return
             
-            # Only update charts if there's new data
-            if has_new_data:
-                self._draw_charts()
+            canvas = self.fig.canvas
+            # A resized figure needs a fresh background before blitting again
+            stale_background = self._background is None or self._background_bounds != self.fig.bbox.bounds
+            if self._needs_full_draw or stale_background or not getattr(canvas, 'supports_blit', False):
+                self._needs_full_draw = False
+                self._request_redraw()
+                return
+            
+            canvas.restore_region(self._background)
+            self._draw_animated_artists()
+            canvas.blit(self.fig.bbox)
             
         except Exception as e:
-            self.logger.error(f"Error in animation: {e}")
+            self.logger.error(f"Error rendering chart frame: {e}")
     
-    def _draw_charts(self):
-        """Draw/update the candlestick chart"""
+    def _request_redraw(self):
+        """Mark the canvas dirty; at most one draw_idle is issued per redraw interval"""
         try:
-            # Check if axes are available
-            if not self.price_ax:
-                self.logger.warning("Chart axes not available, skipping chart update")
+            if not self.fig:
+                return
+            if self._dirty:
                 return
+            self._dirty = True
             
-            # Clear axes
-            self.price_ax.clear()
+            if self._redraw_timer is None:
+                self._redraw_timer = self.fig.canvas.new_timer(interval=self.redraw_interval_ms)
+                self._redraw_timer.single_shot = True
+                self._redraw_timer.add_callback(self._flush_redraw)
             
-            # Clear hover labels
-            self.hover_labels.clear()
-            self.time_label = None
+            if type(self._redraw_timer) is TimerBase:
+                # Canvas without an event loop (e.g. Agg) - timers never fire
+                self._flush_redraw()
+                return
+            
+            self._redraw_timer.start()
             
-            # Set up axes with combined title
+        except Exception as e:
+            self.logger.error(f"Error requesting chart redraw: {e}")
+    
+    def _flush_redraw(self):
+        """Issue the single draw_idle for all redraw requests since the last flush"""
+        if not self._dirty:
+            return
+        self._dirty = False
+        self.fig.canvas.draw_idle()
+    
+    def _drain_data_queue(self):
+        """Take every queued tick without locking (popleft is safe against concurrent appends)"""
+        # Idle frames (no ticks) cost one length check - no list, no IndexError
+        if not self.data_queue:
+            return ()
+        batch = []
+        popleft = self.data_queue.popleft
+        try:
+            while True:
+                batch.append(popleft())
+        except IndexError:
+            pass
+        return batch
+    
+    def _apply_tick_batch(self, batch):
+        """Fold a batch of queued ticks into the candles without redrawing per tick
+        
+        Ticks are grouped by instrument; each run of ticks falling into the same
+        candle interval is applied with one max/min/sum instead of one update per tick.
+        """
+        ticks_by_instrument = {}
+        for tick in batch:
+            ticks_by_instrument.setdefault(tick[0], []).append(tick)
+        
+        interval = timedelta(minutes=self.candle_interval_minutes)
+        for instrument_key, ticks in ticks_by_instrument.items():
+            # Also drops ticks queued before intraday data was stored
+            if instrument_key not in self.candle_data or instrument_key in self._frozen_instruments:
+                continue
+            candle_data = self.candle_data[instrument_key]
+            
+            start = 0
+            while start < len(ticks):
+                _, timestamp, price, volume = ticks[start]
+                # Opens a new candle or updates the current one
+                self._update_candle_data(instrument_key, price, volume, timestamp)
+                candle = candle_data[-1]
+                candle_end = candle['timestamp'] + interval
+                
+                # Absorb the following ticks that still belong to this candle
+                end = start + 1
+                while end < len(ticks) and ticks[end][1] < candle_end:
+                    end += 1
+                
+                if end > start + 1:
+                    run = ticks[start + 1:end]
+                    prices = [tick[2] for tick in run]
+                    candle['high'] = max(candle['high'], max(prices))
+                    candle['low'] = min(candle['low'], min(prices))
+                    candle['close'] = prices[-1]
+                    candle['volume'] += sum(tick[3] for tick in run)
+                    self._ohlc_update_last(instrument_key, candle)
+                
+                start = end
+    
+    def _is_chart_hidden(self):
+        """True when the Tk window holding the chart is minimized or withdrawn"""
+        get_tk_widget = getattr(self.fig.canvas, 'get_tk_widget', None) if self.fig else None
+        if get_tk_widget is None:
+            return False
+        try:
+            return get_tk_widget().winfo_toplevel().state() in ('iconic', 'withdrawn')
+        except tk.TclError:
+            return False
+    
+    def _animate(self, frame=None):
+        """Animation function to update charts"""
+        try:
+            # Process queued data - always, so nothing is lost while the window is hidden
+            batch = self._drain_data_queue()
+            if batch:
+                self._apply_tick_batch(batch)
+                self._pending_redraw = True
+            
+            # Only update charts if there's new data and someone can see it
+            if self._pending_redraw and not self._is_chart_hidden():
+                self._pending_redraw = False
+                self._draw_charts()
+                self._render_frame()
+            
+        except Exception as e:
+            self.logger.error(f"Error in animation: {e}")
+        
+        return self._animated_artists()
+    
+    def _draw_charts(self):
+        """Update the candlestick artists and axes from the current candle data
+        
+        Does not draw - _render_frame (or the caller's _request_redraw) puts the result on screen.
+        """
+        try:
             # Get last update time for title
             last_update_time = self._get_last_update_time()
             time_info = f" (Last Update: {last_update_time})" if last_update_time else ""
-            
-            # Update the combined title with current information
             combined_title = f"{self.title} - Nifty 50 Intraday Candlestick Chart (5-Minute) - Price (₹) vs Time{time_info}"
-            self.fig.suptitle(combined_title, fontsize=10, fontweight='bold')
-            
-            # Remove individual titles to prevent overlap
-            self.price_ax.set_title("")  # Empty title
-            self.price_ax.set_ylabel("")  # Empty ylabel
-            self.price_ax.set_xlabel("")  # Empty xlabel
-            self.price_ax.grid(True, alpha=0.3)
             
             # Check if we have any data to display
             has_data = False
             
+            # Drop geometry of instruments that no longer have candles
+            stale = [key for key in self._candle_geometry if not self.candle_data.get(key)]
+            for instrument_key in stale:
+                del self._candle_geometry[instrument_key]
+                self._hover_index.pop(instrument_key, None)
+                self._hover_lookup = None
+                self._hover_generation += 1
+            if stale:
+                self._update_candle_paths()
+            candles_changed = bool(stale) or self._layout_state is None
+            
             # Plot candlesticks for each instrument
             for instrument_key, candle_data in self.candle_data.items():
                 if not candle_data:
                     continue
                 
-                # Convert to DataFrame for easier handling
-                df = pd.DataFrame(list(candle_data))
-                if df.empty:
-                    continue
-                
-                # Plot candlesticks
-                self._plot_candlesticks(df, instrument_key)
+                # Plot candlesticks straight from the stored candles (already in time order)
+                if self._plot_candlesticks(candle_data, instrument_key):
+                    candles_changed = True
                 has_data = True
             
             # If no data, show a message
+            self._no_data_text.set_visible(not has_data)
             if not has_data:
-                self.price_ax.text(0.5, 0.5, 'No data available\nWaiting for market data...', 
-                                 transform=self.price_ax.transAxes, ha='center', va='center',
-                                 fontsize=14, color='gray', alpha=0.7)
-                self.price_ax.set_ylim(0, 1)
-                self.price_ax.set_xlim(0, 1)
+                # Reset the view once when the data goes away, not on every empty frame
+                if self._layout_state is None or self._layout_state[3]:
+                    self.price_ax.set_ylim(0, 1)
+                    self.price_ax.set_xlim(0, 1)
+                    self._x_axis_range = None  # Lay the x-axis out again once candles return
+                    self._remove_existing_price_line()
             else:
-                # Update Y-axis scale based on price range
-                self._update_y_axis_scale()
+                # Axis limits only move with the candles - skip rescaling when none changed
+                if candles_changed:
+                    # Update Y-axis scale based on price range
+                    self._update_y_axis_scale()
                 
                 # Draw latest price line if available
                 self.logger.debug("About to draw latest price line")
                 self._draw_latest_price_line()
             
             # Format x-axis with time display
-            self._format_x_axis_time()
-            
-            # Adjust layout with proper spacing for rotated labels and combined title
-            plt.tight_layout(pad=3.0)
-            
-            # Ensure subplot spacing accommodates rotated labels and combined title
-            if hasattr(self, 'fig') and self.fig:
-                self.fig.subplots_adjust(bottom=0.15, left=0.1, right=0.95, top=0.88)
+            if candles_changed:
+                self._format_x_axis_time()
             
-            # Only redraw if chart is running to prevent flickering
-            if self.is_running and hasattr(self, 'fig') and self.fig:
-                self.fig.canvas.draw_idle()
+            # Static parts of the figure only need a full redraw when they actually change
+            layout_state = (tuple(self.price_ax.get_xlim()), tuple(self.price_ax.get_ylim()), combined_title, has_data)
+            if layout_state != self._layout_state:
+                self._layout_state = layout_state
+                self._needs_full_draw = True
+                
+                # Update the combined title with current information
+                self.fig.suptitle(combined_title, fontsize=10, fontweight='bold')
             
         except Exception as e:
             self.logger.error(f"Error drawing charts: {e}")
@@ -747,7 +1112,7 @@ class LiveChartVisualizer:
             # Get the latest price from datawarehouse
             latest_price = None
             latest_close_price = None
-            if hasattr(self, 'datawarehouse') and self.datawarehouse:
+            if self.datawarehouse:
                 # Get the primary instrument (Nifty 50)
                 primary_instrument = 'NSE_INDEX|Nifty 50'
                 latest_price = self.datawarehouse.get_latest_price(primary_instrument)
@@ -755,39 +1120,10 @@ class LiveChartVisualizer:
                 self.logger.info(f"Retrieved latest price from datawarehouse: {latest_price}")
                 self.logger.info(f"Retrieved latest close price from datawarehouse: {latest_close_price}")
             else:
-                self.logger.info(f"No datawarehouse available for latest price - hasattr datawarehouse: {hasattr(self, 'datawarehouse')}, datawarehouse: {getattr(self, 'datawarehouse', None)}")
+                self.logger.info("No datawarehouse available for latest price")
             
             if latest_price is not None:
-                # Get current x-axis limits
-                xlim = self.price_ax.get_xlim()
-                
-                # Draw horizontal line for latest price
-                self.price_ax.axhline(y=latest_price, color='red', linestyle='--', linewidth=2, alpha=0.8, label='Latest Price')
-                
-                # Calculate price difference if close price is available
-                price_diff = None
-                price_diff_text = ""
-                if latest_close_price is not None:
-                    price_diff = latest_price - latest_close_price
-                    if price_diff > 0:
-                        price_diff_text = f" (+₹{price_diff:.2f})"
-                    elif price_diff < 0:
-                        price_diff_text = f" (₹{price_diff:.2f})"
-                    else:
-                        price_diff_text = " (0.00)"
-                
-                # Add price text on the right side of the chart
-                # Position the text at the right edge of the chart
-                right_x = xlim[1] - (xlim[1] - xlim[0]) * 0.02  # 2% from right edge
-                price_text = f'₹{latest_price:.2f}{price_diff_text}'
-                self.price_ax.text(right_x, latest_price, price_text, 
-                                 ha='right', va='center', fontsize=10, fontweight='bold',
-                                 bbox=dict(boxstyle='round,pad=0.3', facecolor='red', alpha=0.8, edgecolor='darkred'),
-                                 color='white')
-                
-                # Update legend to include latest price
-                self.price_ax.legend(loc='upper left', fontsize=8)
-                
+                price_diff_text = self._set_price_line(latest_price, latest_close_price)
                 self.logger.info(f"Drew latest price line at {latest_price} with difference {price_diff_text}")
             else:
                 self.logger.info("No latest price available to draw line")
@@ -795,13 +1131,39 @@ class LiveChartVisualizer:
         except Exception as e:
             self.logger.error(f"Error drawing latest price line: {e}")
     
+    def _set_price_line(self, latest_price, latest_close_price):
+        """Move the persistent price line and label to latest_price, returns the diff text"""
+        # Calculate price difference if close price is available
+        price_diff_text = ""
+        if latest_close_price is not None:
+            price_diff = latest_price - latest_close_price
+            if price_diff > 0:
+                price_diff_text = f" (+₹{price_diff:.2f})"
+            elif price_diff < 0:
+                price_diff_text = f" (₹{price_diff:.2f})"
+            else:
+                price_diff_text = " (0.00)"
+        
+        self._price_line.set_ydata([latest_price, latest_price])
+        self._price_line.set_visible(True)
+        self._price_text.set_y(latest_price)
+        self._price_text.set_text(f'₹{latest_price:.2f}{price_diff_text}')
+        self._price_text.set_visible(True)
+        
+        # Legend only needs to be created once - it references the persistent line
+        if self.price_ax.get_legend() is None:
+            self.price_ax.legend(handles=[self._price_line], loc='upper left', fontsize=8)
+            self._needs_full_draw = True
+        
+        return price_diff_text
+    
     def _update_live_price_line_only(self):
         """Update only the live price line without redrawing the entire chart"""
         try:
             # Get the latest price from datawarehouse
             latest_price = None
             latest_close_price = None
-            if hasattr(self, 'datawarehouse') and self.datawarehouse:
+            if self.datawarehouse:
                 # Get the primary instrument (Nifty 50)
                 primary_instrument = 'NSE_INDEX|Nifty 50'
                 latest_price = self.datawarehouse.get_latest_price(primary_instrument)
@@ -809,7 +1171,7 @@ class LiveChartVisualizer:
             
             if latest_price is not None and self.price_ax:
                 # Check if price has changed significantly to avoid unnecessary updates
-                if hasattr(self, '_last_price_line_value'):
+                if self._last_price_line_value is not None:
                     price_change = abs(latest_price - self._last_price_line_value)
                     # Only update if price changed by more than 0.1 points
                     if price_change < 0.1:
@@ -818,71 +1180,24 @@ class LiveChartVisualizer:
                 # Store the current price for comparison
                 self._last_price_line_value = latest_price
                 
-                # Remove existing price line and text if they exist
-                self._remove_existing_price_line()
-                
-                # Get current x-axis limits
-                xlim = self.price_ax.get_xlim()
-                
-                # Draw new horizontal line for latest price
-                self.price_ax.axhline(y=latest_price, color='red', linestyle='--', linewidth=2, alpha=0.8, label='Latest Price')
-                
-                # Calculate price difference if close price is available
-                price_diff_text = ""
-                if latest_close_price is not None:
-                    price_diff = latest_price - latest_close_price
-                    if price_diff > 0:
-                        price_diff_text = f" (+₹{price_diff:.2f})"
-                    elif price_diff < 0:
-                        price_diff_text = f" (₹{price_diff:.2f})"
-                    else:
-                        price_diff_text = " (0.00)"
-                
-                # Add price text on the right side of the chart
-                right_x = xlim[1] - (xlim[1] - xlim[0]) * 0.02  # 2% from right edge
-                price_text = f'₹{latest_price:.2f}{price_diff_text}'
-                self.price_ax.text(right_x, latest_price, price_text, 
-                                 ha='right', va='center', fontsize=10, fontweight='bold',
-                                 bbox=dict(boxstyle='round,pad=0.3', facecolor='red', alpha=0.8, edgecolor='darkred'),
-                                 color='white')
+                price_diff_text = self._set_price_line(latest_price, latest_close_price)
                 
-                # Update legend to include latest price
-                self.price_ax.legend(loc='upper left', fontsize=8)
+                # Blit only the changed artists
+                self._render_frame()
                 
-                # Force matplotlib to redraw only the changes
-                if hasattr(self, 'fig') and self.fig:
-                    self.fig.canvas.draw_idle()
-                
-                self.logger.debug(f"Updated live price line at {latest_price} with difference {price_diff_text}")
+                self.logger.debug("Updated live price line at %s with difference %s", latest_price, price_diff_text)
             
         except Exception as e:
             self.logger.error(f"Error updating live price line: {e}")
     
     def _remove_existing_price_line(self):
-        """Remove existing price line and text to avoid duplicates"""
+        """Hide the price line and label"""
         try:
             if not self.price_ax:
                 return
             
-            # Remove horizontal lines (axhline creates Line2D objects)
-            lines_to_remove = []
-            for line in self.price_ax.lines:
-                if (hasattr(line, 'get_linestyle') and line.get_linestyle() == '--' and 
-                    hasattr(line, 'get_color') and line.get_color() == 'red'):
-                    lines_to_remove.append(line)
-            
-            for line in lines_to_remove:
-                line.remove()
-            
-            # Remove text objects that look like price labels
-            texts_to_remove = []
-            for text in self.price_ax.texts:
-                if (hasattr(text, 'get_text') and '₹' in str(text.get_text()) and
-                    hasattr(text, 'get_bbox_patch') and text.get_bbox_patch() is not None):
-                    texts_to_remove.append(text)
-            
-            for text in texts_to_remove:
-                text.remove()
+            self._price_line.set_visible(False)
+            self._price_text.set_visible(False)
                 
         except Exception as e:
             self.logger.error(f"Error removing existing price line: {e}")
@@ -893,57 +1208,24 @@ class LiveChartVisualizer:
             if not self.candle_data:
                 return
             
-            # Collect all timestamps from all instruments
-            all_timestamps = []
-            for instrument_key, candle_data in self.candle_data.items():
-                if not candle_data:
-                    continue
-                
-                for candle in candle_data:
-                    timestamp = candle['timestamp']
-                    if isinstance(timestamp, datetime):
-                        # Ensure timestamp is timezone-naive
-                        if timestamp.tzinfo is not None:
-                            timestamp = timestamp.replace(tzinfo=None)
-                        all_timestamps.append(timestamp)
-                    else:
-                        # Convert timestamp to datetime if needed
-                        dt = datetime.fromtimestamp(timestamp)
-                        # Ensure it's timezone-naive
-                        if dt.tzinfo is not None:
-                            dt = dt.replace(tzinfo=None)
-                        all_timestamps.append(dt)
-            
-            if not all_timestamps:
-                return
+            # Candles are kept in time order, so each instrument's range is its first and last candle
+            ranges = [(candle_data[0]['timestamp'], candle_data[-1]['timestamp'])
+                      for candle_data in self.candle_data.values() if candle_data]
             
-            # Sort timestamps
-            all_timestamps.sort()
+            if not ranges:
+                return
             
             # Calculate time range
-            min_time = all_timestamps[0]
-            max_time = all_timestamps[-1]
+            min_time = min(first for first, _ in ranges)
+            max_time = max(last for _, last in ranges)
+            # Ticks and limits only depend on the range - updates to the forming candle keep it
+            if (min_time, max_time) == self._x_axis_range:
+                return
             time_range = max_time - min_time
             
             # Debug logging
             self.logger.info(f"Time range: {min_time.strftime('%H:%M:%S')} to {max_time.strftime('%H:%M:%S')}")
             
-            # Convert to matplotlib date format
-            import matplotlib.dates as mdates
-            min_time_mpl = mdates.date2num(min_time)
-            max_time_mpl = mdates.date2num(max_time)
-            
-            # Custom formatter for time display
-            def time_formatter(x, pos):
-                # Convert matplotlib date number to datetime
-                dt = mdates.num2date(x)
-                # Display time as-is (assuming data is already in local timezone)
-                return dt.strftime('%H:%M')
-            
-            # Initialize locators outside conditional blocks to avoid UnboundLocalError
-            minute_locator = mdates.MinuteLocator(interval=15)
-            hour_locator = mdates.HourLocator(interval=1)
-            
             # Set up time formatting based on data range
             if time_range.total_seconds() <= 3600:  # Less than 1 hour
                 # Create custom 5-minute intervals starting from 9:21
@@ -952,24 +1234,23 @@ class LiveChartVisualizer:
                 if min_time < start_tick:
                     start_tick = start_tick - timedelta(days=1) if min_time.hour < 9 else start_tick
                 
-                # Create custom tick positions
-                ticks = []
-                current_tick = start_tick
-                while current_tick <= max_time + timedelta(minutes=5):
-                    ticks.append(current_tick)
-                    current_tick += timedelta(minutes=5)
+                # Create custom tick positions directly as matplotlib dates - an integer tick count
+                # keeps the float steps from drifting past the last tick
+                tick_step = timedelta(minutes=5)
+                tick_count = max((max_time + tick_step - start_tick) // tick_step + 1, 0)
+                ticks = mdates.date2num(start_tick) + np.arange(tick_count) * (5 / (24 * 60))
                 
                 # Set custom ticks
-                self.price_ax.set_xticks([mdates.date2num(t) for t in ticks])
+                self.price_ax.set_xticks(ticks)
             elif time_range.total_seconds() <= 14400:  # Less than 4 hours
                 # Show 15-minute intervals
-                self.price_ax.xaxis.set_major_locator(minute_locator)
+                self.price_ax.xaxis.set_major_locator(self._minute_locator)
             else:
                 # Show 1-hour intervals
-                self.price_ax.xaxis.set_major_locator(hour_locator)
+                self.price_ax.xaxis.set_major_locator(self._hour_locator)
             
             # Apply the time formatter
-            self.price_ax.xaxis.set_major_formatter(plt.FuncFormatter(time_formatter))
+            self.price_ax.xaxis.set_major_formatter(self._time_formatter)
             
             # Rotate x-axis labels for better readability
             self.price_ax.tick_params(axis='x', rotation=45)
@@ -997,14 +1278,7 @@ class LiveChartVisualizer:
             # Ensure there's enough space for rotated labels
             self.price_ax.margins(x=0.02, y=0.05)
             
-            # Force matplotlib to update the axis
-            if time_range.total_seconds() <= 3600:
-                # For 1-hour range, use custom ticks (already set above)
-                pass  # Custom ticks are already set above
-            elif time_range.total_seconds() <= 14400:
-                self.price_ax.xaxis.set_major_locator(minute_locator)
-            else:
-                self.price_ax.xaxis.set_major_locator(hour_locator)
+            self._x_axis_range = (min_time, max_time)
             
         except Exception as e:
             self.logger.error(f"Error formatting X-axis time: {e}")
@@ -1012,7 +1286,6 @@ class LiveChartVisualizer:
             try:
                 self.price_ax.tick_params(axis='x', rotation=45, labelsize=8, pad=10)
                 # Set a simple time formatter
-                import matplotlib.dates as mdates
                 self.price_ax.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M'))
                 # Ensure proper spacing for rotated labels
                 self.price_ax.margins(x=0.02, y=0.05)
@@ -1029,18 +1302,14 @@ class LiveChartVisualizer:
             all_highs = []
             all_lows = []
             
-            for instrument_key, candle_data in self.candle_data.items():
-                if not candle_data:
-                    continue
-                
-                # Convert to DataFrame for easier handling
-                df = pd.DataFrame(list(candle_data))
-                if df.empty:
+            for instrument_key in self.candle_data:
+                ohlc = self.get_candle_arrays(instrument_key)
+                if ohlc is None or len(ohlc) == 0:
                     continue
                 
                 # Add high and low prices
-                all_highs.extend(df['high'].tolist())
-                all_lows.extend(df['low'].tolist())
+                all_highs.append(ohlc['h'].max())
+                all_lows.append(ohlc['l'].min())
             
             if not all_highs or not all_lows:
                 return
@@ -1062,134 +1331,236 @@ class LiveChartVisualizer:
             # Format Y-axis to show prices with appropriate precision
             self.price_ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'{x:.2f}'))
             
-            self.logger.debug(f"Updated Y-axis scale: {y_min:.2f} to {y_max:.2f}")
+            self.logger.debug("Updated Y-axis scale: %.2f to %.2f", y_min, y_max)
             
         except Exception as e:
             self.logger.error(f"Error updating Y-axis scale: {e}")
     
-    def _plot_candlesticks(self, df, instrument_key):
-        """Plot candlestick chart"""
+    def _plot_candlesticks(self, candles, instrument_key):
+        """Plot candlestick chart
+        
+        candles is the instrument's candle sequence (or a DataFrame of it), already in time order.
+        Returns True when the drawn candles changed.
+        """
         try:
-            if df.empty:
-                return
-            
-            # Ensure all timestamps are timezone-naive before sorting
-            def normalize_timestamp(ts):
-                if isinstance(ts, datetime):
-                    if ts.tzinfo is not None:
-                        return ts.replace(tzinfo=None)
-                    return ts
-                else:
-                    return datetime.fromtimestamp(ts)
-            
-            df['timestamp'] = df['timestamp'].apply(normalize_timestamp)
-            
-            # Sort by timestamp to ensure proper order
-            df = df.sort_values('timestamp')
-            
-            # Convert timestamps to matplotlib date format for proper plotting
-            import matplotlib.dates as mdates
-            df['timestamp_mpl'] = df['timestamp'].apply(lambda x: mdates.date2num(x))
-            
-            # Calculate candlestick width based on 5-minute interval
-            # For 5-minute candles, use a fixed width of 4 minutes (0.8 * 5 minutes)
-            candle_width = (5 * 60) * 0.8 / (24 * 3600)  # 5 minutes * 0.8 / seconds per day
-            
-            # Store candlestick patches for hover detection
-            if instrument_key not in self.candlestick_patches:
-                self.candlestick_patches[instrument_key] = []
+            if len(candles) == 0:
+                return False
+            
+            ohlc = None
+            if isinstance(candles, pd.DataFrame):
+                # External frames have not been through ingest normalization - convert
+                # whole columns, the dicts are only kept for hover lookups
+                frame = candles
+                timestamps = [self._normalize_timestamp(ts) for ts in frame['timestamp']]
+                timestamps_mpl = mdates.date2num(pd.DatetimeIndex(timestamps).values)
+                candles = [{**candle, 'timestamp': timestamp, 'ts_mpl': ts_mpl}
+                           for candle, timestamp, ts_mpl in zip(frame.to_dict('records'), timestamps, timestamps_mpl.tolist())]
+                ohlc = np.zeros(len(frame), dtype=OHLC_DTYPE)
+                ohlc['ts_mpl'] = timestamps_mpl
+                for field, column in (('o', 'open'), ('h', 'high'), ('l', 'low'), ('c', 'close'), ('v', 'volume')):
+                    if column in frame:
+                        ohlc[field] = frame[column].to_numpy(dtype=float)
+            
+            # Stored candles are read straight from the instrument's OHLC array
+            stored = candles is self.candle_data.get(instrument_key)
+            if stored:
+                ohlc = self.get_candle_arrays(instrument_key)
+            if ohlc is None or len(ohlc) != len(candles):
+                ohlc = np.array([self._candle_row({'volume': 0, **candle}) for candle in candles], dtype=OHLC_DTYPE)
+                stored = False
+            
+            # Only rows changed since the last draw get new geometry; historical candles are reused
+            geometry = self._candle_geometry.get(instrument_key)
+            dirty_from = self._ohlc_dirty_from.get(instrument_key, 0) if stored else 0
+            # Candles evicted from the front take their geometry with them; the rest is kept
+            dropped = self._ohlc_dropped.get(instrument_key, 0) if stored else 0
+            if geometry is not None and dropped:
+                geometry = {name: values[dropped:] for name, values in geometry.items()}
+            if dirty_from is None and geometry is not None and len(geometry['x']) == len(ohlc):
+                return False
+            if geometry is None or dirty_from is None or dirty_from > len(geometry['x']):
+                dirty_from = 0
+            
+            rows = self._candle_geometry_rows(ohlc[dirty_from:])
+            invalid_count = len(rows['valid']) - np.count_nonzero(rows['valid'])
+            if invalid_count:
+                self.logger.warning(f"Skipping {invalid_count} invalid candles for {instrument_key}")
+            if dirty_from > 0:
+                rows = {name: np.concatenate([geometry[name][:dirty_from], rows[name]]) for name in rows}
+            self._candle_geometry[instrument_key] = rows
+            # DataFrame plots are not tracked, so the next stored draw starts over
+            self._ohlc_dirty_from[instrument_key] = None if stored else 0
+            self._ohlc_dropped[instrument_key] = 0
+            
+            # Store candle data for hover detection - an in-place update of the forming
+            # candle keeps the same candle dicts and x positions, so the index stays valid
+            forming_only = (dirty_from > 0 and dirty_from == len(geometry['x']) - 1 == len(rows['x']) - 1
+                            and geometry['valid'][-1] == rows['valid'][-1])
+            valid = rows['valid']
+            if forming_only:
+                valid_candles = self._hover_index[instrument_key][1]
             else:
-                self.candlestick_patches[instrument_key].clear()
-            
-            for i, row in df.iterrows():
-                timestamp_mpl = row['timestamp_mpl']
-                timestamp = row['timestamp']
-                open_price = row['open']
-                high_price = row['high']
-                low_price = row['low']
-                close_price = row['close']
-                
-                # Skip invalid data
-                if (open_price <= 0 or high_price <= 0 or low_price <= 0 or close_price <= 0 or
-                    not all(isinstance(x, (int, float)) and not np.isnan(x) for x in [open_price, high_price, low_price, close_price])):
-                    self.logger.warning(f"Skipping invalid candle data: O={open_price}, H={high_price}, L={low_price}, C={close_price}")
-                    continue
-                
-                # Determine candle color (green for up, red for down)
-                candle_color = 'green' if close_price >= open_price else 'red'
-                edge_color = 'darkgreen' if close_price >= open_price else 'darkred'
-                
-                # Draw the wick lines (upper and lower shadows)
-                # Upper wick: from body top to high
-                body_top = max(open_price, close_price)
-                body_bottom = min(open_price, close_price)
-                
-                # Upper wick (if high > body top)
-                upper_wick = None
-                if high_price > body_top:
-                    upper_wick = self.price_ax.plot([timestamp_mpl, timestamp_mpl], [body_top, high_price], 
-                                     color='black', linewidth=1.5, alpha=0.8)
-                
-                # Lower wick (if low < body bottom)
-                lower_wick = None
-                if low_price < body_bottom:
-                    lower_wick = self.price_ax.plot([timestamp_mpl, timestamp_mpl], [low_price, body_bottom], 
-                                     color='black', linewidth=1.5, alpha=0.8)
-                
-                # Draw the open-close rectangle (body)
-                body_patch = None
-                if close_price >= open_price:
-                    # Bullish candle (close >= open)
-                    body_patch = self.price_ax.bar(timestamp_mpl, close_price - open_price, 
-                                    bottom=open_price, width=candle_width,
-                                    color=candle_color, edgecolor=edge_color, linewidth=1.5, alpha=0.8)
-                else:
-                    # Bearish candle (close < open)
-                    body_patch = self.price_ax.bar(timestamp_mpl, open_price - close_price, 
-                                    bottom=close_price, width=candle_width,
-                                    color=candle_color, edgecolor=edge_color, linewidth=1.5, alpha=0.8)
-                
-                # Store patches for hover detection
-                candle_patches = {
-                    'body': body_patch[0] if body_patch else None,
-                    'upper_wick': upper_wick[0] if upper_wick else None,
-                    'lower_wick': lower_wick[0] if lower_wick else None,
-                    'candle_data': {
-                        'timestamp': timestamp,
-                        'open': open_price,
-                        'high': high_price,
-                        'low': low_price,
-                        'close': close_price,
-                        'volume': row.get('volume', 0)
-                    }
-                }
-                self.candlestick_patches[instrument_key].append(candle_patches)
+                valid_candles = self._candle_objects(candles)[valid]
+            self._hover_index[instrument_key] = (rows['x'][valid], valid_candles, ohlc[valid])
+            self._hover_lookup = None
+            self._hover_generation += 1
+            
+            self._update_candle_paths()
             
             # No line chart overlay - pure candlestick chart
+            return True
             
         except Exception as e:
             self.logger.error(f"Error plotting candlesticks: {e}")
-            # Fallback to simple line chart
+            # Fallback to simple line chart - stored candles are already sorted, with x precomputed
             try:
-                # Normalize timestamps before sorting
-                def normalize_timestamp(ts):
-                    if isinstance(ts, datetime):
-                        if ts.tzinfo is not None:
-                            return ts.replace(tzinfo=None)
-                        return ts
-                    else:
-                        return datetime.fromtimestamp(ts)
-                
-                df['timestamp'] = df['timestamp'].apply(normalize_timestamp)
-                df_sorted = df.sort_values('timestamp')
-                
-                # Convert timestamps for matplotlib
-                import matplotlib.dates as mdates
-                timestamps_mpl = df_sorted['timestamp'].apply(lambda x: mdates.date2num(x))
-                self.price_ax.plot(timestamps_mpl, df_sorted['close'], 
-                                 color='blue', linewidth=2, label=instrument_key, alpha=0.7)
+                ohlc = self.get_candle_arrays(instrument_key)
+                if ohlc is not None and len(ohlc) == len(candles):
+                    timestamps_mpl, closes = ohlc['ts_mpl'], ohlc['c']
+                else:
+                    timestamps_mpl = [candle['ts_mpl'] for candle in candles]
+                    closes = [candle['close'] for candle in candles]
+                if instrument_key in self.price_lines:
+                    self.price_lines[instrument_key].set_data(timestamps_mpl, closes)
+                else:
+                    self.price_lines[instrument_key], = self.price_ax.plot(timestamps_mpl, closes, 
+                                     color='blue', linewidth=2, label=instrument_key, alpha=0.7)
+                self._needs_full_draw = True
             except Exception as fallback_error:
                 self.logger.error(f"Error in fallback line chart: {fallback_error}")
+            return True
+    
+    @staticmethod
+    def _candle_objects(candles):
+        """The candle dicts as a 1-D object array, for masking alongside the OHLC columns
+        
+        fromiter stores the references as they come; asarray would probe every dict as a
+        possible nested sequence first.
+        """
+        return np.fromiter(candles, dtype=object, count=len(candles))
+    
+    @staticmethod
+    def _candle_geometry_rows(ohlc, candle_width=None):
+        """Wick segments, body rectangles and colors for each row of an OHLC array
+        
+        Arrays stay one entry per candle (missing wicks and invalid candles are masked,
+        not dropped) so the rows of a single candle can be replaced in place.
+        candle_width (days, scalar or per row) defaults to the 5-minute body width.
+        """
+        x = ohlc['ts_mpl']
+        open_prices, high_prices, low_prices, close_prices = ohlc['o'], ohlc['h'], ohlc['l'], ohlc['c']
+        
+        # Skip invalid data (non-positive, NaN or infinite prices)
+        valid = (open_prices > 0) & (high_prices > 0) & (low_prices > 0) & (close_prices > 0)
+        valid &= np.isfinite(open_prices) & np.isfinite(high_prices) & np.isfinite(low_prices) & np.isfinite(close_prices)
+        
+        # Calculate candlestick width based on 5-minute interval
+        # For 5-minute candles, use a fixed width of 4 minutes (0.8 * 5 minutes)
+        if candle_width is None:
+            candle_width = (5 * 60) * 0.8 / (24 * 3600)  # 5 minutes * 0.8 / seconds per day
+        half_width = candle_width / 2
+        
+        body_top = np.maximum(open_prices, close_prices)
+        body_bottom = np.minimum(open_prices, close_prices)
+        
+        # All segments and rectangles are written into one preallocated block instead of
+        # being assembled from per-column stacks (the arrays are tiny on incremental updates)
+        # Layout per candle: [upper wick (2 points), lower wick (2 points), body (4 points)]
+        points = np.empty((len(ohlc), 8, 2))
+        points[:, :4, 0] = x[:, None]
+        
+        # Wicks: upper from body top to high, lower from low to body bottom (only where they exist)
+        points[:, 0, 1] = body_top
+        points[:, 1, 1] = high_prices
+        points[:, 2, 1] = low_prices
+        points[:, 3, 1] = body_bottom
+        
+        # Open-close rectangles (bodies): left-bottom, left-top, right-top, right-bottom
+        points[:, 4:6, 0] = (x - half_width)[:, None]
+        points[:, 6:8, 0] = (x + half_width)[:, None]
+        points[:, 4::3, 1] = body_bottom[:, None]
+        points[:, 5:7, 1] = body_top[:, None]
+        
+        upper_wicks = points[:, 0:2]
+        lower_wicks = points[:, 2:4]
+        body_verts = points[:, 4:8]
+        
+        return {
+            'x': x.copy(),
+            'ohlc': ohlc.copy(),  # Source rows, for downsampling when zoomed out
+            'valid': valid,
+            'upper_wicks': upper_wicks,
+            'has_upper': valid & (high_prices > body_top),
+            'lower_wicks': lower_wicks,
+            'has_lower': valid & (low_prices < body_bottom),
+            'body_verts': body_verts,
+            # Candle color (green for up, red for down)
+            'bullish': close_prices >= open_prices,
+        }
+    
+    @staticmethod
+    def _downsample_ohlc(ohlc, buckets):
+        """Merge time-ordered OHLC rows into equal-count buckets (first open, max high, min low, last close)
+        
+        Returns the bucket rows, centred on their time span, and a body width per bucket.
+        """
+        edges = np.linspace(0, len(ohlc), buckets + 1).astype(np.intp)
+        starts, ends = edges[:-1], edges[1:] - 1
+        x = ohlc['ts_mpl']
+        
+        merged = np.empty(buckets, dtype=OHLC_DTYPE)
+        merged['ts_mpl'] = (x[starts] + x[ends]) / 2
+        merged['o'] = ohlc['o'][starts]
+        merged['h'] = np.maximum.reduceat(ohlc['h'], starts)
+        merged['l'] = np.minimum.reduceat(ohlc['l'], starts)
+        merged['c'] = ohlc['c'][ends]
+        merged['v'] = np.add.reduceat(ohlc['v'], starts)
+        
+        # Same 80% body fill as a single candle, over the bucket's span plus one candle
+        widths = (x[ends] - x[starts] + (5 * 60) / (24 * 3600)) * 0.8
+        return merged, widths
+    
+    @staticmethod
+    def _compound_path(shapes, codes):
+        """One Path made of every shape in a (count, len(codes), 2) vertex array"""
+        if len(shapes) == 0:
+            return Path(np.empty((0, 2)))
+        return Path(shapes.reshape(-1, 2), np.tile(codes, len(shapes)))
+    
+    def _update_candle_paths(self):
+        """Load the visible part of the per-instrument candle geometry into the shared wick/body paths"""
+        x_min, x_max = self.price_ax.get_xlim()
+        wick_parts, body_parts, bullish_parts = [], [], []
+        for geometry in self._candle_geometry.values():
+            # Candles are in time order - keep the view plus a two-candle margin on each side
+            start = max(int(np.searchsorted(geometry['x'], x_min)) - 2, 0)
+            end = int(np.searchsorted(geometry['x'], x_max)) + 2
+            visible = slice(start, end)
+            valid = geometry['valid'][visible]
+            # More candles than the axes has pixel columns - draw min/max buckets instead
+            buckets = int(self.price_ax.bbox.width)
+            if buckets > 0 and np.count_nonzero(valid) > 2 * buckets:
+                ohlc, widths = self._downsample_ohlc(geometry['ohlc'][visible][valid], buckets)
+                geometry, visible = self._candle_geometry_rows(ohlc, widths), slice(None)
+                valid = geometry['valid']
+            wick_parts.append(geometry['upper_wicks'][visible][geometry['has_upper'][visible]])
+            wick_parts.append(geometry['lower_wicks'][visible][geometry['has_lower'][visible]])
+            body_parts.append(geometry['body_verts'][visible][valid])
+            bullish_parts.append(geometry['bullish'][visible][valid])
+        
+        if body_parts:
+            wick_segments = np.concatenate(wick_parts)
+            body_verts = np.concatenate(body_parts)
+            bullish = np.concatenate(bullish_parts)
+            # Closing vertex for each rectangle (its position is ignored by CLOSEPOLY)
+            body_verts = np.concatenate([body_verts, body_verts[:, :1]], axis=1)
+            body_shapes = (body_verts[~bullish], body_verts[bullish])
+        else:
+            wick_segments, body_shapes = [], ([], [])
+        
+        self._wick_patch.set_path(self._compound_path(wick_segments, _WICK_CODES))
+        for patch, shapes in zip(self._body_patches, body_shapes):
+            patch.set_path(self._compound_path(shapes, _BODY_CODES))
     
     def start_chart(self):
         """Start the live chart"""
@@ -1199,11 +1570,12 @@ class LiveChartVisualizer:
         self.is_running = True
         self.stop_event.clear()
         
-        # Start animation with reduced frequency to prevent flickering
-        self.ani = animation.FuncAnimation(
-            self.fig, self._animate, interval=2000, blit=False, 
-            cache_frame_data=False, save_count=100
-        )
+        # Drive frames from the canvas timer - _animate blits against the background
+        # captured in _on_draw instead of letting FuncAnimation redraw the figure
+        if self.fig:
+            self.frame_timer = self.fig.canvas.new_timer(interval=self.frame_interval_ms)
+            self.frame_timer.add_callback(self._animate)
+            self.frame_timer.start()
         
         # Start datawarehouse timer for fetching live data
         self.start_datawarehouse_timer()
@@ -1218,8 +1590,9 @@ class LiveChartVisualizer:
         self.is_running = False
         self.stop_event.set()
         
-        if self.ani:
-            self.ani.event_source.stop()
+        if self.frame_timer:
+            self.frame_timer.stop()
+            self.frame_timer = None
         
         # Stop datawarehouse timer
         self.stop_datawarehouse_timer()
@@ -1235,7 +1608,11 @@ class LiveChartVisualizer:
         return self.current_prices.copy()
     
     def get_candle_data(self, instrument_key):
-        """Get candle data for a specific instrument"""
+        """Get candle data for a specific instrument
+        
+        Returns a new list of the candle dicts (copies every reference) - use
+        get_candle_arrays for per-frame or bulk numeric access.
+        """
         if instrument_key in self.candle_data:
             return list(self.candle_data[instrument_key])
         return []
@@ -1251,14 +1628,23 @@ class LiveChartVisualizer:
     
     def scroll_left(self, instrument_key):
         """Historical data scrolling disabled - only intraday data is displayed in grid 1"""
-        self.logger.debug("Historical data scrolling disabled")
+        self._log_scroll("Historical data scrolling disabled")
         return False
     
     def scroll_right(self, instrument_key):
         """Historical data scrolling disabled - only intraday data is displayed in grid 1"""
-        self.logger.debug("Historical data scrolling disabled")
+        self._log_scroll("Historical data scrolling disabled")
         return False
     
+    def _log_scroll(self, message):
+        """Debug-log a scroll event at most once per scroll_log_interval_s (held keys repeat fast)"""
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
+        now = time.monotonic()
+        if now - self._last_scroll_log >= self.scroll_log_interval_s:
+            self._last_scroll_log = now
+            self.logger.debug(message)
+    
     def _update_display_data(self, instrument_key):
         """Historical data display disabled - only intraday data is displayed in grid 1"""
         self.logger.debug("Historical data display disabled")
@@ -1267,30 +1653,39 @@ class LiveChartVisualizer:
     def process_data_queue(self):
         """Manually process the data queue (useful for testing)"""
         try:
-            while not self.data_queue.empty():
-                try:
-                    data = self.data_queue.get_nowait()
-                    self._update_candle_data(
-                        data['instrument'],
-                        data['price'],
-                        data['volume'],
-                        data['timestamp']
-                    )
-                except queue.Empty:
-                    break
+            batch = self._drain_data_queue()
+            if not batch:
+                return
+            self._apply_tick_batch(batch)
+            
+            # One redraw for the whole batch instead of one per tick - with the next frame when
+            # the frame timer is running
+            if self.is_running:
+                self.request_chart_update()
         except Exception as e:
             self.logger.error(f"Error processing data queue: {e}")
     
+    def request_chart_update(self):
+        """Redraw with the next animation frame, or right away if no frame timer drives the chart
+        
+        Data loads use this so that back-to-back requests (and ticks queued meanwhile)
+        share one redraw; interactive changes use force_chart_update.
+        """
+        if self.frame_timer is not None and type(self.frame_timer) is not TimerBase:
+            self._pending_redraw = True
+        else:
+            self.force_chart_update()
+    
     def force_chart_update(self):
         """Force an immediate chart update"""
         if self.price_ax:
             try:
                 self._draw_charts()
-                # Force matplotlib to redraw
-                if hasattr(self, 'fig') and self.fig:
-                    self.fig.canvas.draw_idle()
+                # Blit unless limits/layout changed (then one full redraw recaptures the background)
+                if self.fig:
+                    self._render_frame()
                     # Setup tooltips after chart is ready
-                    if not hasattr(self, 'tooltip_annotation') or self.tooltip_annotation is None:
+                    if self.tooltip_annotation is None:
                         self._setup_tooltips()
             except Exception as e:
                 self.logger.error(f"Error forcing chart update: {e}")
@@ -1303,26 +1698,12 @@ class LiveChartVisualizer:
                 self.start_chart()
                 return True
             
-            # Check if animation is still active
-            if hasattr(self, 'ani') and self.ani and hasattr(self.ani, 'event_source'):
-                # Check if the animation event source is still running
-                # TimerTk doesn't have is_alive(), so we check if it's still active differently
-                try:
-                    if hasattr(self.ani.event_source, 'is_alive'):
-                        if not self.ani.event_source.is_alive():
-                            self.logger.warning("Chart animation stopped, restarting...")
-                            self.start_chart()
-                            return True
-                    else:
-                        # For TimerTk, check if the animation is still running by checking the interval
-                        if not self.ani.event_source.interval:
-                            self.logger.warning("Chart animation stopped, restarting...")
-                            self.start_chart()
-                            return True
-                except Exception as e:
-                    self.logger.warning(f"Error checking animation status: {e}, restarting...")
-                    self.start_chart()
-                    return True
+            # Check if the frame timer is still active
+            if self.fig and self.frame_timer is None:
+                self.logger.warning("Chart animation stopped, restarting...")
+                self.is_running = False
+                self.start_chart()
+                return True
             
             return True
         except Exception as e:
@@ -1334,9 +1715,9 @@ class LiveChartVisualizer:
         try:
             if self.is_running:
                 self._draw_charts()
-                # Force matplotlib to redraw
-                if hasattr(self, 'fig') and self.fig:
-                    self.fig.canvas.draw_idle()
+                # Blit unless limits/layout changed (then one full redraw recaptures the background)
+                if self.fig:
+                    self._render_frame()
                 self.logger.debug("Chart data refreshed")
         except Exception as e:
             self.logger.error(f"Error refreshing chart data: {e}")
@@ -1349,7 +1730,7 @@ class LiveChartVisualizer:
                 return
             
             # Check if tooltips are already set up
-            if hasattr(self, 'tooltip_annotation') and self.tooltip_annotation is not None:
+            if self.tooltip_annotation is not None:
                 self.logger.info("Tooltips already initialized")
                 return
             
@@ -1366,14 +1747,11 @@ class LiveChartVisualizer:
                                                                        edgecolor="navy",
                                                                        linewidth=2,
                                                                        alpha=0.95),
-                                                               arrowprops=dict(arrowstyle="->",
-                                                                             connectionstyle="arc3,rad=0",
-                                                                             color="navy",
-                                                                             linewidth=2),
                                                                fontsize=11,
                                                                fontweight='bold',
                                                                color="navy",
-                                                               visible=False)
+                                                               visible=False,
+                                                               animated=True)
             except Exception as e:
                 self.logger.warning(f"Could not initialize tooltip annotation: {e}")
                 self.tooltip_annotation = None
@@ -1386,6 +1764,45 @@ class LiveChartVisualizer:
             traceback.print_exc()
     
     def _on_hover(self, event):
+        """Coalesce mouse motion - only the latest position is processed, at most ~30 times a second"""
+        try:
+            self._hover_event = event
+            if self._hover_pending:
+                return
+            
+            if self._hover_timer is None:
+                self._hover_timer = self.fig.canvas.new_timer(interval=self.hover_interval_ms)
+                self._hover_timer.single_shot = True
+                self._hover_timer.add_callback(self._flush_hover)
+            
+            if type(self._hover_timer) is TimerBase:
+                # Canvas without an event loop (e.g. Agg) - timers never fire
+                self._flush_hover()
+                return
+            
+            self._hover_pending = True
+            self._hover_timer.start()
+            
+        except Exception as e:
+            self.logger.error(f"Error in hover event: {e}")
+    
+    def _flush_hover(self):
+        """Process the most recent motion event queued by _on_hover"""
+        self._hover_pending = False
+        event, self._hover_event = self._hover_event, None
+        if event is None:
+            return
+        
+        # Nothing to redo if the cursor has not moved in data coordinates and the
+        # candles under it are unchanged
+        position = (event.inaxes, event.xdata, event.ydata)
+        state = self._hover_state
+        if state is not None and state[0] == position and state[1] == self._hover_generation:
+            return
+        self._process_hover(event)
+        self._hover_state = (position, self._hover_generation)
+    
+    def _process_hover(self, event):
         """Handle mouse hover events for tooltips and crosshair"""
         try:
             if not self.tooltip_annotation or not self.price_ax:
@@ -1393,15 +1810,18 @@ class LiveChartVisualizer:
             
             # Check if mouse is over the chart
             if event.inaxes != self.price_ax:
+                # All overlays are animated - restoring the blit background erases them
+                overlays_visible = bool(self._visible_overlays())
                 self.tooltip_annotation.set_visible(False)
                 self._hide_crosshair()
                 self._hide_hover_labels()
-                self.fig.canvas.draw_idle()
+                if overlays_visible:
+                    self._render_frame()
                 return
             
             # Update crosshair position
             self._update_crosshair(event.xdata, event.ydata)
-            self.logger.debug(f"Crosshair updated at x={event.xdata}, y={event.ydata}")
+            self.logger.debug("Crosshair updated at x=%s, y=%s", event.xdata, event.ydata)
             
             # Find the closest candlestick
             closest_candle = self._find_closest_candlestick(event.xdata, event.ydata)
@@ -1409,13 +1829,14 @@ class LiveChartVisualizer:
             if closest_candle:
                 # Show tooltip
                 self._show_tooltip(event, closest_candle)
-                self.logger.debug(f"Hover tooltip shown for {closest_candle['instrument']}")
+                self.logger.debug("Hover tooltip shown for %s", closest_candle['instrument'])
             else:
                 # Hide tooltip and labels
-                if self.tooltip_annotation and hasattr(self.tooltip_annotation, 'set_visible'):
-                    self.tooltip_annotation.set_visible(False)
+                self.tooltip_annotation.set_visible(False)
                 self._hide_hover_labels()
-                self.fig.canvas.draw_idle()
+            
+            # One blit for crosshair, labels and tooltip
+            self._render_frame()
                 
         except Exception as e:
             self.logger.error(f"Error in hover event: {e}")
@@ -1447,12 +1868,12 @@ class LiveChartVisualizer:
             if closest_candle:
                 # Show tooltip on click
                 self._show_tooltip(event, closest_candle)
+                self._render_frame()
                 self.logger.info(f"Tooltip shown on click for {closest_candle['instrument']}")
             else:
-                # Hide tooltip if no candle found
-                if self.tooltip_annotation and hasattr(self.tooltip_annotation, 'set_visible'):
-                    self.tooltip_annotation.set_visible(False)
-                    self.fig.canvas.draw_idle()
+                # Hide tooltip if no candle found - it is animated, so a blit is enough
+                self.tooltip_annotation.set_visible(False)
+                self._render_frame()
                 self.logger.debug("Click event: no closest candle found")
                 
         except Exception as e:
@@ -1460,82 +1881,96 @@ class LiveChartVisualizer:
             import traceback
             traceback.print_exc()
     
+    def _build_hover_lookup(self):
+        """Merge the per-instrument hover indexes into one table sorted by candle x
+        
+        Rebuilt lazily after the drawn candles change, so a mouse event is a single
+        searchsorted over all instruments.
+        """
+        instruments = list(self._hover_index)
+        parts = [self._hover_index[instrument_key] for instrument_key in instruments]
+        x = np.concatenate([candle_x for candle_x, _, _ in parts])
+        prices = np.concatenate([ohlc for _, _, ohlc in parts])
+        candles = np.concatenate([candle_objects for _, candle_objects, _ in parts])
+        counts = np.array([len(candle_x) for candle_x, _, _ in parts])
+        instrument_codes = np.repeat(np.arange(len(parts)), counts)
+        
+        # Each instrument's candles are already in time order - only a merge needs sorting
+        order = np.argsort(x, kind='stable') if len(parts) > 1 else slice(None)
+        self._hover_lookup = {
+            'instruments': instruments,
+            'x': x[order],
+            'instrument': instrument_codes[order],
+            'candle': candles[order],
+            # One contiguous (x, high, low, close) row per candle, so a hover window
+            # is a single slice
+            'rows': np.column_stack((x, prices['h'], prices['l'], prices['c']))[order],
+        }
+        return self._hover_lookup
+    
     def _find_closest_candlestick(self, x, y):
-        """Find the closest candlestick to the mouse position using stored patches"""
+        """Find the closest candlestick to the mouse position
+        
+        Uses the x-sorted candles of all instruments, so only the few candles
+        within the hover threshold of the cursor are examined.
+        """
         try:
-            if not self.candlestick_patches or x is None or y is None:
+            if not self._hover_index or x is None or y is None:
                 return None
             
-            closest_candle = None
-            min_distance = float('inf')
-            
-            # Check all instruments
-            for instrument_key, patches_list in self.candlestick_patches.items():
-                if not patches_list:
-                    continue
-                
-                # Check each candlestick patch
-                for patch_data in patches_list:
-                    candle_data = patch_data['candle_data']
-                    candle_time = candle_data['timestamp']
-                    
-                    # Convert timestamp to matplotlib time format
-                    if isinstance(candle_time, datetime):
-                        candle_x = candle_time
-                    else:
-                        candle_x = datetime.fromtimestamp(candle_time)
-                    
-                    # Convert to matplotlib date format for comparison
-                    import matplotlib.dates as mdates
-                    candle_x_mpl = mdates.date2num(candle_x)
-                    
-                    # Calculate candlestick bounds
-                    # For 5-minute candles, width is approximately 0.0035 days (5 minutes)
-                    candle_width = 0.0035  # 5 minutes in days
-                    candle_left = candle_x_mpl - candle_width/2
-                    candle_right = candle_x_mpl + candle_width/2
-                    
-                    # Check if mouse is within candlestick time bounds
-                    if candle_left <= x <= candle_right:
-                        # Check if mouse is within candlestick price bounds
-                        high_price = candle_data['high']
-                        low_price = candle_data['low']
-                        
-                        if low_price <= y <= high_price:
-                            # Mouse is within both time and price bounds of this candlestick
-                            closest_candle = {
-                                'instrument': instrument_key,
-                                'candle': candle_data,
-                                'x': candle_x,
-                                'y': candle_data['close']
-                            }
-                            return closest_candle  # Return immediately for exact match
-                    
-                    # If not within bounds, calculate distance for fallback
-                    time_diff = abs(x - candle_x_mpl)
-                    price_diff = abs(y - candle_data['close'])
-                    
-                    # Use time difference as primary factor
-                    time_weight = 1.0
-                    price_weight = 0.001  # Very low weight for price
-                    
-                    distance = time_diff * time_weight + price_diff * price_weight
-                    
-                    if distance < min_distance:
-                        min_distance = distance
-                        closest_candle = {
-                            'instrument': instrument_key,
-                            'candle': candle_data,
-                            'x': candle_x,
-                            'y': candle_data['close']
-                        }
+            lookup = self._hover_lookup or self._build_hover_lookup()
             
+            # For 5-minute candles, width is approximately 0.0035 days (5 minutes)
+            half_width = 0.0035 / 2
             # Only return closest candle if it's very close (within 0.01 days = 14.4 minutes)
-            # This ensures tooltip only shows when cursor is very close to a candlestick
-            if min_distance < 0.01:  # Within 14.4 minutes
-                return closest_candle
+            max_distance = 0.01
+            price_weight = 0.001  # Very low weight for price
+            
+            # Most motion events stay inside the candle matched last time - a rebuilt
+            # lookup (new or changed candles) invalidates it
+            last_hit = self._last_hit
+            if last_hit is not None and last_hit[0] is lookup:
+                candle_x, high, low, _ = lookup['rows'][last_hit[1]].tolist()
+                if abs(x - candle_x) <= half_width and low <= y <= high:
+                    return last_hit[2]
+            
+            # Candles further than max_distance in time can never qualify
+            start, end = np.searchsorted(lookup['x'], (x - max_distance, x + max_distance))
+            if start == end:
+                return None
             
-            return None
+            # The window only holds a few candles - one scalar pass over them is cheaper
+            # than the per-call overhead of building NumPy temporaries
+            nearby = slice(start, end)
+            match = None
+            inside = False
+            best_distance = max_distance
+            for offset, (candle_x, high, low, close) in enumerate(lookup['rows'][nearby].tolist()):
+                time_diff = abs(x - candle_x)
+                # Mouse within both time and price bounds of a candlestick - take the first one
+                if time_diff <= half_width and low <= y <= high:
+                    match = start + offset
+                    inside = True
+                    break
+                # Otherwise the nearest one (time difference is the primary factor)
+                distance = time_diff + abs(y - close) * price_weight
+                if distance < best_distance:
+                    best_distance = distance
+                    match = start + offset
+            if match is None:
+                return None
+            
+            instrument_key = lookup['instruments'][lookup['instrument'][match]]
+            candle = lookup['candle'][match]
+            result = {
+                'instrument': instrument_key,
+                'candle': candle,
+                'x': candle['timestamp'],
+                'y': candle['close']
+            }
+            if inside:
+                self._last_hit = (lookup, match, result)
+            return result
             
         except Exception as e:
             self.logger.error(f"Error finding closest candlestick: {e}")
@@ -1550,43 +1985,17 @@ class LiveChartVisualizer:
             candle = candle_info['candle']
             instrument = candle_info['instrument']
             
-            # Format timestamp
-            timestamp = candle['timestamp']
-            if isinstance(timestamp, datetime):
-                time_str = timestamp.strftime("%Y-%m-%d %H:%M:%S")
+            # Hovering the same (unchanged) candle again - reuse the formatted text,
+            # and skip the label update entirely if it is still on screen
+            cache_key = (instrument, candle['ts_mpl'], candle['open'], candle['high'], candle['low'], candle['close'])
+            cached_key, cached_text = self._tooltip_cache
+            if cache_key == cached_key:
+                if self.time_label is not None and self.time_label.get_visible():
+                    return
+                time_str, diff_value, diff_symbol = cached_text
             else:
-                time_str = datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M:%S")
-            
-            # Calculate diff value (previous candle close - current candle close)
-            diff_value = 0
-            diff_symbol = "📊"
-            
-            try:
-                # Get the current candle's index in the patches list
-                current_instrument = candle_info['instrument']
-                patches_list = self.candlestick_patches.get(current_instrument, [])
-                
-                # Find current candle index
-                current_index = -1
-                for i, patch_data in enumerate(patches_list):
-                    if patch_data['candle_data'] == candle:
-                        current_index = i
-                        break
-                
-                # If we found the current candle and there's a previous one
-                if current_index > 0:
-                    previous_candle = patches_list[current_index - 1]['candle_data']
-                    diff_value = candle['close'] - previous_candle['close']
-                    diff_symbol = "📈" if diff_value >= 0 else "📉"
-                else:
-                    # No previous candle, show 0 diff
-                    diff_value = 0
-                    diff_symbol = "📊"
-                    
-            except Exception as e:
-                # Fallback to close - open if there's an error
-                diff_value = candle['close'] - candle['open']
-                diff_symbol = "📈" if diff_value >= 0 else "📉"
+                time_str, diff_value, diff_symbol = self._format_tooltip_text(instrument, candle)
+                self._tooltip_cache = (cache_key, (time_str, diff_value, diff_symbol))
             
             # Create/update OHLC labels at the top
             self._update_ohlc_labels(candle, diff_value, diff_symbol)
@@ -1594,62 +2003,65 @@ class LiveChartVisualizer:
             # Create/update time label at the bottom
             self._update_time_label(time_str)
             
-            # Force redraw
-            if hasattr(self, 'fig') and self.fig:
-                self.fig.canvas.draw_idle()
+            # The caller blits the updated overlays
             
         except Exception as e:
             self.logger.error(f"Error showing tooltip: {e}")
     
+    def _format_tooltip_text(self, instrument, candle):
+        """Time text and close-to-close diff (with its symbol) for a hovered candle"""
+        # Format timestamp
+        time_str = _format_candle_time(candle['timestamp'])
+        
+        # Calculate diff value (current candle close - previous candle close)
+        try:
+            # Previous close from the hover index columns (candles sorted by x)
+            candle_x, candles, ohlc = self._hover_index[instrument]
+            current_index = int(np.searchsorted(candle_x, candle['ts_mpl']))
+            
+            if 0 < current_index < len(candles) and candles[current_index] is candle:
+                diff_value = candle['close'] - float(ohlc['c'][current_index - 1])
+                diff_symbol = "📈" if diff_value >= 0 else "📉"
+            else:
+                # No previous candle, show 0 diff
+                diff_value = 0
+                diff_symbol = "📊"
+                
+        except Exception as e:
+            # Fallback to close - open if there's an error
+            diff_value = candle['close'] - candle['open']
+            diff_symbol = "📈" if diff_value >= 0 else "📉"
+        
+        return time_str, diff_value, diff_symbol
+    
     def _update_ohlc_labels(self, candle, diff_value, diff_symbol):
         """Update OHLC labels at the top of the chart"""
         try:
             if not self.price_ax:
                 return
             
-            # Get chart bounds
-            xlim = self.price_ax.get_xlim()
-            ylim = self.price_ax.get_ylim()
-            
-            # Clear existing OHLC labels
-            for label in self.hover_labels.values():
-                if hasattr(label, 'remove'):
-                    label.remove()
-            self.hover_labels.clear()
-            
-            # Create OHLC labels at the top
-            top_y = ylim[1] - (ylim[1] - ylim[0]) * 0.05  # 5% from top
-            
-            # Open label
-            self.hover_labels['open'] = self.price_ax.text(xlim[0] + (xlim[1] - xlim[0]) * 0.1, top_y, 
-                                                          f"O: ₹{candle['open']:.2f}", 
-                                                          fontsize=10, fontweight='bold', color='blue',
-                                                          bbox=dict(boxstyle="round,pad=0.3", facecolor="white", alpha=0.8))
-            
-            # High label
-            self.hover_labels['high'] = self.price_ax.text(xlim[0] + (xlim[1] - xlim[0]) * 0.3, top_y, 
-                                                          f"H: ₹{candle['high']:.2f}", 
-                                                          fontsize=10, fontweight='bold', color='green',
-                                                          bbox=dict(boxstyle="round,pad=0.3", facecolor="white", alpha=0.8))
-            
-            # Low label
-            self.hover_labels['low'] = self.price_ax.text(xlim[0] + (xlim[1] - xlim[0]) * 0.5, top_y, 
-                                                         f"L: ₹{candle['low']:.2f}", 
-                                                         fontsize=10, fontweight='bold', color='red',
-                                                         bbox=dict(boxstyle="round,pad=0.3", facecolor="white", alpha=0.8))
-            
-            # Close label
-            self.hover_labels['close'] = self.price_ax.text(xlim[0] + (xlim[1] - xlim[0]) * 0.7, top_y, 
-                                                           f"C: ₹{candle['close']:.2f}", 
-                                                           fontsize=10, fontweight='bold', color='purple',
-                                                           bbox=dict(boxstyle="round,pad=0.3", facecolor="white", alpha=0.8))
+            # Labels are created once (animated, in axes coordinates so they follow any
+            # zoom or scroll) and afterwards only get new text
+            if not self.hover_labels:
+                for key, x, color in (('open', 0.1, 'blue'), ('high', 0.3, 'green'), ('low', 0.5, 'red'),
+                                      ('close', 0.7, 'purple'), ('diff', 0.9, 'green')):
+                    self.hover_labels[key] = self.price_ax.text(
+                        x, 0.95, '', transform=self.price_ax.transAxes,  # 5% from top
+                        fontsize=10, fontweight='bold', color=color, animated=True,
+                        bbox=dict(boxstyle="round,pad=0.3", facecolor="white", alpha=0.8))
+            
+            self.hover_labels['open'].set_text(f"O: ₹{candle['open']:.2f}")
+            self.hover_labels['high'].set_text(f"H: ₹{candle['high']:.2f}")
+            self.hover_labels['low'].set_text(f"L: ₹{candle['low']:.2f}")
+            self.hover_labels['close'].set_text(f"C: ₹{candle['close']:.2f}")
             
             # Diff label
-            diff_color = 'green' if diff_value >= 0 else 'red'
-            self.hover_labels['diff'] = self.price_ax.text(xlim[0] + (xlim[1] - xlim[0]) * 0.9, top_y, 
-                                                          f"{diff_symbol} {diff_value:+.2f}", 
-                                                          fontsize=10, fontweight='bold', color=diff_color,
-                                                          bbox=dict(boxstyle="round,pad=0.3", facecolor="white", alpha=0.8))
+            self.hover_labels['diff'].set_text(f"{diff_symbol} {diff_value:+.2f}")
+            # Same up/down RGBA rows as the candle bodies - no color name to parse per hover
+            self.hover_labels['diff'].set_color(_BODY_FACE_RGBA[int(diff_value >= 0)])
+            
+            for label in self.hover_labels.values():
+                label.set_visible(True)
             
         except Exception as e:
             self.logger.error(f"Error updating OHLC labels: {e}")
@@ -1660,22 +2072,15 @@ class LiveChartVisualizer:
             if not self.price_ax:
                 return
             
-            # Get chart bounds
-            xlim = self.price_ax.get_xlim()
-            ylim = self.price_ax.get_ylim()
-            
-            # Remove existing time label
-            if self.time_label and hasattr(self.time_label, 'remove'):
-                self.time_label.remove()
-            
-            # Create time label at the bottom
-            bottom_y = ylim[0] + (ylim[1] - ylim[0]) * 0.05  # 5% from bottom
-            center_x = (xlim[0] + xlim[1]) / 2
+            # Created once, centered 5% from the bottom in axes coordinates
+            if self.time_label is None:
+                self.time_label = self.price_ax.text(0.5, 0.05, '', transform=self.price_ax.transAxes,
+                                                   fontsize=12, fontweight='bold', color='black',
+                                                   ha='center', va='bottom', animated=True,
+                                                   bbox=dict(boxstyle="round,pad=0.5", facecolor="lightblue", alpha=0.9))
             
-            self.time_label = self.price_ax.text(center_x, bottom_y, time_str, 
-                                               fontsize=12, fontweight='bold', color='black',
-                                               ha='center', va='bottom',
-                                               bbox=dict(boxstyle="round,pad=0.5", facecolor="lightblue", alpha=0.9))
+            self.time_label.set_text(time_str)
+            self.time_label.set_visible(True)
             
         except Exception as e:
             self.logger.error(f"Error updating time label: {e}")
@@ -1685,14 +2090,11 @@ class LiveChartVisualizer:
         try:
             # Hide OHLC labels
             for label in self.hover_labels.values():
-                if hasattr(label, 'remove'):
-                    label.remove()
-            self.hover_labels.clear()
+                label.set_visible(False)
             
             # Hide time label
-            if self.time_label and hasattr(self.time_label, 'remove'):
-                self.time_label.remove()
-            self.time_label = None
+            if self.time_label is not None:
+                self.time_label.set_visible(False)
             
         except Exception as e:
             self.logger.error(f"Error hiding hover labels: {e}")
@@ -1756,24 +2158,22 @@ class LiveChartVisualizer:
             ylim = self.price_ax.get_ylim()
             
             # Create or update vertical line using plot method for better visibility
-            if self.crosshair_vline is None or not hasattr(self.crosshair_vline, 'set_xdata'):
-                self.crosshair_vline, = self.price_ax.plot([x, x], [ylim[0], ylim[1]], color='darkgrey', linestyle='--', alpha=0.7, linewidth=1)
+            if self.crosshair_vline is None:
+                self.crosshair_vline, = self.price_ax.plot([x, x], [ylim[0], ylim[1]], color='darkgrey', linestyle='--', alpha=0.7, linewidth=1, animated=True)
             else:
                 self.crosshair_vline.set_xdata([x, x])
                 self.crosshair_vline.set_ydata([ylim[0], ylim[1]])
                 self.crosshair_vline.set_visible(True)
             
             # Create or update horizontal line using plot method for better visibility
-            if self.crosshair_hline is None or not hasattr(self.crosshair_hline, 'set_ydata'):
-                self.crosshair_hline, = self.price_ax.plot([xlim[0], xlim[1]], [y, y], color='darkgrey', linestyle='--', alpha=0.7, linewidth=1)
+            if self.crosshair_hline is None:
+                self.crosshair_hline, = self.price_ax.plot([xlim[0], xlim[1]], [y, y], color='darkgrey', linestyle='--', alpha=0.7, linewidth=1, animated=True)
             else:
                 self.crosshair_hline.set_xdata([xlim[0], xlim[1]])
                 self.crosshair_hline.set_ydata([y, y])
                 self.crosshair_hline.set_visible(True)
             
-            # Force redraw to make crosshair visible
-            if hasattr(self, 'fig') and self.fig:
-                self.fig.canvas.draw_idle()
+            # Animated - the caller blits it
             
         except Exception as e:
             self.logger.error(f"Error updating crosshair: {e}")
@@ -1802,12 +2202,8 @@ class LiveChartVisualizer:
             center_y = (ylim[0] + ylim[1]) / 2
             
             # Create test crosshair
-            self.crosshair_vline, = self.price_ax.plot([center_x, center_x], [ylim[0], ylim[1]], color='darkgrey', linestyle='--', alpha=0.7, linewidth=1)
-            self.crosshair_hline, = self.price_ax.plot([xlim[0], xlim[1]], [center_y, center_y], color='darkgrey', linestyle='--', alpha=0.7, linewidth=1)
-            
-            # Force redraw
-            if hasattr(self, 'fig') and self.fig:
-                self.fig.canvas.draw_idle()
+            self._update_crosshair(center_x, center_y)
+            self._render_frame()
             
             self.logger.info("Test crosshair created at chart center")
             
@@ -1821,33 +2217,12 @@ class LiveChartVisualizer:
                 # Format as HH:MM:SS
                 return self.last_update_time.strftime("%H:%M:%S")
             
-            # Fallback: find the most recent timestamp from candle data
-            if not self.candle_data:
-                return None
-            
-            latest_timestamp = None
-            for instrument_key, candle_list in self.candle_data.items():
-                if candle_list:
-                    # Get the last candle (most recent)
-                    last_candle = candle_list[-1]
-                    candle_time = last_candle['timestamp']
-                    
-                    # Convert to datetime if needed
-                    if isinstance(candle_time, datetime):
-                        timestamp = candle_time
-                    else:
-                        timestamp = datetime.fromtimestamp(candle_time)
-                    
-                    # Ensure timestamp is timezone-naive
-                    if timestamp.tzinfo is not None:
-                        timestamp = timestamp.replace(tzinfo=None)
-                    
-                    if latest_timestamp is None or timestamp > latest_timestamp:
-                        latest_timestamp = timestamp
-            
-            if latest_timestamp:
+            # Fallback: the most recent candle time from the columnar OHLC arrays
+            latest = [ohlc['ts_mpl'][-1] for ohlc in map(self.get_candle_arrays, self.candle_data) 
+                      if ohlc is not None and len(ohlc)]
+            if latest:
                 # Format as HH:MM:SS
-                return latest_timestamp.strftime("%H:%M:%S")
+                return mdates.num2date(max(latest)).strftime("%H:%M:%S")
             
             return None
             
@@ -1870,6 +2245,45 @@ class TkinterChartApp:
         self.grid2_crosshair_vline = None  # Vertical crosshair line for chart 2
         self.grid2_crosshair_hline = None  # Horizontal crosshair line for chart 2
         
+        # Payoff chart - one figure and canvas reused by every display_trade_payoff_graph call
+        self._payoff_fig = None
+        self._payoff_ax = None
+        self._payoff_canvas = None
+        self._payoff_hover_cid = None  # motion_notify_event connection of the current payoff hover
+        self._payoff_spot_line = None  # Animated spot price line - live updates blit it
+        self._payoff_spot_text = None  # Animated spot price label near the x-axis
+        self._payoff_background = None  # Payoff figure pixels without the spot artists
+        self._payoff_background_bounds = None  # Figure bbox the payoff background was captured at
+        self._payoff_line = None  # Payoff curve - updated with set_data on each strategy
+        self._payoff_strike_lines = None  # LineCollection of strike markers
+        self._payoff_details_text = None  # Strategy details box, updated on hover
+        self._payoff_fills = []  # Profit/loss fill_between collections of the current strategy
+        self._payoff_static_key = None  # Inputs of the cached static part of the details box
+        self._payoff_layout_size = None  # Figure size the payoff tight_layout was computed for
+        self._payoff_info_label = None  # Trade info label below the payoff chart
+        self._trade_info_var = None  # Text of _payoff_info_label
+        
+        # Grid 3 technical chart - persistent lines, created on the first data
+        self._tech_lines = None
+        self._tech_legend_labels = None  # Labels in the current legend
+        self._payoff_static_text = ""  # Details box text without the Current P&L line
+        self._original_strategy_text = ""  # Details box text shown when not hovering
+        
+        # Grid 2 default content - built once, hidden while a strategy is shown
+        self._grid2_default = None
+        self._grid2_default_content = None
+        self._grid2_default_trade_all = None
+        self._grid2_default_update_label = None
+        
+        # Chart scrolling - key repeats are coalesced into one redraw per frame
+        self.scroll_redraw_delay_ms = 16
+        self._scroll_pending = None  # Tk after() id of the scheduled _flush_scroll
+        self.status_label = None  # Created in setup_ui
+        self._status_message = None  # Last message shown on the status label
+        
+        # Seconds on_closing waits for a clean exit before forcing one
+        self.shutdown_grace_s = 2.0
+        
         self.root = tk.Tk()
         self.root.title("Live Market Data Chart - 2x2 Grid Layout")
         
@@ -2026,8 +2440,7 @@ class TkinterChartApp:
     def _on_live_data_update(self, instrument_key, price, volume):
         """Handle live data updates for payoff chart refresh with 5-second interval"""
         try:
-            import time
-            current_time = time.time()
+            current_time = time.monotonic()  # Same clock as the chart's last_grid2_update
             
             # Get the latest price from datawarehouse to ensure consistency
             datawarehouse_price = None
@@ -2038,18 +2451,16 @@ class TkinterChartApp:
             actual_price = datawarehouse_price if datawarehouse_price is not None else price
             
             # Store the latest live data in the chart's pending data
-            if hasattr(self.chart, 'pending_live_data'):
-                self.chart.pending_live_data[instrument_key] = {
-                    'price': actual_price,
-                    'volume': volume,
-                    'timestamp': current_time
-                }
+            if hasattr(self.chart, 'pending_price'):
+                self.chart.pending_price[instrument_key] = actual_price
+                self.chart.pending_volume[instrument_key] = volume
+                self.chart.pending_timestamp[instrument_key] = current_time
             
             # Log price source for debugging
             if datawarehouse_price is not None and datawarehouse_price != price:
-                self.logger.debug(f"Using datawarehouse price {actual_price} instead of live feed price {price}")
+                self.logger.debug("Using datawarehouse price %s instead of live feed price %s", actual_price, price)
             else:
-                self.logger.debug(f"Using live feed price {actual_price}")
+                self.logger.debug("Using live feed price %s", actual_price)
             
             # Update Grid 1 with latest price line immediately
             self._update_grid1_with_latest_price(instrument_key, actual_price)
@@ -2063,11 +2474,11 @@ class TkinterChartApp:
                 else:
                     # Log that we're storing data for later update
                     remaining_time = self.chart.grid2_update_interval - (current_time - self.chart.last_grid2_update)
-                    self.logger.debug(f"Storing live data for {instrument_key}: {actual_price} (Grid 2 update in {remaining_time:.1f}s)")
+                    self.logger.debug("Storing live data for %s: %s (Grid 2 update in %.1fs)", instrument_key, actual_price, remaining_time)
             else:
                 # Fallback: update immediately if interval attributes don't exist
                 self._update_grid2_with_live_data()
-                self.logger.debug(f"Updated Grid 2 immediately (no interval): {actual_price}")
+                self.logger.debug("Updated Grid 2 immediately (no interval): %s", actual_price)
                 
         except Exception as e:
             self.logger.error(f"Error handling live data update for payoff chart: {e}")
@@ -2080,12 +2491,12 @@ class TkinterChartApp:
                 # Use selective update to avoid blinking
                 if hasattr(self.chart, '_update_live_price_line_only'):
                     self.chart._update_live_price_line_only()
-                    self.logger.debug(f"Updated Grid 1 live price line: {price}")
+                    self.logger.debug("Updated Grid 1 live price line: %s", price)
                 else:
                     # Fallback to full update if selective method not available
                     if hasattr(self.chart, 'force_chart_update'):
                         self.chart.force_chart_update()
-                        self.logger.debug(f"Updated Grid 1 with latest price (full update): {price}")
+                        self.logger.debug("Updated Grid 1 with latest price (full update): %s", price)
             
         except Exception as e:
             self.logger.error(f"Error updating Grid 1 with latest price: {e}")
@@ -2098,21 +2509,17 @@ class TkinterChartApp:
                 return
             
             # Get the latest live data from the chart's pending data
-            if not hasattr(self.chart, 'pending_live_data') or not self.chart.pending_live_data:
+            if not getattr(self.chart, 'pending_price', None):
                 return
                 
-            # Find the most recent data (use the first available instrument)
-            latest_data = None
-            primary_instrument = list(self._main_app.instruments[self._main_app.broker_type].keys())[0]
-            for instrument_key, data in self.chart.pending_live_data.items():
-                if instrument_key == primary_instrument:
-                    if latest_data is None or data['timestamp'] > latest_data['timestamp']:
-                        latest_data = data
-            
-            if latest_data:
+            # Use the latest price of the primary (first configured) instrument
+            primary_instrument = next(iter(self._main_app.instruments[self._main_app.broker_type]))
+            latest_price = self.chart.pending_price.get(primary_instrument)
+            
+            if latest_price is not None:
                 # Update the payoff chart with new spot price
-                self._update_payoff_chart_spot_price(latest_data['price'])
-                self.logger.debug(f"Updated Grid 2 with live data: {latest_data['price']}")
+                self._update_payoff_chart_spot_price(latest_price)
+                self.logger.debug("Updated Grid 2 with live data: %s", latest_price)
                 
         except Exception as e:
             self.logger.error(f"Error updating Grid 2 with live data: {e}")
@@ -2123,112 +2530,117 @@ class TkinterChartApp:
             if not hasattr(self, '_current_payoff_data') or not self._current_payoff_data:
                 return
                 
-            # Check if Grid 2 has a matplotlib figure
-            if not hasattr(self, 'grid2_fig') or not self.grid2_fig:
+            # Check if Grid 2 still shows the payoff figure
+            if self._payoff_spot_line is None or getattr(self, 'grid2_fig', None) is not self._payoff_fig:
                 return
-                
-            # Update the spot price line in the chart
-            ax = self.grid2_fig.axes[0] if self.grid2_fig.axes else None
-            if ax:
-                # Remove any existing spot price lines and create a new one
-                # Get current y-limits BEFORE removing any lines to preserve them
-                original_ylim = ax.get_ylim()
-                
-                # Find and remove existing spot price lines and text
-                lines_to_remove = []
-                texts_to_remove = []
-                
-                # Find lines to remove (spot price lines)
-                # Look for red dashed lines (our spot price lines)
-                for line in ax.lines:
-                    try:
-                        # Check if this is a red dashed line (our spot price line)
-                        # Either by label or by visual properties
-                        line_label = getattr(line, '_label', '') or ''
-                        is_spot_line_by_label = 'Current Spot' in str(line_label)
-                        is_spot_line_by_props = (hasattr(line, 'get_color') and line.get_color() == 'red' and
-                                               hasattr(line, 'get_linestyle') and line.get_linestyle() == '--' and
-                                               hasattr(line, 'get_linewidth') and line.get_linewidth() == 2)
-                        
-                        if is_spot_line_by_label or is_spot_line_by_props:
-                            lines_to_remove.append(line)
-                    except Exception:
-                        # Skip if we can't get line properties
-                        pass
-                
-                # Remove the old spot price lines
-                for line in lines_to_remove:
-                    try:
-                        line.remove()
-                    except Exception:
-                        # Ignore errors when removing lines
-                        pass
-                
-                # Remove existing spot price text objects (to avoid duplicates)
-                # Only remove text objects that look like spot price values (numeric) and are positioned near the spot price
-                texts_to_remove = []
-                for text in ax.texts[:]:  # Create a copy to avoid modification during iteration
-                    try:
-                        # Check if text object is still valid
-                        if hasattr(text, 'get_text') and hasattr(text, 'remove'):
-                            text_content = str(text.get_text())
-                            # Check if this looks like a spot price (numeric value) and is positioned near the spot price line
-                            if (text_content.replace('.', '').replace('-', '').isdigit() and 
-                                hasattr(text, 'get_position')):
-                                text_pos = text.get_position()
-                                # Only remove if it's close to the spot price line (within 50 points)
-                                if abs(text_pos[0] - new_spot_price) < 50:
-                                    texts_to_remove.append(text)
-                    except Exception:
-                        # Skip if we can't get text content or text is invalid
-                        pass
-                
-                for text in texts_to_remove:
-                    try:
-                        if hasattr(text, 'remove'):
-                            text.remove()
-                    except Exception:
-                        # Ignore errors when removing text objects
-                        pass
-                
-                # Create a new spot price line using the original y-limits
-                ax.plot([new_spot_price, new_spot_price], [original_ylim[0], original_ylim[1]], 
-                       color='red', linestyle='--', linewidth=2, label='Current Spot')
-                
-                # Add/update spot price text near x-axis
-                try:
-                    text_y_position = original_ylim[0] + (original_ylim[1] - original_ylim[0]) * 0.05
-                    text_obj = ax.text(new_spot_price, text_y_position, f'{new_spot_price}', 
-                                     ha='center', va='bottom', fontsize=10, fontweight='bold', 
-                                     bbox=dict(boxstyle='round,pad=0.3', facecolor='white', alpha=0.8))
-                    
-                    # Ensure the text object is properly associated with the figure
-                    if hasattr(text_obj, 'set_figure'):
-                        text_obj.set_figure(ax.get_figure())
-                        
-                except Exception as e:
-                    self.logger.warning(f"Could not add spot price text: {e}")
-                
-                # Restore the original y-limits to prevent axis expansion
-                ax.set_ylim(original_ylim)
-                
-                # Preserve X-axis ticks at strike prices
-                if hasattr(self, 'current_trade') and self.current_trade:
-                    strikes = [leg.strike_price for leg in self.current_trade.legs]
-                    ax.set_xticks(strikes)
-                    ax.set_xticklabels([f'{strike}' for strike in strikes], rotation=45, ha='right')
-                
-                # Force chart refresh
-                self.grid2_fig.canvas.draw()
-                self.grid2_fig.canvas.flush_events()
-                
-                # Update the current spot price
-                self._current_spot_price = new_spot_price
-                
-                self.logger.debug(f"Updated payoff chart spot price to: {new_spot_price}")
+            
+            # Move the animated spot line and label
+            self._payoff_spot_line.set_xdata([new_spot_price, new_spot_price])
+            self._payoff_spot_text.set_x(new_spot_price)
+            self._payoff_spot_text.set_text(f'{new_spot_price}')
+            
+            # Refresh Current P&L in the details box unless it is showing a hover readout
+            price_range = self._current_payoff_data["price_range"]
+            current_payoff = self._current_payoff_data["payoffs"][np.argmin(np.abs(price_range - new_spot_price))]
+            details_text = self._payoff_details_with_pnl(current_payoff)
+            if details_text != self._original_strategy_text:
+                if self._payoff_details_text.get_text() == self._original_strategy_text:
+                    self._payoff_details_text.set_text(details_text)
+                self._original_strategy_text = details_text
+            
+            self._blit_payoff()
+            
+            # Update the current spot price
+            self._current_spot_price = new_spot_price
+            
+            self.logger.debug("Updated payoff chart spot price to: %s", new_spot_price)
                 
         except Exception as e:
             self.logger.error(f"Error updating payoff chart spot price: {e}")
+    
+    @staticmethod
+    def _payoff_vertices(price_range, payoffs):
+        """Reduce a piecewise-linear payoff curve to its end and corner points.
+        
+        Expiry payoffs only bend at strikes, so the dense price grid is mostly collinear
+        points that cost path work in Agg without changing the picture.
+        """
+        x = np.asarray(price_range, dtype=float)
+        y = np.asarray(payoffs, dtype=float)
+        if len(x) < 3:
+            return x, y
+        bends = np.abs(np.diff(y, 2)) > 1e-9 * max(1.0, np.abs(y).max())
+        keep = np.concatenate(([True], bends, [True]))
+        return x[keep], y[keep]
+    
+    def _init_payoff_artists(self, ax):
+        """Create the payoff chart artists once; later strategies only update their data"""
+        self._payoff_line, = ax.plot([], [], 'b-', linewidth=2)
+        
+        # Spot line and label - full height and the label's height are in axes units,
+        # independent of the y-limits
+        self._payoff_spot_line = ax.axvline(x=0, color='red', linestyle='--', linewidth=2,
+                                            label='Current Spot', animated=True)
+        self._payoff_spot_text = ax.text(0, 0.05, '', transform=ax.get_xaxis_transform(),
+                                         ha='center', va='bottom', fontsize=10, fontweight='bold', 
+                                         bbox=dict(boxstyle='round,pad=0.3', facecolor='white', alpha=0.8),
+                                         animated=True)
+        
+        self._payoff_strike_lines = ax.vlines([], 0, 1, transform=ax.get_xaxis_transform(),
+                                              colors='gray', linestyles=':', alpha=0.7)
+        
+        # Horizontal line at zero profit/loss (without label)
+        ax.axhline(y=0, color='black', linestyle='-', alpha=0.8, linewidth=1)
+        
+        # Animated too - Current P&L follows the live spot price
+        self._payoff_details_text = ax.text(0.02, 0.98, '', transform=ax.transAxes,
+                                            verticalalignment='top', fontsize=9,
+                                            bbox=dict(boxstyle='round,pad=0.3', facecolor='wheat', alpha=0.8),
+                                            animated=True)
+        
+        # Formatting
+        ax.set_xlabel('NIFTY Price at Expiry')
+        ax.set_ylabel('Profit/Loss (₹)')
+        ax.grid(True, alpha=0.3)
+        # Legend removed as requested
+    
+    def _on_payoff_draw(self, event):
+        """Capture the payoff chart background after a full draw and paint the spot artists on top"""
+        try:
+            canvas = self._payoff_fig.canvas
+            if getattr(canvas, 'supports_blit', False) and not canvas.is_saving():
+                self._payoff_background = canvas.copy_from_bbox(self._payoff_fig.bbox)
+                self._payoff_background_bounds = self._payoff_fig.bbox.bounds
+            self._draw_payoff_spot()
+        except Exception as e:
+            self.logger.error(f"Error capturing payoff chart background: {e}")
+    
+    def _draw_payoff_spot(self):
+        """Render the animated spot line, label, details box and hover crosshair into the payoff canvas"""
+        if self._payoff_spot_line is not None:
+            self._payoff_ax.draw_artist(self._payoff_spot_line)
+            self._payoff_ax.draw_artist(self._payoff_spot_text)
+            self._payoff_ax.draw_artist(self._payoff_details_text)
+            if self.grid2_crosshair_vline is not None and self.grid2_crosshair_vline.get_visible():
+                self._payoff_ax.draw_artist(self.grid2_crosshair_vline)
+    
+    def _blit_payoff(self):
+        """Repaint only the animated payoff artists over the cached background"""
+        canvas = self._payoff_fig.canvas
+        # A resized figure needs a fresh background before blitting again
+        stale_background = (self._payoff_background is None
+                            or self._payoff_background_bounds != self._payoff_fig.bbox.bounds)
+        if stale_background or not getattr(canvas, 'supports_blit', False):
+            # Full redraw only until a background has been captured
+            canvas.draw_idle()
+        else:
+            canvas.restore_region(self._payoff_background)
+            self._draw_payoff_spot()
+            canvas.blit(self._payoff_fig.bbox)
+    
+    def _payoff_details_with_pnl(self, current_payoff):
+        """Cached static strategy details plus the Current P&L line"""
+        return f"{self._payoff_static_text}\nCurrent P&L: ₹{current_payoff:.0f}"
         
     def setup_ui(self):
         """Set up the user interface"""
@@ -2283,7 +2695,7 @@ class TkinterChartApp:
         
         # Embed matplotlib figure in grid 1
         self.canvas = FigureCanvasTkAgg(self.chart.fig, self.grid1_frame)
-        self.canvas.draw()
+        self.canvas.draw_idle()
         self.canvas.get_tk_widget().grid(row=0, column=0, sticky="nsew")
         
         # Set up tooltips for candlestick hover
@@ -2322,8 +2734,16 @@ class TkinterChartApp:
         """Initialize Grid 2 with default content"""
         try:
             # Clear any existing content
-            for widget in self.grid2_frame.winfo_children():
-                widget.destroy()
+            self._reset_grid2()
+            
+            if self._grid2_default is not None and self._grid2_default.winfo_exists():
+                # Show the existing default widgets again
+                self.content_frame = self._grid2_default_content
+                self.trade_all_button = self._grid2_default_trade_all
+                last_updated = datetime.now().strftime("%H:%M:%S")
+                self._grid2_default_update_label.config(text=f"Initialized: {last_updated}")
+                self._grid2_default.pack(fill=tk.BOTH, expand=True)
+                return
             
             # Create a main container frame for all content
             main_container = ttk.Frame(self.grid2_frame)
@@ -2364,9 +2784,23 @@ class TkinterChartApp:
                                    foreground="gray")
             update_label.pack(pady=(10, 5))
             
+            self._grid2_default = main_container
+            self._grid2_default_content = self.content_frame
+            self._grid2_default_trade_all = self.trade_all_button
+            self._grid2_default_update_label = update_label
+            
         except Exception as e:
             print(f"Error initializing Grid 2 content: {e}")
     
+    def _reset_grid2(self):
+        """Empty Grid 2 - the default content, payoff canvas and trade info label are only unpacked, everything else is destroyed"""
+        canvas_widget = self._payoff_canvas.get_tk_widget() if self._payoff_canvas else None
+        for widget in self.grid2_frame.winfo_children():
+            if widget is self._grid2_default or widget is canvas_widget or widget is self._payoff_info_label:
+                widget.pack_forget()
+            else:
+                widget.destroy()
+    
     def _initialize_grid3_content(self):
         """Initialize Grid 3 with technical indicators content"""
         try:
@@ -2392,7 +2826,7 @@ class TkinterChartApp:
             
             # Create canvas - fixed height, no vertical expansion
             self.tech_canvas = FigureCanvasTkAgg(self.tech_fig, chart_frame)
-            self.tech_canvas.draw()
+            self.tech_canvas.draw_idle()
             self.tech_canvas.get_tk_widget().pack(fill=tk.X, expand=False)
             
             # Add placeholder text
@@ -2884,6 +3318,35 @@ class TkinterChartApp:
             traceback.print_exc()
     
     
+    def _init_tech_lines(self):
+        """Replace the Grid 3 placeholder with one persistent line per series"""
+        self.tech_ax.clear()
+        self.tech_ax.xaxis_date()
+        
+        self._tech_lines = {}
+        for key, style, linewidth, label, alpha in (
+            ('price', 'b-', 1, 'Price', 0.7),
+            ('ma_20', 'orange', 1, 'MA 20', 0.8),
+            ('ma_50', 'red', 1, 'MA 50', 0.8),
+            ('ma_100', 'purple', 1, 'MA 100', 0.8),
+            ('ma_200', 'brown', 1, 'MA 200', 0.8),
+            ('super_trend', 'g-', 2, 'Super Trend', 0.9),
+        ):
+            self._tech_lines[key], = self.tech_ax.plot([], [], style, linewidth=linewidth, label=label, alpha=alpha)
+        self._tech_legend_labels = None
+        
+        # Set labels and title
+        self.tech_ax.set_title('Technical Analysis - 3 Months Historical Data', fontsize=12, fontweight='bold')
+        self.tech_ax.set_xlabel('Time')
+        self.tech_ax.set_ylabel('Price')
+        
+        # Format x-axis
+        self.tech_ax.tick_params(axis='x', rotation=45, labelsize=8)
+        self.tech_ax.tick_params(axis='y', labelsize=8)
+        
+        # Add grid
+        self.tech_ax.grid(True, alpha=0.3)
+    
     def display_technical_indicators(self, historical_data, indicators):
         """Display technical indicators chart in Grid 3"""
         try:
@@ -2894,8 +3357,10 @@ class TkinterChartApp:
             # Store historical data for table updates
             self._latest_historical_data = historical_data
             
-            # Clear the existing plot
-            self.tech_ax.clear()
+            # First data replaces the placeholder with persistent lines - later refreshes only
+            # swap their data
+            if self._tech_lines is None or self._tech_lines['price'].axes is not self.tech_ax:
+                self._init_tech_lines()
             
             # Extract data for plotting
             # Historical data is sorted with most recent first, but we need chronological order for plotting
@@ -2907,80 +3372,37 @@ class TkinterChartApp:
             if timestamps and isinstance(timestamps[0], str):
                 from datetime import datetime
                 timestamps = [datetime.fromisoformat(ts.replace('Z', '+00:00')) for ts in timestamps]
+            x = mdates.date2num(timestamps)
+            
+            # Price line
+            self._tech_lines['price'].set_data(x, close_prices)
+            
+            # Moving averages and Super Trend (indicators are most recent first, need to reverse for
+            # chronological plotting; they are aligned with the most recent prices)
+            for key in ('ma_20', 'ma_50', 'ma_100', 'ma_200', 'super_trend'):
+                line = self._tech_lines[key]
+                values = [v for v in indicators.get(key, []) if v is not None]
+                if values:
+                    line.set_data(x[-len(values):], values[::-1])
+                else:
+                    line.set_data([], [])
+                line.set_visible(bool(values))
             
-            # Plot price line
-            self.tech_ax.plot(timestamps, close_prices, 'b-', linewidth=1, label='Price', alpha=0.7)
-            
-            # Plot moving averages (indicators are most recent first, need to reverse for chronological plotting)
-            if 'ma_20' in indicators:
-                ma_20 = [x for x in indicators['ma_20'] if x is not None]
-                if ma_20:
-                    # Reverse indicators to match chronological order of price data
-                    ma_20_reversed = list(reversed(ma_20))
-                    self.tech_ax.plot(timestamps[-len(ma_20_reversed):], ma_20_reversed, 'orange', linewidth=1, label='MA 20', alpha=0.8)
-            
-            if 'ma_50' in indicators:
-                ma_50 = [x for x in indicators['ma_50'] if x is not None]
-                if ma_50:
-                    ma_50_reversed = list(reversed(ma_50))
-                    self.tech_ax.plot(timestamps[-len(ma_50_reversed):], ma_50_reversed, 'red', linewidth=1, label='MA 50', alpha=0.8)
-            
-            if 'ma_100' in indicators:
-                ma_100 = [x for x in indicators['ma_100'] if x is not None]
-                if ma_100:
-                    ma_100_reversed = list(reversed(ma_100))
-                    self.tech_ax.plot(timestamps[-len(ma_100_reversed):], ma_100_reversed, 'purple', linewidth=1, label='MA 100', alpha=0.8)
-            
-            if 'ma_200' in indicators:
-                ma_200 = [x for x in indicators['ma_200'] if x is not None]
-                if ma_200:
-                    ma_200_reversed = list(reversed(ma_200))
-                    self.tech_ax.plot(timestamps[-len(ma_200_reversed):], ma_200_reversed, 'brown', linewidth=1, label='MA 200', alpha=0.8)
-            
-            
-            # Plot Super Trend (indicators are most recent first, need to reverse for chronological plotting)
-            if 'super_trend' in indicators:
-                super_trend = [x for x in indicators['super_trend'] if x is not None]
-                if super_trend:
-                    # Reverse indicators to match chronological order of price data
-                    super_trend_reversed = list(reversed(super_trend))
-                    
-                    # Color based on direction
-                    super_trend_colors = []
-                    if 'super_trend_direction' in indicators:
-                        directions = [x for x in indicators['super_trend_direction'] if x is not None]
-                        directions_reversed = list(reversed(directions))
-                        for i, direction in enumerate(directions_reversed[-len(super_trend_reversed):]):
-                            if direction == 1:  # Uptrend
-                                super_trend_colors.append('green')
-                            else:  # Downtrend
-                                super_trend_colors.append('red')
-                    else:
-                        super_trend_colors = ['blue'] * len(super_trend_reversed)
-                    
-                    # Plot Super Trend line
-                    self.tech_ax.plot(timestamps[-len(super_trend_reversed):], super_trend_reversed, 'g-', linewidth=2, label='Super Trend', alpha=0.9)
-            
-            # Set labels and title
-            self.tech_ax.set_title('Technical Analysis - 3 Months Historical Data', fontsize=12, fontweight='bold')
-            self.tech_ax.set_xlabel('Time')
-            self.tech_ax.set_ylabel('Price')
-            
-            # Add legend
-            self.tech_ax.legend(loc='upper left', fontsize=8)
-            
-            # Format x-axis
-            self.tech_ax.tick_params(axis='x', rotation=45, labelsize=8)
-            self.tech_ax.tick_params(axis='y', labelsize=8)
+            # Legend - rebuilt only when the set of plotted lines changes
+            shown = [line for line in self._tech_lines.values() if line.get_visible()]
+            shown_labels = [line.get_label() for line in shown]
+            if shown_labels != self._tech_legend_labels:
+                self.tech_ax.legend(handles=shown, loc='upper left', fontsize=8)
+                self._tech_legend_labels = shown_labels
             
-            # Add grid
-            self.tech_ax.grid(True, alpha=0.3)
+            self.tech_ax.relim(visible_only=True)
+            self.tech_ax.autoscale_view()
             
             # Adjust layout
             self.tech_fig.tight_layout()
             
             # Refresh canvas
-            self.tech_canvas.draw()
+            self.tech_canvas.draw_idle()
             
             # Update the technical indicators table
             self._update_technical_table(indicators)
@@ -3000,9 +3422,13 @@ class TkinterChartApp:
             # Store trade reference for later use in updates
             self.current_trades = trades
             
-            # Clear any existing content
-            for widget in self.grid2_frame.winfo_children():
-                widget.destroy()
+            # Clear any existing content (the payoff canvas is kept and redrawn)
+            canvas_widget = self._payoff_canvas.get_tk_widget() if self._payoff_canvas else None
+            if canvas_widget is not None and not canvas_widget.winfo_exists():
+                canvas_widget = self._payoff_canvas = None
+            self._reset_grid2()
+            if canvas_widget is not None:
+                canvas_widget.pack(fill=tk.BOTH, expand=True)
             
             # Calculate payoff data using strategy manager
             if strategy_manager is None:
@@ -3031,7 +3457,10 @@ class TkinterChartApp:
             
             # Header frame with title and Trade All button
             header_frame = ttk.Frame(self.grid2_frame)
-            header_frame.pack(fill=tk.X, pady=(10, 5))
+            if canvas_widget is not None:
+                header_frame.pack(fill=tk.X, pady=(10, 5), before=canvas_widget)
+            else:
+                header_frame.pack(fill=tk.X, pady=(10, 5))
             
             # Title (left aligned)
             title_label = ttk.Label(header_frame, text=chart_title, 
@@ -3062,9 +3491,6 @@ class TkinterChartApp:
                 self.trade_all_button.pack(side=tk.RIGHT, padx=(10, 0))
             
             # Create matplotlib figure for Iron Condor
-            from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-            import matplotlib.pyplot as plt
-            
             # Create figure with responsive size based on grid2 frame
             try:
                 grid2_width = self.grid2_frame.winfo_width()
@@ -3082,32 +3508,37 @@ class TkinterChartApp:
                 # Fallback to larger default size
                 fig_width, fig_height = 10.0, 7.0
             
-            fig, ax = plt.subplots(figsize=(fig_width, fig_height))
-            
-            # Adjust subplot to ensure x-axis is visible with more bottom space
-            plt.subplots_adjust(bottom=0.20, left=0.1, right=0.95, top=0.95)
-            
-            # Plot payoff curve
-            ax.plot(payoff_data["price_range"], payoff_data["payoffs"], 
-                   'b-', linewidth=2)
+            if self._payoff_fig is None:
+                self._payoff_fig, self._payoff_ax = plt.subplots(figsize=(fig_width, fig_height))
+                self._payoff_fig.canvas.mpl_connect('draw_event', self._on_payoff_draw)
+                self._init_payoff_artists(self._payoff_ax)
+            else:
+                # Reuse the figure - only the previous strategy's fills and hover handler go away
+                self._payoff_fig.set_size_inches(fig_width, fig_height)
+                for fill in self._payoff_fills:
+                    fill.remove()
+                if self._payoff_hover_cid is not None:
+                    self._payoff_fig.canvas.mpl_disconnect(self._payoff_hover_cid)
+                    self._payoff_hover_cid = None
+                self._hide_grid2_crosshair()
+            self._payoff_fills = []
+            fig, ax = self._payoff_fig, self._payoff_ax
+            
+            # tight_layout measures every artist - only redo the layout when the figure size changes
+            relayout = (fig_width, fig_height) != self._payoff_layout_size
+            if relayout:
+                # Adjust subplot to ensure x-axis is visible with more bottom space
+                fig.subplots_adjust(bottom=0.20, left=0.1, right=0.95, top=0.95)
             
-            # Mark current spot price (using plot for easier updates)
-            ylim = ax.get_ylim()
-            ax.plot([spot_price, spot_price], [ylim[0], ylim[1]], 
-                   color='red', linestyle='--', linewidth=2, label='Current Spot')
+            # Payoff curve - only its corner points are drawn
+            price_range, payoffs = self._payoff_vertices(payoff_data["price_range"], payoff_data["payoffs"])
+            self._payoff_line.set_data(price_range, payoffs)
             
-            # Add spot price text near x-axis
-            try:
-                text_obj = ax.text(spot_price, ylim[0] + (ylim[1] - ylim[0]) * 0.05, f'{spot_price}', 
-                                 ha='center', va='bottom', fontsize=10, fontweight='bold', 
-                                 bbox=dict(boxstyle='round,pad=0.3', facecolor='white', alpha=0.8))
-                
-                # Ensure the text object is properly associated with the figure
-                if hasattr(text_obj, 'set_figure'):
-                    text_obj.set_figure(ax.get_figure())
-                    
-            except Exception as e:
-                self.logger.warning(f"Could not add initial spot price text: {e}")
+            # Current spot price - animated, so live spot updates blit just these two artists
+            self._payoff_spot_line.set_xdata([spot_price, spot_price])
+            self._payoff_spot_text.set_x(spot_price)
+            self._payoff_spot_text.set_text(f'{spot_price}')
+            self._payoff_background = None
             
             # Mark strikes - collect all strikes from all trades
             all_strikes = []
@@ -3119,49 +3550,31 @@ class TkinterChartApp:
             unique_strikes = sorted(list(set(all_strikes)))
             
             # Only show strikes if there are not too many (avoid clutter)
-            if len(unique_strikes) <= 10:
-                for strike in unique_strikes:
-                    ax.axvline(x=strike, color='gray', linestyle=':', alpha=0.7)
-                
-                # Set X-axis ticks at strike prices
-                ax.set_xticks(unique_strikes)
-                ax.set_xticklabels([f'{strike}' for strike in unique_strikes], rotation=45, ha='right')
-            else:
+            if len(unique_strikes) > 10:
                 # Too many strikes - just show a few key ones
-                key_strikes = [unique_strikes[0], unique_strikes[len(unique_strikes)//2], unique_strikes[-1]]
-                for strike in key_strikes:
-                    ax.axvline(x=strike, color='gray', linestyle=':', alpha=0.7)
-                ax.set_xticks(key_strikes)
-                ax.set_xticklabels([f'{strike}' for strike in key_strikes], rotation=45, ha='right')
-            
-            # Breakeven points are now only shown in the strategy details text
+                unique_strikes = [unique_strikes[0], unique_strikes[len(unique_strikes)//2], unique_strikes[-1]]
+            self._payoff_strike_lines.set_segments([[(strike, 0), (strike, 1)] for strike in unique_strikes])
             
-            # Add horizontal line at zero profit/loss (without label)
-            ax.axhline(y=0, color='black', linestyle='-', alpha=0.8, linewidth=1)
+            # Set X-axis ticks at strike prices
+            ax.set_xticks(unique_strikes)
+            ax.set_xticklabels([f'{strike}' for strike in unique_strikes], rotation=45, ha='right')
             
-            # Formatting
-            ax.set_xlabel('NIFTY Price at Expiry')
-            ax.set_ylabel('Profit/Loss (₹)')
-            ax.grid(True, alpha=0.3)
-            # Legend removed as requested
+            # Breakeven points are now only shown in the strategy details text
             
             # Add color filling for profit/loss zones (only in chart area)
-            # Use the actual data range instead of full chart limits
-            price_range = payoff_data["price_range"]
-            payoffs = payoff_data["payoffs"]
-            
-            # Convert to numpy arrays for proper comparison
-            import numpy as np
-            price_range = np.array(price_range)
-            payoffs = np.array(payoffs)
-            
+            # Use the actual data range instead of full chart limits; interpolate so the
+            # fills meet at the zero crossings between corner points
             # Fill area above zero with green (profit zone) - only where data exists
-            ax.fill_between(price_range, 0, payoffs, where=(payoffs >= 0), 
-                           color='green', alpha=0.1)
+            self._payoff_fills.append(ax.fill_between(price_range, 0, payoffs, where=(payoffs >= 0), 
+                                                      interpolate=True, color='green', alpha=0.1))
             
             # Fill area below zero with red (loss zone) - only where data exists
-            ax.fill_between(price_range, payoffs, 0, where=(payoffs < 0), 
-                           color='red', alpha=0.1)
+            self._payoff_fills.append(ax.fill_between(price_range, payoffs, 0, where=(payoffs < 0), 
+                                                      interpolate=True, color='red', alpha=0.1))
+            
+            # Rescale to the new curve (the hidden crosshair is left out)
+            ax.relim(visible_only=True)
+            ax.autoscale_view()
             
             # Calculate risk reward ratio for initial display
             max_profit = payoff_data["max_profit"]
@@ -3169,32 +3582,39 @@ class TkinterChartApp:
             risk_reward_ratio = max_loss / max_profit if max_profit > 0 else 0
             
             # Add strategy details text box (will be updated on hover)
+            # Only Current P&L changes with the spot, so the rest is formatted once per strategy
             if len(trades) == 1:
-                # Single trade details
-                trade = trades[0]
-                strikes = [leg.strike_price for leg in trade.legs]
-                initial_strategy_text = f"""Strategy Details:
-Trade: {trade.trade_id}
-Strikes: {sorted(strikes)}
+                strikes = tuple(sorted(leg.strike_price for leg in trades[0].legs))
+                static_key = (trades[0].trade_id, strikes, max_profit, payoff_data["max_loss"])
+            else:
+                static_key = (len(trades), payoff_data.get("total_legs", 0), max_profit, payoff_data["max_loss"])
+            if static_key != self._payoff_static_key:
+                if len(trades) == 1:
+                    # Single trade details
+                    self._payoff_static_text = f"""Strategy Details:
+Trade: {trades[0].trade_id}
+Strikes: {list(strikes)}
 Max Profit: ₹{max_profit:.0f}
 Max Loss: ₹{payoff_data["max_loss"]:.0f}
-Risk:Reward Ratio: {risk_reward_ratio:.2f}
-Current P&L: ₹{payoff_data["current_payoff"]:.0f}"""
-            else:
-                # Multiple trades details
-                initial_strategy_text = f"""Portfolio Details:
+Risk:Reward Ratio: {risk_reward_ratio:.2f}"""
+                else:
+                    # Multiple trades details
+                    self._payoff_static_text = f"""Portfolio Details:
 Trades: {len(trades)}
 Total Legs: {payoff_data.get("total_legs", 0)}
 Max Profit: ₹{max_profit:.0f}
 Max Loss: ₹{payoff_data["max_loss"]:.0f}
-Risk:Reward Ratio: {risk_reward_ratio:.2f}
-Current P&L: ₹{payoff_data["current_payoff"]:.0f}"""
+Risk:Reward Ratio: {risk_reward_ratio:.2f}"""
+                self._payoff_static_key = static_key
+            initial_strategy_text = self._payoff_details_with_pnl(payoff_data["current_payoff"])
+            self._original_strategy_text = initial_strategy_text
             
-            strategy_text_obj = ax.text(0.02, 0.98, initial_strategy_text, transform=ax.transAxes,
-                   verticalalignment='top', fontsize=9,
-                   bbox=dict(boxstyle='round,pad=0.3', facecolor='wheat', alpha=0.8))
+            strategy_text_obj = self._payoff_details_text
+            strategy_text_obj.set_text(initial_strategy_text)
             
-            plt.tight_layout()
+            if relayout:
+                fig.tight_layout()
+                self._payoff_layout_size = (fig_width, fig_height)
             
             # Add hover functionality to update existing strategy details
             if len(trades) == 1:
@@ -3208,29 +3628,27 @@ Current P&L: ₹{payoff_data["current_payoff"]:.0f}"""
             self._current_spot_price = spot_price
             self.grid2_fig = fig
             
-            # Embed in grid 2
-            canvas = FigureCanvasTkAgg(fig, self.grid2_frame)
-            canvas.draw()
-            canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+            # Embed in grid 2 (once - later calls only redraw the existing canvas)
+            if self._payoff_canvas is None:
+                self._payoff_canvas = FigureCanvasTkAgg(fig, self.grid2_frame)
+                self._payoff_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+            self._payoff_canvas.draw_idle()
             
-            # Add trade info below chart
-            info_frame = ttk.Frame(self.grid2_frame)
-            info_frame.pack(fill=tk.X, pady=(5, 0))
+            # Add trade info below chart (one label, reused - only its text variable changes)
+            if self._payoff_info_label is None or not self._payoff_info_label.winfo_exists():
+                self._trade_info_var = tk.StringVar(master=self.grid2_frame)
+                self._payoff_info_label = ttk.Label(self.grid2_frame, textvariable=self._trade_info_var,
+                                                    font=("Arial", 8))
+            self._payoff_info_label.pack(pady=(5, 0))
             
             if len(trades) == 1:
                 trade = trades[0]
-                trade_info = ttk.Label(info_frame, 
-                                     text=f"Trade: {trade.trade_id} | Status: {trade.status.value}",
-                                     font=("Arial", 8))
-                trade_info.pack()
+                self._trade_info_var.set(f"Trade: {trade.trade_id} | Status: {trade.status.value}")
                 self.logger.info(f"Displayed strategy in Grid 2: {trade.trade_id}")
             else:
                 # Show summary for multiple trades
                 trade_ids = [trade.trade_id for trade in trades]
-                trade_info = ttk.Label(info_frame, 
-                                     text=f"Portfolio: {len(trades)} trades | IDs: {', '.join(trade_ids[:3])}{'...' if len(trade_ids) > 3 else ''}",
-                                     font=("Arial", 8))
-                trade_info.pack()
+                self._trade_info_var.set(f"Portfolio: {len(trades)} trades | IDs: {', '.join(trade_ids[:3])}{'...' if len(trade_ids) > 3 else ''}")
                 self.logger.info(f"Displayed portfolio in Grid 2: {len(trades)} trades")
             
         except Exception as e:
@@ -3245,11 +3663,7 @@ Current P&L: ₹{payoff_data["current_payoff"]:.0f}"""
     def clear_grid2(self):
         """Clear Grid 2 and reset to default content"""
         try:
-            # Clear any existing content
-            for widget in self.grid2_frame.winfo_children():
-                widget.destroy()
-            
-            # Reset to default content
+            # Reset to default content (clears strategy widgets first)
             self._initialize_grid2_content()
             
         except Exception as e:
@@ -3259,8 +3673,7 @@ Current P&L: ₹{payoff_data["current_payoff"]:.0f}"""
         """Display error message in Grid 2"""
         try:
             # Clear any existing content
-            for widget in self.grid2_frame.winfo_children():
-                widget.destroy()
+            self._reset_grid2()
             
             # Create error display
             error_frame = ttk.Frame(self.grid2_frame)
@@ -3296,8 +3709,7 @@ Current P&L: ₹{payoff_data["current_payoff"]:.0f}"""
         """Clear Grid 2 content"""
         try:
             # Clear any existing content
-            for widget in self.grid2_frame.winfo_children():
-                widget.destroy()
+            self._reset_grid2()
         except Exception as e:
             self.logger.error(f"Error clearing Grid 2: {e}")
     
@@ -3388,7 +3800,7 @@ Current P&L: ₹{payoff_data["current_payoff"]:.0f}"""
                 
                 # Force update to ensure visibility
                 self.grid2_frame.update_idletasks()
-                self.grid2_canvas.draw()
+                self.grid2_canvas.draw_idle()
                 
                 self.logger.info("Successfully initialized Grid 2 matplotlib axes and canvas")
             else:
@@ -3627,18 +4039,16 @@ Current P&L: ₹{payoff_data["current_payoff"]:.0f}"""
             
             def hover(event):
                 """Handle mouse hover events"""
-                if event.inaxes != ax:
-                    # Mouse left chart area, restore original text and hide crosshair
-                    self._strategy_text_obj.set_text(self._original_strategy_text)
-                    self._hide_grid2_crosshair()
-                    fig.canvas.draw_idle()
-                    return
-                
-                if event.xdata is None or event.ydata is None:
-                    # Invalid data, restore original text and hide crosshair
+                if event.inaxes != ax or event.xdata is None or event.ydata is None:
+                    # Mouse left chart area (or invalid data) - restore original text and hide
+                    # crosshair, repainting only if the hover readout was showing
+                    crosshair = self.grid2_crosshair_vline
+                    if (self._strategy_text_obj.get_text() == self._original_strategy_text
+                            and (crosshair is None or not crosshair.get_visible())):
+                        return
                     self._strategy_text_obj.set_text(self._original_strategy_text)
                     self._hide_grid2_crosshair()
-                    fig.canvas.draw_idle()
+                    self._blit_payoff()
                     return
                 
                 # Get hover position
@@ -3652,9 +4062,11 @@ Current P&L: ₹{payoff_data["current_payoff"]:.0f}"""
                 price_range = payoff_data["price_range"]
                 payoffs = payoff_data["payoffs"]
                 
-                # Find closest index
-                closest_idx = min(range(len(price_range)), 
-                                key=lambda i: abs(price_range[i] - hover_price))
+                # Find closest index - the price range is ascending, so bisect and pick the nearer neighbour
+                closest_idx = int(np.searchsorted(price_range, hover_price))
+                if closest_idx == len(price_range) or (
+                        closest_idx > 0 and hover_price - price_range[closest_idx - 1] <= price_range[closest_idx] - hover_price):
+                    closest_idx -= 1
                 
                 closest_price = price_range[closest_idx]
                 closest_payoff = payoffs[closest_idx]
@@ -3662,12 +4074,12 @@ Current P&L: ₹{payoff_data["current_payoff"]:.0f}"""
                 # Get strategy details for this price
                 strategy_details = self._get_strategy_details_at_price(closest_price, closest_payoff)
                 
-                # Update the existing text box
+                # Update the existing text box - it and the crosshair are animated, so just blit them
                 self._strategy_text_obj.set_text(strategy_details)
-                fig.canvas.draw_idle()
+                self._blit_payoff()
             
-            # Connect hover event
-            fig.canvas.mpl_connect("motion_notify_event", hover)
+            # Connect hover event (kept so the next payoff graph can disconnect it)
+            self._payoff_hover_cid = fig.canvas.mpl_connect("motion_notify_event", hover)
             
             self.logger.info("Added hover update functionality to Iron Condor chart")
             
@@ -3715,13 +4127,62 @@ Breakevens: {', '.join(breakeven_texts)}"""
             return f"Error loading details: {e}"
     
     def update_status(self, message):
-        """Update the status label with scrolling information"""
+        """Update the status label with scrolling information (safe to call from worker threads)"""
+        if self.status_label is None:
+            return
+        if threading.current_thread() is threading.main_thread():
+            self._apply_status(message)
+        else:
+            # Only the Tk thread touches widgets - hand the update to its event loop
+            try:
+                self.root.after(0, self._apply_status, message)
+            except Exception as e:
+                # e.g. the window was destroyed while a worker thread was still running
+                self.logger.error(f"Error updating status: {e}")
+    
+    def _apply_status(self, message):
+        """Show a status message (Tk thread only)"""
+        # Compared against the message actually on screen, so posts queued from
+        # other threads can never leave a stale one behind
+        if message == self._status_message:
+            return
         try:
-            if hasattr(self, 'status_label'):
-                self.status_label.config(text=f"Status: {message}")
+            self.status_label.config(text=f"Status: {message}")
+            self._status_message = message
         except Exception as e:
             self.logger.error(f"Error updating status: {e}")
     
+    def scroll_chart_left(self):
+        """Scroll Grid 1 back in time (Left / 'a' keys)"""
+        try:
+            scrolled = self.chart.scroll_left('NSE_INDEX|Nifty 50')
+        except Exception as e:
+            self.logger.error(f"Error scrolling chart left: {e}")
+            return
+        if scrolled:
+            self._schedule_scroll_redraw()
+    
+    def scroll_chart_right(self):
+        """Scroll Grid 1 forward in time (Right / 'd' keys)"""
+        try:
+            scrolled = self.chart.scroll_right('NSE_INDEX|Nifty 50')
+        except Exception as e:
+            self.logger.error(f"Error scrolling chart right: {e}")
+            return
+        if scrolled:
+            self._schedule_scroll_redraw()
+    
+    def _schedule_scroll_redraw(self):
+        """Redraw once after a burst of scroll steps instead of once per step"""
+        if self._scroll_pending is not None:
+            self.root.after_cancel(self._scroll_pending)
+        self._scroll_pending = self.root.after(self.scroll_redraw_delay_ms, self._flush_scroll)
+    
+    def _flush_scroll(self):
+        """Render the final scroll position"""
+        self._scroll_pending = None
+        self.chart.force_chart_update()
+    
     def _update_grid2_crosshair(self, x, y, ax):
         """Update crosshair position for chart 2 (Iron Condor payoff chart)"""
         try:
@@ -3735,7 +4196,8 @@ Breakevens: {', '.join(breakeven_texts)}"""
             # Create or update vertical line only
             if self.grid2_crosshair_vline is None or not hasattr(self.grid2_crosshair_vline, 'set_xdata'):
                 self.grid2_crosshair_vline, = ax.plot([x, x], [ylim[0], ylim[1]], 
-                                                    color='darkgrey', linestyle='--', alpha=0.7, linewidth=1)
+                                                    color='darkgrey', linestyle='--', alpha=0.7, linewidth=1,
+                                                    animated=True)
             else:
                 self.grid2_crosshair_vline.set_xdata([x, x])
                 self.grid2_crosshair_vline.set_ydata([ylim[0], ylim[1]])
@@ -3808,6 +4270,7 @@ Breakevens: {', '.join(breakeven_texts)}"""
                             fig_height = max(grid2_height / dpi, 4.0)  # Increased from 3.0 to 4.0
                             
                             self.grid2_fig.set_size_inches(fig_width, fig_height)
+                            self._payoff_layout_size = None  # Next payoff graph lays out again
                             
                             # Reapply subplot adjustments after resize
                             import matplotlib.pyplot as plt
@@ -3833,23 +4296,27 @@ Breakevens: {', '.join(breakeven_texts)}"""
     
     def on_closing(self):
         """Handle window close event"""
+        # Exit normally so stdio and matplotlib caches are flushed; force it only if
+        # background threads are still keeping the process alive after the grace period
+        import os
+        exit_timer = threading.Timer(self.shutdown_grace_s, os._exit, args=(0,))
+        exit_timer.daemon = True
+        exit_timer.start()
+        
         try:
             # Stop the chart
             if hasattr(self, 'chart') and self.chart:
                 self.chart.stop_chart()
             
-            # Destroy the window
-            self.root.destroy()
+            # Release the figures pyplot keeps references to
+            plt.close('all')
             
-            # Force exit the application
-            import os
-            os._exit(0)
+            # Let mainloop return, then destroy the window
+            self.root.quit()
+            self.root.destroy()
             
         except Exception as e:
             print(f"Error during window close: {e}")
-            # Force exit even if there's an error
-            import os
-            os._exit(0)
     
     def _show_trade_all_window(self):
         """Show window with all trades that would be executed in Iron Condor strategy"""
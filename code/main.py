@@ -227,7 +227,9 @@ class MarketDataApp:
     def _on_live_data(self, data):
         """Callback function to handle live data updates"""
         try:
-            self._log_live_feed(f"Received live data: {type(data)} - {str(data)[:200]}...")
+            # str() of a feed message is as large as the message - only build it when it is logged
+            if self._live_feed_debug:
+                self._log_live_feed(f"Received live data: {type(data)} - {str(data)[:200]}...")
             logger.info(f"Live data callback triggered - Broker: {self.broker_type}, Data type: {type(data)}")
             
             # Process data based on broker type (only updates datawarehouse)
@@ -667,7 +669,8 @@ class MarketDataApp:
                 return
             
             # Log the received data for debugging
-            self._log_live_feed(f"Processing Upstox data: {type(data)} - {str(data)[:100]}...")
+            if self._live_feed_debug:
+                self._log_live_feed(f"Processing Upstox data: {type(data)} - {str(data)[:100]}...")
             logger.info(f"Upstox data type: {type(data)}, Keys: {list(data.keys()) if isinstance(data, dict) else 'Not a dict'}")
             
             # Check if data is valid
@@ -969,10 +972,10 @@ class MarketDataApp:
             
             if success:
                 
-                # Ensure chart is running and force refresh to display new data
+                # Ensure chart is running and refresh with the next frame to display new data
                 if self.chart_visualizer:
                     self.chart_visualizer.ensure_chart_running()
-                    self.chart_visualizer.force_chart_update()
+                    self.chart_visualizer.request_chart_update()
                 
                 logger.info(f"Timer [{current_time}]: ✓ Intraday data fetched and candlestick chart updated")
                 
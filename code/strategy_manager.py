@@ -3,9 +3,9 @@
 Strategy Manager for handling open positions and creating new strategies.
 """
 
+import functools
 import logging
 import numpy as np
-import matplotlib.pyplot as plt
 from datetime import datetime, timedelta
 from typing import List, Optional, Dict, Any, Tuple
 from trade_database import TradeDatabase
@@ -17,6 +17,59 @@ import math
 
 logger = logging.getLogger("StrategyManager")
 
+def _leg_payoff(price, option_type: str, position: str, strike: float, premium: float):
+    """Expiry payoff of a single option leg; price may be a scalar or a NumPy array"""
+    if option_type == "call":
+        intrinsic_value = np.maximum(0, price - strike)
+    else:  # put
+        intrinsic_value = np.maximum(0, strike - price)
+    
+    if position == "long":
+        return intrinsic_value - premium
+    else:  # short
+        return premium - intrinsic_value
+
+@functools.lru_cache(maxsize=256)
+def _compute_payoff_curve(legs: Tuple[Tuple, ...], lower: float, upper: float):
+    """Payoff curve and stats for (type, position, strike, premium, quantity) legs.
+    
+    Cached so repeated redraws of an unchanged strategy skip the grid evaluation.
+    The returned arrays are shared between callers and marked read-only.
+    """
+    price_range = np.arange(lower, upper, 10)
+    
+    # One vectorized pass per leg over the whole price grid, reusing a single scratch
+    # buffer so no per-leg temporaries are allocated
+    payoffs = np.zeros(len(price_range))
+    leg_payoff = np.empty_like(payoffs)
+    for option_type, position, strike, premium, quantity in legs:
+        if option_type == "call":
+            np.subtract(price_range, strike, out=leg_payoff)
+        else:  # put
+            np.subtract(strike, price_range, out=leg_payoff)
+        np.maximum(leg_payoff, 0, out=leg_payoff)
+        if position == "long":
+            np.subtract(leg_payoff, premium, out=leg_payoff)
+        else:  # short
+            np.subtract(premium, leg_payoff, out=leg_payoff)
+        np.multiply(leg_payoff, quantity, out=leg_payoff)
+        payoffs += leg_payoff
+    
+    # Breakevens are the grid points where the payoff changes sign
+    crossings = np.flatnonzero(payoffs[:-1] * payoffs[1:] < 0) + 1
+    breakevens = [round(price_range[i], 2) for i in crossings]
+    
+    price_range.setflags(write=False)
+    payoffs.setflags(write=False)
+    return price_range, payoffs, np.max(payoffs), np.min(payoffs), tuple(breakevens)
+
+def _payoff_key(legs: List[Dict]) -> Tuple[Tuple, ...]:
+    """Hashable, order-independent cache key for a list of payoff legs"""
+    return tuple(sorted(
+        (leg["type"], leg["position"], leg["strike"], leg["premium"], leg.get("quantity", 1))
+        for leg in legs
+    ))
+
 class StrategyManager:
     """Manages trading strategies and position tracking"""
     
@@ -207,33 +260,10 @@ class StrategyManager:
             min_strike = min(leg.strike_price for leg in legs)
             max_strike = max(leg.strike_price for leg in legs)
             
-            # Create price range
-            price_range = np.arange(
-                min_strike - 500, 
-                max_strike + 500, 
-                10
+            price_range, payoffs, max_profit, max_loss, breakevens = _compute_payoff_curve(
+                _payoff_key(payoff_legs), min_strike - 500, max_strike + 500
             )
-            
-            # Calculate payoffs
-            payoffs = []
-            for price in price_range:
-                total_payoff = 0
-                for leg in payoff_legs:
-                    payoff = self._calculate_leg_payoff(price, leg)
-                    total_payoff += payoff
-                payoffs.append(total_payoff)
-            
-            payoffs = np.array(payoffs)
-            
-            # Find max profit and loss
-            max_profit = np.max(payoffs)
-            max_loss = np.min(payoffs)
-            
-            # Find breakeven points
-            breakevens = []
-            for i in range(1, len(price_range)):
-                if payoffs[i-1] * payoffs[i] < 0:
-                    breakevens.append(round(price_range[i], 2))
+            breakevens = list(breakevens)
             
             return {
                 "price_range": price_range,
@@ -250,20 +280,7 @@ class StrategyManager:
     
     def _calculate_leg_payoff(self, price: float, leg: Dict) -> float:
         """Calculate payoff for a single leg"""
-        option_type = leg["type"]
-        position = leg["position"]
-        strike = leg["strike"]
-        premium = leg["premium"]
-        
-        if option_type == "call":
-            intrinsic_value = max(0, price - strike)
-        else:  # put
-            intrinsic_value = max(0, strike - price)
-        
-        if position == "long":
-            return intrinsic_value - premium
-        else:  # short
-            return premium - intrinsic_value
+        return _leg_payoff(price, leg["type"], leg["position"], leg["strike"], leg["premium"])
     
     def calculate_combined_trades_payoff(self, trades: List[Trade], spot_price: float) -> Dict[str, Any]:
         """Calculate combined payoff for multiple trades"""
@@ -304,34 +321,11 @@ class StrategyManager:
             min_strike = min(all_strikes)
             max_strike = max(all_strikes)
             
-            # Create price range with wider range for better visualization
-            price_range = np.arange(
-                min_strike - 1000, 
-                max_strike + 1000, 
-                10
+            # Wider range for better visualization
+            price_range, payoffs, max_profit, max_loss, breakevens = _compute_payoff_curve(
+                _payoff_key(all_legs), min_strike - 1000, max_strike + 1000
             )
-            
-            # Calculate combined payoffs
-            payoffs = []
-            
-            for price in price_range:
-                total_payoff = 0
-                for leg in all_legs:
-                    leg_payoff = self._calculate_leg_payoff(price, leg)
-                    total_payoff += leg_payoff * leg["quantity"]
-                payoffs.append(total_payoff)
-            
-            payoffs = np.array(payoffs)
-            
-            # Find max profit and loss
-            max_profit = np.max(payoffs)
-            max_loss = np.min(payoffs)
-            
-            # Find breakeven points
-            breakevens = []
-            for i in range(1, len(price_range)):
-                if payoffs[i-1] * payoffs[i] < 0:
-                    breakevens.append(round(price_range[i], 2))
+            breakevens = list(breakevens)
             
             # Calculate current payoff
             current_payoff = payoffs[np.argmin(np.abs(price_range - spot_price))]
@@ -388,23 +382,12 @@ class StrategyManager:
             min_strike = min(all_strikes)
             max_strike = max(all_strikes)
             
-            price_range = np.arange(
-                min_strike - 1000, 
-                max_strike + 1000, 
-                10
-            )
-            
-            # Calculate payoffs for each expiry
+            # Calculate payoffs for each expiry over a shared price range
             expiry_payoffs = {}
             for expiry, legs in legs_by_expiry.items():
-                payoffs = []
-                for price in price_range:
-                    total_payoff = 0
-                    for leg in legs:
-                        leg_payoff = self._calculate_leg_payoff(price, leg)
-                        total_payoff += leg_payoff * leg["quantity"]
-                    payoffs.append(total_payoff)
-                expiry_payoffs[expiry] = np.array(payoffs)
+                price_range, expiry_payoffs[expiry], _, _, _ = _compute_payoff_curve(
+                    _payoff_key(legs), min_strike - 1000, max_strike + 1000
+                )
             
             # For calendar spread, use the nearest expiry for breakeven calculation
             # (This matches broker terminal behavior)
@@ -422,17 +405,12 @@ class StrategyManager:
             max_loss = np.min(payoffs)
             
             # Find breakeven points
-            breakevens = []
-            for i in range(1, len(price_range)):
-                if payoffs[i-1] * payoffs[i] < 0:
-                    # Linear interpolation for more accurate breakeven
-                    x1, y1 = price_range[i-1], payoffs[i-1]
-                    x2, y2 = price_range[i], payoffs[i]
-                    if y2 != y1:
-                        breakeven = x1 - y1 * (x2 - x1) / (y2 - y1)
-                        breakevens.append(round(breakeven, 2))
-                    else:
-                        breakevens.append(round(price_range[i], 2))
+            # Linear interpolation between the grid points either side of each sign change
+            # (a sign change guarantees y2 != y1)
+            crossings = np.flatnonzero(payoffs[:-1] * payoffs[1:] < 0)
+            x1, y1 = price_range[crossings], payoffs[crossings]
+            x2, y2 = price_range[crossings + 1], payoffs[crossings + 1]
+            breakevens = [round(be, 2) for be in x1 - y1 * (x2 - x1) / (y2 - y1)]
             
             # Calculate current payoff
             current_payoff_idx = np.argmin(np.abs(price_range - spot_price))
@@ -455,8 +433,13 @@ class StrategyManager:
             return {}
     
     def plot_iron_condor(self, trade: Trade, spot_price: float, save_path: Optional[str] = None):
-        """Plot Iron Condor payoff diagram"""
+        """Plot Iron Condor payoff diagram off-screen, optionally saving it; returns the Figure"""
         try:
+            # Rendered off-screen on a plain Agg canvas - no pyplot figure manager or GUI
+            # window is created, and nothing is left registered with pyplot afterwards
+            from matplotlib.figure import Figure
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+            
             payoff_data = self.calculate_trade_payoff(trade, spot_price)
             
             if not payoff_data:
@@ -464,35 +447,37 @@ class StrategyManager:
                 return
             
             # Create the plot
-            plt.figure(figsize=(12, 8))
+            fig = Figure(figsize=(12, 8))
+            FigureCanvasAgg(fig)
+            ax = fig.add_subplot()
             
             # Plot payoff curve
-            plt.plot(payoff_data["price_range"], payoff_data["payoffs"], 
+            ax.plot(payoff_data["price_range"], payoff_data["payoffs"], 
                     'b-', linewidth=2, label='Payoff at Expiry')
             
             # Mark current spot price
-            plt.axvline(x=spot_price, color='red', linestyle='--', 
+            ax.axvline(x=spot_price, color='red', linestyle='--', 
                        label=f'Current Spot: {spot_price}')
             
             # Mark strikes
             strikes = [leg.strike_price for leg in trade.legs]
             for strike in strikes:
-                plt.axvline(x=strike, color='gray', linestyle=':', alpha=0.7)
+                ax.axvline(x=strike, color='gray', linestyle=':', alpha=0.7)
             
             # Mark breakeven points
             for be in payoff_data["breakevens"]:
-                plt.axvline(x=be, color='green', linestyle=':', alpha=0.7)
-                plt.text(be, payoff_data["max_profit"] * 0.1, f'BE: {be}', 
+                ax.axvline(x=be, color='green', linestyle=':', alpha=0.7)
+                ax.text(be, payoff_data["max_profit"] * 0.1, f'BE: {be}', 
                         rotation=90, ha='right', va='bottom')
             
             # Formatting
-            plt.xlabel('NIFTY Price at Expiry')
-            plt.ylabel('Profit/Loss (₹)')
-            plt.title(f'Iron Condor Strategy - {trade.trade_id}\n'
+            ax.set_xlabel('NIFTY Price at Expiry')
+            ax.set_ylabel('Profit/Loss (₹)')
+            ax.set_title(f'Iron Condor Strategy - {trade.trade_id}\n'
                      f'Max Profit: ₹{payoff_data["max_profit"]:.0f} | '
                      f'Max Loss: ₹{payoff_data["max_loss"]:.0f}')
-            plt.grid(True, alpha=0.3)
-            plt.legend()
+            ax.grid(True, alpha=0.3)
+            ax.legend()
             
             # Add strategy details
             strategy_text = f"""Strategy Details:
@@ -500,17 +485,17 @@ Strikes: {sorted(strikes)}
 Current P&L: ₹{payoff_data["current_payoff"]:.0f}
 Breakevens: {payoff_data["breakevens"]}"""
             
-            plt.text(0.02, 0.98, strategy_text, transform=plt.gca().transAxes,
+            ax.text(0.02, 0.98, strategy_text, transform=ax.transAxes,
                     verticalalignment='top', bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8))
             
-            plt.tight_layout()
+            fig.tight_layout()
             
             if save_path:
-                plt.savefig(save_path, dpi=300, bbox_inches='tight')
+                fig.savefig(save_path, dpi=300, bbox_inches='tight')
                 logger.info(f"Plot saved to {save_path}")
             
-            # Don't call plt.show() - the chart will be displayed in Grid 2 by the main app
-            # plt.show()  # Commented out to prevent new window
+            # The chart shown in Grid 2 is drawn by the main app - this figure is only for saving
+            return fig
             
         except Exception as e:
             logger.error(f"Error plotting Iron Condor: {e}")
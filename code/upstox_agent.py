@@ -563,7 +563,8 @@ class UpstoxAgent(BrokerAgent):
         """Handle incoming messages from MarketDataStreamerV3"""
         try:
             # Log the received message
-            logger.debug(f"Received live data message: {message}")
+            # Lazy argument - the message is only stringified when DEBUG is enabled
+            logger.debug("Received live data message: %s", message)
             
             # Call registered callbacks
             for callback in self.live_data_callbacks:
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Test script for downsampling zoomed-out candles in LiveChartVisualizer.
+"""
+
+import sys
+import os
+import random
+sys.path.append(os.path.join(os.path.dirname(__file__), 'code'))
+
+import numpy as np
+from chart_visualizer import LiveChartVisualizer
+from datetime import datetime, timedelta
+
+NIFTY = "NSE_INDEX|Nifty 50"
+
+def _make_candles(count):
+    """Random-walk 5-minute candles"""
+    rng = random.Random(3)
+    start = datetime(2024, 1, 1, 9, 15)
+    candles = []
+    price = 24000.0
+    for i in range(count):
+        open_price = price
+        price += rng.uniform(-20, 20)
+        candles.append({
+            'timestamp': start + timedelta(minutes=5 * i),
+            'open': open_price,
+            'high': max(open_price, price) + rng.uniform(0, 10),
+            'low': min(open_price, price) - rng.uniform(0, 10),
+            'close': price,
+            'volume': 100
+        })
+    return candles
+
+def test_zoomed_out_candles_downsampled():
+    """Test that more candles than pixel columns are drawn as min/max buckets"""
+    print("=== Testing Candle Downsampling ===")
+
+    try:
+        candles = _make_candles(1000)
+        chart = LiveChartVisualizer("Test Chart", max_candles=1000)
+        chart.fig.set_size_inches(2, 2)
+        chart._store_intraday_data(NIFTY, candles)
+        chart._draw_charts()
+
+        buckets = int(chart.price_ax.bbox.width)
+        bodies = [rect for patch in chart._body_patches for rect in patch.get_path().vertices.reshape(-1, 5, 2)]
+        assert 0 < len(bodies) <= buckets, f"{len(bodies)} bodies for {buckets} pixel columns"
+
+        # The extremes of the day survive the merge
+        wick_y = chart._wick_patch.get_path().vertices[:, 1]
+        assert np.isclose(wick_y.max(), max(candle['high'] for candle in candles))
+        assert np.isclose(wick_y.min(), min(candle['low'] for candle in candles))
+
+        # Zooming in past the threshold draws the individual candles again
+        first = chart._candle_geometry[NIFTY]['x'][0]
+        chart.price_ax.set_xlim(first, first + 0.1)
+        visible = np.count_nonzero(chart._candle_geometry[NIFTY]['x'] <= first + 0.1)
+        assert sum(len(patch.get_path().vertices) for patch in chart._body_patches) == 5 * (visible + 2)
+
+        print(f"✅ {len(candles)} candles drawn as {len(bodies)} buckets")
+
+    except Exception as e:
+        print(f"❌ Candle downsampling test failed: {e}")
+        raise
+
+if __name__ == "__main__":
+    test_zoomed_out_candles_downsampled()
+    print("\n✅ All candle downsampling tests passed!")
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Test script for candlestick hover hit-testing in LiveChartVisualizer.
+"""
+
+import sys
+import os
+import random
+sys.path.append(os.path.join(os.path.dirname(__file__), 'code'))
+
+from chart_visualizer import LiveChartVisualizer
+from datetime import datetime, timedelta
+import matplotlib.dates as mdates
+from matplotlib.backend_bases import MouseEvent
+
+NIFTY = "NSE_INDEX|Nifty 50"
+
+def _reference_closest(candles, x, y):
+    """Linear scan with the same bounds and distance rules as the chart"""
+    closest = None
+    min_distance = float('inf')
+    for candle in candles:
+        candle_x = mdates.date2num(candle['timestamp'])
+        if candle_x - 0.0035 / 2 <= x <= candle_x + 0.0035 / 2 and candle['low'] <= y <= candle['high']:
+            return candle
+        distance = abs(x - candle_x) + abs(y - candle['close']) * 0.001
+        if distance < min_distance:
+            min_distance = distance
+            closest = candle
+    return closest if min_distance < 0.01 else None
+
+def test_hit_test_matches_linear_scan():
+    """Test that the indexed lookup finds the same candle as a full scan"""
+    print("=== Testing Candlestick Hit-Testing ===")
+
+    try:
+        rng = random.Random(7)
+        chart = LiveChartVisualizer("Test Chart", max_candles=500)
+        chart.add_instrument(NIFTY)
+
+        start = datetime(2024, 1, 1, 9, 15)
+        candles = []
+        price = 24000.0
+        for i in range(75):
+            open_price = price
+            price += rng.uniform(-20, 20)
+            candles.append({
+                'timestamp': start + timedelta(minutes=5 * i),
+                'open': open_price,
+                'high': max(open_price, price) + rng.uniform(0, 10),
+                'low': min(open_price, price) - rng.uniform(0, 10),
+                'close': price,
+                'volume': 100
+            })
+        chart._store_intraday_data(NIFTY, candles)
+        chart._draw_charts()
+
+        x_min = mdates.date2num(candles[0]['timestamp']) - 0.02
+        x_max = mdates.date2num(candles[-1]['timestamp']) + 0.02
+        y_min = min(candle['low'] for candle in candles) - 10
+        y_max = max(candle['high'] for candle in candles) + 10
+        matches = 0
+        for _ in range(500):
+            x = rng.uniform(x_min, x_max)
+            y = rng.uniform(y_min, y_max)
+            expected = _reference_closest(chart.get_candle_data(NIFTY), x, y)
+            found = chart._find_closest_candlestick(x, y)
+            if expected is None:
+                assert found is None, f"Unexpected hit at x={x}, y={y}"
+            else:
+                assert found is not None, f"Missed candle at x={x}, y={y}"
+                assert found['candle'] == expected
+                assert found['instrument'] == NIFTY
+                matches += 1
+
+        assert chart._find_closest_candlestick(None, None) is None
+        print(f"✅ Hit-testing matched the linear scan ({matches} hits)")
+
+    except Exception as e:
+        print(f"❌ Hit-testing test failed: {e}")
+        raise
+
+def test_hit_test_across_instruments():
+    """Test that candles of every instrument are found through the merged lookup"""
+    print("\n=== Testing Hit-Testing Across Instruments ===")
+
+    try:
+        chart = LiveChartVisualizer("Test Chart")
+        start = datetime(2024, 1, 1, 9, 15)
+        for offset, instrument_key in enumerate(("A", "B")):
+            chart._store_intraday_data(instrument_key, [{
+                'timestamp': start + timedelta(minutes=10 * i + 5 * offset),
+                'open': 100.0, 'high': 110.0, 'low': 90.0, 'close': 105.0, 'volume': 1
+            } for i in range(10)])
+        chart._draw_charts()
+
+        for offset, instrument_key in enumerate(("A", "B")):
+            timestamp = start + timedelta(minutes=30 + 5 * offset)
+            found = chart._find_closest_candlestick(mdates.date2num(timestamp), 100.0)
+            assert found is not None and found['instrument'] == instrument_key
+            assert found['x'] == timestamp
+
+        print("✅ Merged lookup finds candles of both instruments")
+
+    except Exception as e:
+        print(f"❌ Multi-instrument hit-testing test failed: {e}")
+        raise
+
+def test_hover_overlays_blit():
+    """Test that moving the mouse over candles updates the overlays without full redraws"""
+    print("\n=== Testing Hover Overlay Blitting ===")
+
+    try:
+        chart = LiveChartVisualizer("Test Chart")
+        start = datetime(2024, 1, 1, 9, 15)
+        chart._store_intraday_data(NIFTY, [{
+            'timestamp': start + timedelta(minutes=5 * i),
+            'open': 100.0, 'high': 110.0, 'low': 90.0, 'close': 105.0 if i % 2 else 95.0, 'volume': 1
+        } for i in range(20)])
+        chart._draw_charts()
+        chart._setup_tooltips()
+        chart._needs_full_draw = False
+        chart.fig.canvas.draw()
+
+        draws = []
+        chart.fig.canvas.draw_idle = lambda *args, **kwargs: draws.append(1)
+        x, y = chart.price_ax.transData.transform((mdates.date2num(start + timedelta(minutes=25)), 100.0))
+        for dx in range(5):
+            chart._process_hover(MouseEvent('motion_notify_event', chart.fig.canvas, x + dx, y))
+
+        assert not draws, "Hovering triggered a full redraw"
+        assert chart.hover_labels['close'].get_text() == "C: ₹105.00"
+        assert chart.time_label.get_visible() and chart.time_label in chart._animated_artists()
+
+        # Leaving the axes hides the overlays, again without a full redraw
+        chart._process_hover(MouseEvent('motion_notify_event', chart.fig.canvas, 1, 1))
+        assert not draws and not chart.time_label.get_visible()
+        assert chart.time_label not in chart._animated_artists()
+
+        print("✅ Hover overlays blitted")
+
+    except Exception as e:
+        print(f"❌ Hover overlay blitting test failed: {e}")
+        raise
+
+def test_repeated_hover_skipped():
+    """Test that a motion event at the last processed position is not processed again"""
+    print("\n=== Testing Repeated Hover Positions ===")
+
+    try:
+        chart = LiveChartVisualizer("Test Chart")
+        start = datetime(2024, 1, 1, 9, 15)
+        chart._store_intraday_data(NIFTY, [{
+            'timestamp': start + timedelta(minutes=5 * i),
+            'open': 100.0, 'high': 110.0, 'low': 90.0, 'close': 105.0, 'volume': 1
+        } for i in range(20)])
+        chart._draw_charts()
+        chart._setup_tooltips()
+        chart.fig.canvas.draw()
+
+        processed = []
+        process_hover = chart._process_hover
+        chart._process_hover = lambda event: (processed.append(event), process_hover(event))
+        x, y = chart.price_ax.transData.transform((mdates.date2num(start + timedelta(minutes=95)), 100.0))
+        for _ in range(3):
+            chart._on_hover(MouseEvent('motion_notify_event', chart.fig.canvas, x, y))
+        assert len(processed) == 1, f"{len(processed)} events processed"
+
+        # The same position is processed again once the candles under it changed
+        chart._update_candle_data(NIFTY, 120.0, 1, start + timedelta(minutes=95, seconds=30))
+        chart._draw_charts()
+        chart._on_hover(MouseEvent('motion_notify_event', chart.fig.canvas, x, y))
+        assert len(processed) == 2
+        assert chart.hover_labels['high'].get_text() == "H: ₹120.00"
+
+        # Hovering an empty chart must not hide the candles that arrive later
+        chart = LiveChartVisualizer("Test Chart")
+        chart._setup_tooltips()
+        chart.fig.canvas.draw()
+        chart._store_intraday_data(NIFTY, [{
+            'timestamp': start + timedelta(minutes=5 * i),
+            'open': 100.0, 'high': 110.0, 'low': 90.0, 'close': 105.0, 'volume': 1
+        } for i in range(20)])
+        event = MouseEvent('motion_notify_event', chart.fig.canvas, 100, 100)
+        event.inaxes, event.xdata, event.ydata = chart.price_ax, mdates.date2num(start + timedelta(minutes=95)), 100.0
+        chart._hover_event = event
+        chart._flush_hover()
+        assert chart.time_label is None or not chart.time_label.get_visible()
+        chart._draw_charts()
+        chart._hover_event = event
+        chart._flush_hover()
+        assert chart.time_label is not None and chart.time_label.get_visible(), \
+            "Hover after candles arrived was skipped"
+
+        print("✅ Repeated hover positions skipped")
+
+    except Exception as e:
+        print(f"❌ Repeated hover test failed: {e}")
+        raise
+
+def test_last_hit_reused():
+    """Test that a cursor inside the last matched candle reuses the match until candles change"""
+    print("\n=== Testing Last Hit Reuse ===")
+
+    try:
+        chart = LiveChartVisualizer("Test Chart")
+        start = datetime(2024, 1, 1, 9, 15)
+        chart._store_intraday_data(NIFTY, [{
+            'timestamp': start + timedelta(minutes=5 * i),
+            'open': 100.0, 'high': 110.0, 'low': 90.0, 'close': 105.0, 'volume': 1
+        } for i in range(20)])
+        chart._draw_charts()
+
+        x = mdates.date2num(start + timedelta(minutes=95))
+        first = chart._find_closest_candlestick(x, 100.0)
+        assert first is not None and first['x'] == start + timedelta(minutes=95)
+        assert chart._find_closest_candlestick(x + 0.0005, 95.0) is first
+
+        # Leaving the candle falls back to the full search
+        assert chart._find_closest_candlestick(x, 200.0) is None
+
+        # A new tick rebuilds the lookup, so the stale match is not returned
+        chart._update_candle_data(NIFTY, 120.0, 1, start + timedelta(minutes=95, seconds=30))
+        chart._draw_charts()
+        found = chart._find_closest_candlestick(x, 100.0)
+        assert found is not first and found['candle']['high'] == 120.0
+
+        print("✅ Last hit reused")
+
+    except Exception as e:
+        print(f"❌ Last hit reuse test failed: {e}")
+        raise
+
+if __name__ == "__main__":
+    test_hit_test_matches_linear_scan()
+    test_hit_test_across_instruments()
+    test_hover_overlays_blit()
+    test_repeated_hover_skipped()
+    test_last_hit_reused()
+    print("\n✅ All hit-testing tests passed!")
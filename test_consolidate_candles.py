@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Test script for consolidating 1-minute candles in LiveChartVisualizer.
+"""
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), 'code'))
+
+from chart_visualizer import LiveChartVisualizer
+from datetime import datetime
+
+def _candle(minute, open_, high, low, close, volume):
+    return {'timestamp': datetime(2024, 1, 1, 9, minute), 'open': open_, 'high': high,
+            'low': low, 'close': close, 'volume': volume}
+
+def test_consolidate_candles():
+    """Test that 1-minute candles fold into 5-minute OHLCV buckets"""
+    print("=== Testing Candle Consolidation ===")
+
+    try:
+        chart = LiveChartVisualizer("Test Chart")
+        candles = [
+            _candle(17, 102.0, 104.0, 101.0, 103.0, 5),
+            _candle(15, 100.0, 101.0, 99.0, 100.5, 10),
+            _candle(16, None, 106.0, 100.0, 102.0, 20),
+            # 09:20 bucket starts with an ISO string with an offset; 09:25-09:29 is empty
+            {'timestamp': '2024-01-01T09:21:00+05:30', 'open': 103.0, 'high': 103.5,
+             'low': 98.0, 'close': 99.0, 'volume': None},
+            _candle(31, 99.0, 100.0, 97.0, 98.0, 7),
+            # Bucket with no close is dropped
+            _candle(36, 98.0, 99.0, 96.0, None, 1),
+        ]
+
+        result = chart._consolidate_candles(candles)
+
+        assert [c['timestamp'] for c in result] == [
+            datetime(2024, 1, 1, 9, 15), datetime(2024, 1, 1, 9, 20), datetime(2024, 1, 1, 9, 30)]
+        assert result[0] == {'timestamp': datetime(2024, 1, 1, 9, 15), 'open': 100.0, 'high': 106.0,
+                             'low': 99.0, 'close': 103.0, 'volume': 35.0}
+        assert result[1]['volume'] == 0.0
+        assert (result[2]['open'], result[2]['close']) == (99.0, 98.0)
+        assert chart._consolidate_candles([]) == []
+
+        print("✅ Candle consolidation passed")
+
+    except Exception as e:
+        print(f"❌ Candle consolidation test failed: {e}")
+        raise
+
+if __name__ == "__main__":
+    test_consolidate_candles()
+    print("\n✅ All candle consolidation tests passed!")
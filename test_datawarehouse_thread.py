@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Test script for the datawarehouse fetch thread in LiveChartVisualizer.
+"""
+
+import sys
+import os
+import time
+import threading
+sys.path.append(os.path.join(os.path.dirname(__file__), 'code'))
+
+from chart_visualizer import LiveChartVisualizer
+
+NIFTY = "NSE_INDEX|Nifty 50"
+
+class _PriceSource:
+    """Datawarehouse stand-in that counts price lookups"""
+    def __init__(self):
+        self.calls = 0
+
+    def get_latest_price(self, instrument_key):
+        self.calls += 1
+        return 24000.0 + self.calls
+
+def test_single_fetch_thread():
+    """Test that periodic fetches run on one long-lived thread that stops cleanly"""
+    print("=== Testing Datawarehouse Fetch Thread ===")
+
+    try:
+        chart = LiveChartVisualizer("Test Chart")
+        chart.add_instrument(NIFTY)
+        source = _PriceSource()
+        chart.set_datawarehouse(source)
+        chart.datawarehouse_update_interval = 0.02
+
+        chart.start_datawarehouse_timer()
+        chart.start_datawarehouse_timer()  # Already running - no second thread
+        thread = chart.datawarehouse_thread
+        fetch_threads = set()
+        for _ in range(15):
+            time.sleep(0.02)
+            fetch_threads.update(t for t in threading.enumerate() if t.name == "DatawarehouseFetch")
+
+        assert fetch_threads <= {thread}, "Fetch cycles spawned new threads"
+        if source.calls:
+            assert source.calls > 1 and chart.datawarehouse_thread is thread
+            assert chart.current_prices[NIFTY] == 24000.0 + source.calls
+        else:
+            # After market close the first cycle stops the thread instead of fetching
+            assert chart.datawarehouse_thread is None
+
+        chart.stop_datawarehouse_timer()
+        thread.join(1.0)
+        assert not thread.is_alive(), "Fetch thread did not stop"
+        assert chart.datawarehouse_thread is None
+
+        print(f"✅ {source.calls} fetches on one thread")
+
+    except Exception as e:
+        print(f"❌ Datawarehouse fetch thread test failed: {e}")
+        raise
+
+if __name__ == "__main__":
+    test_single_fetch_thread()
+    print("\n✅ All datawarehouse thread tests passed!")
@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Test script for incremental candle geometry updates in LiveChartVisualizer.
+"""
+
+import sys
+import os
+import random
+sys.path.append(os.path.join(os.path.dirname(__file__), 'code'))
+
+import numpy as np
+from unittest import mock
+import chart_visualizer
+from chart_visualizer import LiveChartVisualizer
+import matplotlib.dates as mdates
+from datetime import datetime, timedelta
+
+NIFTY = "NSE_INDEX|Nifty 50"
+
+def _body_rects(chart):
+    """Body rectangle corners of the chart, one (4, 2) array per candle"""
+    return [rect for patch in chart._body_patches for rect in patch.get_path().vertices.reshape(-1, 5, 2)[:, :4]]
+
+def _collections(chart):
+    """Current wick segments and body vertices of the chart"""
+    wicks = sorted(tuple(segment.ravel()) for segment in chart._wick_patch.get_path().vertices.reshape(-1, 2, 2))
+    bodies = [tuple(rect.ravel()) for rect in _body_rects(chart)]
+    return wicks, sorted(bodies)
+
+def test_incremental_matches_full_rebuild():
+    """Test that drawing after every tick gives the same artists as one full draw"""
+    print("=== Testing Incremental Candle Geometry ===")
+
+    try:
+        rng = random.Random(3)
+        incremental = LiveChartVisualizer("Test Chart", max_candles=15)
+        incremental.add_instrument(NIFTY)
+
+        timestamp = datetime(2024, 1, 1, 9, 15)
+        for tick in range(400):
+            timestamp += timedelta(seconds=rng.randint(1, 40))
+            incremental._update_candle_data(NIFTY, 24000 + rng.uniform(-50, 50), rng.randint(0, 10), timestamp)
+            # Later ticks skip draws, so several candles are evicted between two draws
+            if tick < 200 or rng.random() < 0.1:
+                incremental._draw_charts()
+        incremental._draw_charts()
+
+        full = LiveChartVisualizer("Test Chart", max_candles=15)
+        full.add_instrument(NIFTY)
+        for candle in incremental.get_candle_data(NIFTY):
+            full.candle_data[NIFTY].append(dict(candle))
+        full._ohlc_rebuild(NIFTY)
+        full._draw_charts()
+
+        assert _collections(incremental) == _collections(full), "Incremental geometry differs from full rebuild"
+        x, candles, _ = incremental._hover_index[NIFTY]
+        assert len(x) == len(candles) == len(incremental.candle_data[NIFTY])
+        assert list(candles) == list(incremental.candle_data[NIFTY])
+
+        print(f"✅ {len(incremental.candle_data[NIFTY])} candles match a full rebuild")
+
+    except Exception as e:
+        print(f"❌ Incremental candle geometry test failed: {e}")
+        raise
+
+def test_offscreen_candles_culled():
+    """Test that only candles near the visible x range are loaded into the collections"""
+    print("\n=== Testing Off-Screen Candle Culling ===")
+
+    try:
+        chart = LiveChartVisualizer("Test Chart")
+        start = datetime(2024, 1, 1, 9, 15)
+        chart._store_intraday_data(NIFTY, [{
+            'timestamp': start + timedelta(minutes=5 * i),
+            'open': 100.0, 'high': 110.0, 'low': 90.0, 'close': 105.0, 'volume': 1
+        } for i in range(75)])
+        chart._draw_charts()
+        assert len(_body_rects(chart)) == 75
+
+        # Zoom to 10 candles - collections follow through the xlim_changed callback
+        chart.price_ax.set_xlim(mdates.date2num(start + timedelta(minutes=100)),
+                                mdates.date2num(start + timedelta(minutes=150)))
+        visible = len(_body_rects(chart))
+        assert 11 <= visible <= 15, f"{visible} candle bodies loaded for an 11-candle view"
+
+        print(f"✅ {visible} of 75 candles loaded for the zoomed view")
+
+    except Exception as e:
+        print(f"❌ Off-screen culling test failed: {e}")
+        raise
+
+def test_unchanged_candles_skip_axis_updates():
+    """Test that redrawing without new candle data leaves the axis scaling alone"""
+    print("\n=== Testing Unchanged Redraw ===")
+
+    try:
+        chart = LiveChartVisualizer("Test Chart")
+        chart.add_instrument(NIFTY)
+        chart._update_candle_data(NIFTY, 24000.0, 5, datetime(2024, 1, 1, 9, 15))
+        chart._draw_charts()
+
+        calls = []
+        chart._format_x_axis_time = lambda: calls.append('x')
+        chart._update_y_axis_scale = lambda: calls.append('y')
+        chart._draw_charts()
+        assert calls == [], f"Axes rescaled without new candles: {calls}"
+
+        chart._update_candle_data(NIFTY, 24010.0, 5, datetime(2024, 1, 1, 9, 16))
+        chart._draw_charts()
+        assert sorted(calls) == ['x', 'y']
+
+        print("✅ Unchanged redraw passed")
+
+    except Exception as e:
+        print(f"❌ Unchanged redraw test failed: {e}")
+        raise
+
+class _LiveTimer:
+    """Stand-in for a GUI frame timer (anything but the inert TimerBase)"""
+    def stop(self):
+        pass
+
+def test_data_load_redraws_with_next_frame():
+    """Test that loading candles under a live frame timer defers the redraw to the next frame"""
+    print("\n=== Testing Deferred Redraw ===")
+
+    try:
+        chart = LiveChartVisualizer("Test Chart")
+        forced = []
+        chart.force_chart_update = lambda: forced.append(True)
+        chart.is_running = True
+        chart.frame_timer = _LiveTimer()
+
+        candles = [{'timestamp': datetime(2024, 1, 1, 9, 15) + timedelta(minutes=5 * i),
+                    'open': 100.0, 'high': 110.0, 'low': 90.0, 'close': 105.0, 'volume': 1} for i in range(3)]
+        chart._store_intraday_data(NIFTY, candles)
+        chart.request_chart_update()
+        assert forced == [] and chart._pending_redraw, "Data load should wait for the next frame"
+
+        chart._animate(0)
+        assert not chart._pending_redraw
+        assert len(_collections(chart)[1]) == 3, "Next frame did not draw the loaded candles"
+
+        # Without a frame timer the update happens right away
+        chart.frame_timer = None
+        chart.request_chart_update()
+        assert forced == [True]
+
+        print("✅ Deferred redraw passed")
+
+    except Exception as e:
+        print(f"❌ Deferred redraw test failed: {e}")
+        raise
+
+def test_invalid_candles_skipped():
+    """Test that non-positive and non-finite candles are masked out with one warning"""
+    print("\n=== Testing Invalid Candles ===")
+
+    try:
+        chart = LiveChartVisualizer("Test Chart")
+        start = datetime(2024, 1, 1, 9, 15)
+        chart._store_intraday_data(NIFTY, [
+            {'timestamp': start, 'open': 100.0, 'high': 110.0, 'low': 90.0, 'close': 105.0, 'volume': 1},
+            {'timestamp': start + timedelta(minutes=5), 'open': 0.0, 'high': 110.0, 'low': 90.0, 'close': 105.0, 'volume': 1},
+            {'timestamp': start + timedelta(minutes=10), 'open': 100.0, 'high': float('inf'), 'low': 90.0, 'close': 105.0, 'volume': 1},
+        ])
+
+        warnings = []
+        chart.logger.warning = warnings.append
+        chart._draw_charts()
+
+        assert len(_collections(chart)[1]) == 1, "Invalid candles were drawn"
+        assert len(chart._hover_index[NIFTY][0]) == 1
+        assert [w for w in warnings if 'invalid' in w] == [f"Skipping 2 invalid candles for {NIFTY}"]
+
+        print("✅ Invalid candles passed")
+
+    except Exception as e:
+        print(f"❌ Invalid candles test failed: {e}")
+        raise
+
+def test_no_axes_skips_drawing():
+    """Test that a chart without axes binds a no-op draw and still folds ticks into candles"""
+    print("\n=== Testing Chart Without Axes ===")
+
+    try:
+        with mock.patch.object(chart_visualizer.plt, 'subplots', side_effect=RuntimeError("no display")):
+            chart = LiveChartVisualizer("Test Chart")
+        assert chart.price_ax is None
+        assert chart._draw_charts() is None
+
+        chart.add_instrument(NIFTY)
+        chart.is_running = True
+        chart.data_queue.append((NIFTY, datetime(2024, 1, 1, 9, 15), 24000.0, 5))
+        chart.process_data_queue()
+        assert len(chart.candle_data[NIFTY]) == 1
+
+        print("✅ Chart without axes passed")
+
+    except Exception as e:
+        print(f"❌ Chart without axes test failed: {e}")
+        raise
+
+def test_last_update_time_from_arrays():
+    """Test that the last update time falls back to the newest stored candle"""
+    print("=== Testing Last Update Time ===")
+
+    try:
+        chart = LiveChartVisualizer("Test Chart")
+        assert chart._get_last_update_time() is None
+
+        start = datetime(2024, 1, 1, 9, 15)
+        candles = [{'timestamp': start + timedelta(minutes=5 * i, seconds=7), 'open': 24000.0,
+                    'high': 24010.0, 'low': 23990.0, 'close': 24005.0, 'volume': 100} for i in range(12)]
+        chart._store_intraday_data(NIFTY, candles)
+        chart.last_update_time = None
+        assert chart._get_last_update_time() == "10:10:07", chart._get_last_update_time()
+
+        print("✅ Last update time passed")
+
+    except Exception as e:
+        print(f"❌ Last update time test failed: {e}")
+        raise
+
+def test_candles_restored_after_empty_chart():
+    """Test that the same candles stored again after an empty frame are laid out again"""
+    print("=== Testing Candles Restored After Empty Chart ===")
+
+    try:
+        chart = LiveChartVisualizer("Test Chart")
+        start = datetime(2024, 1, 1, 9, 15)
+        candles = [{'timestamp': start + timedelta(minutes=5 * i), 'open': 24000.0,
+                    'high': 24010.0, 'low': 23990.0, 'close': 24005.0, 'volume': 100} for i in range(20)]
+        chart._store_intraday_data(NIFTY, candles)
+        chart._draw_charts()
+        expected_xlim = chart.price_ax.get_xlim()
+
+        chart.candle_data[NIFTY].clear()
+        chart._draw_charts()
+        assert chart.price_ax.get_xlim() == (0.0, 1.0)
+
+        chart._store_intraday_data(NIFTY, candles)
+        chart._draw_charts()
+        assert chart.price_ax.get_xlim() == expected_xlim, chart.price_ax.get_xlim()
+        assert len(_body_rects(chart)) == 20, f"{len(_body_rects(chart))} bodies drawn"
+
+        print("✅ Candles restored after empty chart passed")
+
+    except Exception as e:
+        print(f"❌ Candles restored after empty chart test failed: {e}")
+        raise
+
+if __name__ == "__main__":
+    test_incremental_matches_full_rebuild()
+    test_offscreen_candles_culled()
+    test_unchanged_candles_skip_axis_updates()
+    test_data_load_redraws_with_next_frame()
+    test_invalid_candles_skipped()
+    test_no_axes_skips_drawing()
+    test_last_update_time_from_arrays()
+    test_candles_restored_after_empty_chart()
+    print("\n✅ All incremental candle tests passed!")
@@ -135,7 +135,7 @@ def test_intraday_chart_debug():
         # Check final chart state
         print("\n7. Checking final chart state...")
         print(f"  - Chart running: {chart.is_running}")
-        print(f"  - Animation running: {chart.ani is not None}")
+        print(f"  - Animation running: {chart.frame_timer is not None}")
         print(f"  - Candle data count: {len(chart.candle_data.get('NIFTY', []))}")
         
         # Show window briefly
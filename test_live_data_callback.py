@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Test script for the interval-limited live data callback in LiveChartVisualizer.
+"""
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), 'code'))
+
+from chart_visualizer import LiveChartVisualizer
+
+def test_interval_flushes_all_instruments():
+    """Test that each interval flush reports every instrument that ticked since the last one"""
+    print("=== Testing Live Data Callback Interval ===")
+
+    try:
+        chart = LiveChartVisualizer("Test Chart")
+        calls = []
+        chart.set_live_data_callback(lambda key, price, volume: calls.append((key, price, volume)))
+
+        # First tick flushes immediately
+        chart._call_live_data_callback_with_interval("NIFTY", 24000.0, 1)
+        assert calls == [("NIFTY", 24000.0, 1)]
+
+        # Within the interval - only stored
+        chart._call_live_data_callback_with_interval("BANKNIFTY", 51000.0, 2)
+        chart._call_live_data_callback_with_interval("NIFTY", 24010.0, 3)
+        assert len(calls) == 1
+        assert chart.pending_price == {"NIFTY": 24010.0, "BANKNIFTY": 51000.0}
+
+        # Interval elapsed - the waiting instrument is flushed along with the one that ticked
+        chart.last_grid2_update -= chart.grid2_update_interval
+        chart.pending_timestamp["BANKNIFTY"] -= chart.grid2_update_interval / 2
+        chart._call_live_data_callback_with_interval("NIFTY", 24020.0, 4)
+        assert sorted(calls[1:]) == [("BANKNIFTY", 51000.0, 2), ("NIFTY", 24020.0, 4)]
+
+        print("✅ Live data callback interval passed")
+
+    except Exception as e:
+        print(f"❌ Live data callback interval test failed: {e}")
+        raise
+
+if __name__ == "__main__":
+    test_interval_flushes_all_instruments()
+    print("\n✅ All live data callback tests passed!")
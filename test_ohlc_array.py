@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Test script for the per-instrument OHLC arrays kept alongside candle_data.
+"""
+
+import sys
+import os
+import random
+sys.path.append(os.path.join(os.path.dirname(__file__), 'code'))
+
+from chart_visualizer import LiveChartVisualizer
+from datetime import datetime, timedelta
+
+NIFTY = "NSE_INDEX|Nifty 50"
+
+def _assert_mirrors(chart, instrument_key):
+    """The OHLC array must hold exactly the candles in candle_data"""
+    ohlc = chart.get_candle_arrays(instrument_key)
+    candles = chart.candle_data[instrument_key]
+    assert len(ohlc) == len(candles), f"{len(ohlc)} rows for {len(candles)} candles"
+    for row, candle in zip(ohlc, candles):
+        assert tuple(row) == chart._candle_row(candle), f"{tuple(row)} != {candle}"
+
+def test_live_ticks_mirrored():
+    """Test that tick updates, new candles and deque eviction reach the array"""
+    print("=== Testing OHLC Array With Live Ticks ===")
+
+    try:
+        rng = random.Random(2)
+        chart = LiveChartVisualizer("Test Chart", max_candles=20)
+        chart.add_instrument(NIFTY)
+
+        timestamp = datetime(2024, 1, 1, 9, 15)
+        for _ in range(600):
+            timestamp += timedelta(seconds=rng.randint(1, 30))
+            chart._update_candle_data(NIFTY, 24000 + rng.uniform(-50, 50), rng.randint(0, 10), timestamp)
+
+        assert len(chart.candle_data[NIFTY]) == 20, "Deque should be at max_candles"
+        _assert_mirrors(chart, NIFTY)
+        # Eviction slides a window over the buffer instead of copying rows each time
+        assert chart.get_candle_arrays(NIFTY).base is chart.ohlc_arr[NIFTY]
+
+        print(f"✅ {len(chart.candle_data[NIFTY])} candles mirrored after eviction")
+
+    except Exception as e:
+        print(f"❌ Live tick OHLC array test failed: {e}")
+        raise
+
+def test_stored_and_complete_candles_mirrored():
+    """Test that bulk intraday loads and complete OHLC candles reach the array"""
+    print("\n=== Testing OHLC Array With Stored Candles ===")
+
+    try:
+        chart = LiveChartVisualizer("Test Chart")
+        start = datetime(2024, 1, 1, 9, 15)
+        intraday = [{
+            'timestamp': start + timedelta(minutes=5 * i),
+            'open': 24000.0 + i, 'high': 24010.0 + i, 'low': 23990.0 + i, 'close': 24005.0 + i, 'volume': 100
+        } for i in range(30)]
+
+        # Newest-first, as the brokers return it
+        chart._store_intraday_data(NIFTY, intraday[::-1])
+        _assert_mirrors(chart, NIFTY)
+        assert chart.get_candle_arrays(NIFTY)['h'].max() == 24039.0
+
+        chart._add_complete_candle(NIFTY, {
+            'timestamp': start + timedelta(minutes=150),
+            'open': 24100.0, 'high': 24120.0, 'low': 24090.0, 'close': 24110.0, 'volume': 50
+        })
+        _assert_mirrors(chart, NIFTY)
+        assert chart.get_candle_arrays(NIFTY)['c'][-1] == 24110.0
+
+        print("✅ Stored and complete candles mirrored")
+
+    except Exception as e:
+        print(f"❌ Stored candle OHLC array test failed: {e}")
+        raise
+
+if __name__ == "__main__":
+    test_live_ticks_mirrored()
+    test_stored_and_complete_candles_mirrored()
+    print("\n✅ All OHLC array tests passed!")
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Test script for the cached payoff curve in StrategyManager.
+"""
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), 'code'))
+
+from datetime import datetime
+import strategy_manager as sm
+from strategy_manager import StrategyManager
+from trade_models import Trade, TradeLeg, OptionType, PositionType
+
+def _iron_condor(trade_id="IC-1", expiry="DEC"):
+    """Iron Condor around 25000 with 10 lots per leg"""
+    legs = []
+    for strike, option_type, position_type, price in [
+        (24700, OptionType.PUT, PositionType.LONG, 40.0),
+        (24800, OptionType.PUT, PositionType.SHORT, 63.0),
+        (25200, OptionType.CALL, PositionType.SHORT, 55.0),
+        (25300, OptionType.CALL, PositionType.LONG, 35.0),
+    ]:
+        suffix = "CE" if option_type == OptionType.CALL else "PE"
+        legs.append(TradeLeg(
+            instrument=f"NIFTY25{expiry}{strike}{suffix}",
+            instrument_name=f"NIFTY {strike} {suffix}",
+            option_type=option_type,
+            strike_price=strike,
+            position_type=position_type,
+            quantity=10,
+            entry_timestamp=datetime(2024, 1, 1, 10, 0),
+            entry_price=price
+        ))
+    return Trade(trade_id=trade_id, strategy_name="Iron Condor",
+                 underlying_instrument="NSE_INDEX|Nifty 50", legs=legs)
+
+def test_combined_payoff_is_cached():
+    """Test that an unchanged strategy reuses the cached curve across spot updates"""
+    print("=== Testing Cached Payoff Curve ===")
+
+    try:
+        manager = StrategyManager(db_path=":memory:")
+        sm._compute_payoff_curve.cache_clear()
+
+        first = manager.calculate_combined_trades_payoff([_iron_condor()], 25000.0)
+        # Same strikes under a different trade id and spot hit the cache
+        second = manager.calculate_combined_trades_payoff([_iron_condor("IC-2")], 25260.0)
+
+        info = sm._compute_payoff_curve.cache_info()
+        assert info.misses == 1 and info.hits == 1, f"Unexpected cache stats: {info}"
+        assert first["payoffs"] is second["payoffs"]
+        assert not first["payoffs"].flags.writeable, "Cached payoffs must be read-only"
+
+        # Net credit of 43 per lot inside the wings, 57 per lot lost beyond them
+        assert abs(first["max_profit"] - 430.0) < 1e-6
+        assert abs(first["max_loss"] + 570.0) < 1e-6
+        assert abs(first["current_payoff"] - 430.0) < 1e-6
+        assert abs(second["current_payoff"] + 170.0) < 1e-6
+        assert first["breakevens"] == [24760.0, 25250.0]
+        assert first["breakevens"] is not second["breakevens"]
+
+        print("✅ Cached payoff curve passed")
+
+    except Exception as e:
+        print(f"❌ Cached payoff curve test failed: {e}")
+        raise
+
+def test_calendar_spread_shares_price_range():
+    """Test that per-expiry curves of a calendar spread use one price range"""
+    print("\n=== Testing Calendar Spread Payoff ===")
+
+    try:
+        manager = StrategyManager(db_path=":memory:")
+        near, far = _iron_condor(expiry="OCT"), _iron_condor(expiry="DEC")
+        far.legs = far.legs[2:]
+
+        payoff_data = manager.calculate_combined_trades_payoff([near, far], 25000.0)
+
+        assert payoff_data["is_calendar_spread"]
+        assert payoff_data["nearest_expiry"] == "OCT"
+        assert len(payoff_data["price_range"]) == len(payoff_data["payoffs"])
+        assert payoff_data["price_range"][0] == 24700 - 1000
+
+        print("✅ Calendar spread payoff passed")
+
+    except Exception as e:
+        print(f"❌ Calendar spread payoff test failed: {e}")
+        raise
+
+if __name__ == "__main__":
+    test_combined_payoff_is_cached()
+    test_calendar_spread_shares_price_range()
+    print("\n✅ All payoff cache tests passed!")
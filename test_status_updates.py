@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Test script for thread-safe status updates in TkinterChartApp.
+"""
+
+import sys
+import os
+import logging
+import threading
+sys.path.append(os.path.join(os.path.dirname(__file__), 'code'))
+
+from chart_visualizer import TkinterChartApp
+
+class _Root:
+    """Stands in for the Tk root - after() callbacks run when the test drains them"""
+    def __init__(self):
+        self.callbacks = []
+
+    def after(self, delay, callback, *args):
+        self.callbacks.append((callback, args))
+
+    def run_pending(self):
+        callbacks, self.callbacks = self.callbacks, []
+        for callback, args in callbacks:
+            callback(*args)
+
+class _Label:
+    def __init__(self):
+        self.text = None
+        self.configs = 0
+
+    def config(self, text):
+        self.text = text
+        self.configs += 1
+
+def _make_app():
+    """App with only the attributes update_status uses - no display needed"""
+    app = TkinterChartApp.__new__(TkinterChartApp)
+    app.logger = logging.getLogger(__name__)
+    app.root = _Root()
+    app.status_label = _Label()
+    app._status_message = None
+    return app
+
+def test_worker_post_then_main_thread_update():
+    """Test that a queued worker message cannot leave the label stuck behind a newer one"""
+    print("=== Testing Status Updates Across Threads ===")
+
+    try:
+        app = _make_app()
+
+        worker = threading.Thread(target=app.update_status, args=("A",))
+        worker.start()
+        worker.join()
+        assert app.root.callbacks, "Worker update was not posted to the Tk loop"
+        assert app.status_label.text is None
+
+        # The Tk thread shows "B" before the queued "A" runs
+        app.update_status("B")
+        assert app.status_label.text == "Status: B"
+        app.root.run_pending()
+        assert app.status_label.text == "Status: A"
+
+        # "B" again must not be mistaken for a repeat
+        app.update_status("B")
+        assert app.status_label.text == "Status: B"
+
+        # A real repeat skips the Tk call
+        configs = app.status_label.configs
+        app.update_status("B")
+        assert app.status_label.configs == configs
+
+        print("✅ Status updates across threads passed")
+
+    except Exception as e:
+        print(f"❌ Status update test failed: {e}")
+        raise
+
+if __name__ == "__main__":
+    test_worker_post_then_main_thread_update()
+    print("\n✅ All status update tests passed!")
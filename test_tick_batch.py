@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Test script for batched tick draining in LiveChartVisualizer.
+"""
+
+import sys
+import os
+import random
+sys.path.append(os.path.join(os.path.dirname(__file__), 'code'))
+
+from chart_visualizer import LiveChartVisualizer
+from datetime import datetime, timedelta
+
+NIFTY = "NSE_INDEX|Nifty 50"
+
+def _make_ticks(count=500):
+    """Random queued ticks (instrument, timestamp, price, volume) a few seconds apart, spanning many 5-minute candles"""
+    rng = random.Random(1)
+    timestamp = datetime(2024, 1, 1, 9, 15)
+    ticks = []
+    for _ in range(count):
+        timestamp += timedelta(seconds=rng.randint(1, 30))
+        ticks.append((NIFTY, timestamp, 24000 + rng.uniform(-50, 50), rng.randint(0, 10)))
+    return ticks
+
+def test_batch_matches_per_tick_updates():
+    """Test that draining the queue in one batch builds the same candles as per-tick updates"""
+    print("=== Testing Batched Tick Drain ===")
+
+    try:
+        ticks = _make_ticks()
+
+        per_tick = LiveChartVisualizer("Test Chart", max_candles=500)
+        per_tick.add_instrument(NIFTY)
+        for instrument_key, timestamp, price, volume in ticks:
+            per_tick._update_candle_data(instrument_key, price, volume, timestamp)
+
+        batched = LiveChartVisualizer("Test Chart", max_candles=500)
+        batched.add_instrument(NIFTY)
+        batched.data_queue.extend(ticks)
+        # Ticks for an instrument that is not tracked are dropped
+        batched.data_queue.append(("UNKNOWN",) + ticks[-1][1:])
+        batched._animate(0)
+
+        assert not batched.data_queue, "Queue was not fully drained"
+        assert len(batched.candle_data[NIFTY]) > 1, "Expected several candles"
+        assert batched.get_candle_data(NIFTY) == per_tick.get_candle_data(NIFTY)
+
+        print(f"✅ {len(ticks)} ticks folded into {len(batched.candle_data[NIFTY])} candles")
+
+    except Exception as e:
+        print(f"❌ Batched tick drain test failed: {e}")
+        raise
+
+if __name__ == "__main__":
+    test_batch_matches_per_tick_updates()
+    print("\n✅ All tick batch tests passed!")
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Test script for per-instrument tick handler dispatch in LiveChartVisualizer.
+"""
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), 'code'))
+
+from chart_visualizer import LiveChartVisualizer
+
+NIFTY = "NSE_INDEX|Nifty 50"
+
+def test_explicit_format_dispatch():
+    """Test that add_instrument(tick_format=...) pins the handler"""
+    print("=== Testing Explicit Format Dispatch ===")
+
+    try:
+        chart = LiveChartVisualizer("Test Chart")
+        chart.add_instrument(NIFTY, "Nifty 50", tick_format='upstox_ohlc')
+        assert chart._handler[NIFTY] == chart._add_complete_candle
+
+        chart.update_data(NIFTY, {
+            'timestamp': '2024-01-01T10:00:00',
+            'open': 24000.0, 'high': 24010.0, 'low': 23990.0, 'close': 24005.0, 'volume': 1000
+        })
+        assert len(chart.candle_data[NIFTY]) == 1, "OHLC candle was not stored"
+        assert chart.current_prices[NIFTY] == 24005.0
+
+        chart.add_instrument("KITE", tick_format='kite')
+        chart.update_data("KITE", [
+            {'instrument_token': "KITE", 'last_price': 101.5, 'volume': 10},
+            {'instrument_token': "OTHER", 'last_price': 999.0, 'volume': 10},
+        ])
+        assert chart.current_prices["KITE"] == 101.5
+        assert len(chart.data_queue) == 1, "Tick for another instrument was queued"
+
+        # A batch with several ticks for the instrument queues all of them, the last sets the price
+        chart.update_data("KITE", [
+            {'instrument_token': "KITE", 'last_price': 101.0, 'volume': 5},
+            {'instrument_token': "OTHER", 'last_price': 999.0, 'volume': 10},
+            {'instrument_token': "KITE", 'last_price': 102.0, 'volume': 7},
+        ])
+        assert [tick[2:] for tick in list(chart.data_queue)[1:]] == [(101.0, 5), (102.0, 7)]
+        assert chart.current_prices["KITE"] == 102.0
+
+        try:
+            chart.add_instrument("BAD", tick_format='bogus')
+            assert False, "Unknown format should be rejected"
+        except ValueError:
+            pass
+
+        print("✅ Explicit format dispatch passed")
+
+    except Exception as e:
+        print(f"❌ Explicit format dispatch test failed: {e}")
+        raise
+
+def test_auto_resolved_dispatch():
+    """Test that the handler is resolved once from the first tick"""
+    print("\n=== Testing Auto-Resolved Dispatch ===")
+
+    try:
+        chart = LiveChartVisualizer("Test Chart")
+
+        # No add_instrument call and mixed OHLC / price ticks on the same key
+        chart.update_data(NIFTY, {
+            'timestamp': '2024-01-01T10:00:00',
+            'open': 24000.0, 'high': 24010.0, 'low': 23990.0, 'close': 24005.0, 'volume': 1000
+        })
+        assert chart._handler[NIFTY] == chart._process_upstox_tick
+        assert len(chart.candle_data[NIFTY]) == 1
+
+        chart.update_data(NIFTY, {'price': 24050.5, 'volume': 1500})
+        assert chart.current_prices[NIFTY] == 24050.5
+        assert len(chart.data_queue) == 1
+
+        print("✅ Auto-resolved dispatch passed")
+
+    except Exception as e:
+        print(f"❌ Auto-resolved dispatch test failed: {e}")
+        raise
+
+class _LtpMessage:
+    """Stand-in for a Protobuf message with top-level ltp / volume fields"""
+    def __init__(self, ltp, volume):
+        self.ltp = ltp
+        self.volume = volume
+
+    def __str__(self):
+        return f"ltp: {self.ltp}\nvolume: {self.volume}"
+
+class _FeedMessage:
+    """Stand-in for a nested feed message that only exposes its text form"""
+    def __str__(self):
+        return 'feeds { key: "NSE_INDEX|Nifty 50" value { ltpc { ltp: 24123.5 cp: 24000 } } } vol: 12'
+
+def test_upstox_message_parsing():
+    """Test that feed messages are read via attributes when possible, text otherwise"""
+    print("\n=== Testing Upstox Message Parsing ===")
+
+    try:
+        chart = LiveChartVisualizer("Test Chart")
+
+        assert chart._parse_upstox_message(_LtpMessage(24100.25, 7)) == (24100.25, 7)
+        assert chart._message_fields[_LtpMessage] == ('ltp', 'volume')
+
+        assert chart._parse_upstox_message(_FeedMessage()) == (24123.5, 12)
+        assert chart._message_fields[_FeedMessage] == (None, None)
+
+        print("✅ Upstox message parsing passed")
+
+    except Exception as e:
+        print(f"❌ Upstox message parsing test failed: {e}")
+        raise
+
+if __name__ == "__main__":
+    test_explicit_format_dispatch()
+    test_auto_resolved_dispatch()
+    test_upstox_message_parsing()
+    print("\n✅ All tick dispatch tests passed!")